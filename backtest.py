@@ -0,0 +1,269 @@
+import argparse
+import gzip
+import json
+import random
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+from main import (
+    COIN_UNIT_PLACES,
+    JOURNAL_SEGMENT_PATTERN,
+    SUPPORTED_PRESETS,
+    ConfigError,
+    DiceBot,
+    build_offline_bot,
+    coin_units,
+    format_signed_units,
+    format_units,
+    load_config,
+    parse_roll_value,
+    to_decimal,
+)
+
+# Backtest: putar ulang result_value yang sudah tercatat (jurnal bet atau file export) lewat preset/strategi apa pun.
+# Roll dice tidak bergantung amount, jadi P&L-nya persis yang akan didapat strategi lain pada roll yang sama.
+# Input dibaca baris per baris lewat generator, jadi histori jutaan bet tetap jalan dengan memori konstan.
+# Jalankan: python backtest.py --preset mining_v2 --balance 1
+#           python backtest.py rolls.txt --preset all --balance 1
+
+STOP_INSUFFICIENT = "Current amount melebihi current balance"
+STOP_STRATEGY = "Strategi error"
+STOP_END = "Data roll habis"
+STOP_BET_LIMIT = "Batas --bets tercapai"
+
+
+def journal_segments(path: str) -> List[Path]:
+    # Segmen rotasi (urut waktu) lalu file aktif. Segmen yang belum selesai dikompres bisa ada dalam dua
+    # bentuk sekaligus; yang tidak terkompres dipakai supaya roll tidak terbaca dua kali.
+    active = Path(path)
+    segments: Dict[Tuple[str, int], Path] = {}
+    for candidate in active.parent.glob(f"{active.stem}.*{active.suffix}*"):
+        name = candidate.name
+        if name.endswith((".gz", ".xz")):
+            name = name[:-3]
+        if not name.endswith(active.suffix):
+            continue
+        match = JOURNAL_SEGMENT_PATTERN.search(name[: -len(active.suffix)] if active.suffix else name)
+        if match is None:
+            continue
+        key = (match.group(1), int(match.group(2)))
+        if key not in segments or candidate.name == name:
+            segments[key] = candidate
+    ordered = [segments[key] for key in sorted(segments)]
+    if active.exists():
+        ordered.append(active)
+    return ordered
+
+
+def open_text(path: Path) -> Any:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.suffix == ".xz":
+        if lzma is None:
+            raise ConfigError(f"{path.name} butuh modul lzma yang tidak ada di Python ini.")
+        return lzma.open(path, "rt", encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def iter_rolls(paths: Iterable[Path]) -> Iterator[int]:
+    # Baris JSON (jurnal bet) diambil field result_value; baris teks/CSV diambil kolom pertama.
+    for path in paths:
+        try:
+            with open_text(path) as handle:
+                for line in handle:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    if line.startswith("{"):
+                        try:
+                            text = str(json.loads(line).get("result_value", ""))
+                        except ValueError:
+                            # Baris terakhir bisa terpotong kalau bot mati di tengah write.
+                            continue
+                    else:
+                        text = re.split(r"[,;\s]", line, 1)[0]
+                    roll = parse_roll_value(text)
+                    if roll is not None:
+                        yield roll
+        except OSError as exc:
+            raise ConfigError(f"File roll tidak bisa dibaca ({path}): {exc}") from exc
+
+
+def build_backtest_bot(cfg: Dict[str, Any], preset: str | None) -> DiceBot:
+    cfg = json.loads(json.dumps(cfg))
+    cfg["journal"]["enabled"] = "OFF"
+    cfg["checkpoint"]["enabled"] = "OFF"
+    cfg["shadow"] = {"strategies": []}
+    return build_offline_bot(cfg, preset)
+
+
+class BacktestResult:
+    def __init__(self, label: str, start_balance: int) -> None:
+        self.label = label
+        self.start_balance = start_balance
+        self.balance = start_balance
+        self.bets = 0
+        self.wins = 0
+        self.wagered = 0
+        self.peak_balance = start_balance
+        self.max_drawdown = 0
+        self.longest_loss_streak = 0
+        self.sessions = 0
+        self.stops: Counter = Counter()
+        self.elapsed = 0.0
+
+
+def run_backtest(
+    bot: DiceBot, rolls: Iterator[int], start_balance: int, max_sessions: int, max_bets: int, label: str
+) -> BacktestResult:
+    # Tiap sesi memakai jalur DiceBot asli: stop_reason sebelum bet, apply_strategy setelah bet. Sesi baru
+    # langsung mulai di roll berikutnya (tanpa jeda replay) dengan balance akhir sesi sebelumnya.
+    result = BacktestResult(label, start_balance)
+    started = time.perf_counter()
+    exhausted = False
+    limited = False
+    try:
+        while max_sessions <= 0 or result.sessions < max_sessions:
+            bot._reset_session_runtime()
+            bot.start_balance = result.balance
+            bot.current_balance = bot.api_balance = bot.estimated_balance = result.balance
+            bot._init_premium_targets()
+            reason = ""
+            while True:
+                bot.current_amount = bot._normalize_amount(bot.current_amount)
+                stop = bot.stop_reason()
+                if stop:
+                    reason = stop
+                    break
+                if bot.current_amount > bot.current_balance:
+                    reason = STOP_INSUFFICIENT
+                    break
+                if max_bets > 0 and result.bets >= max_bets:
+                    limited = True
+                    break
+                roll = next(rolls, None)
+                if roll is None:
+                    exhausted = True
+                    break
+
+                amount = bot.current_amount
+                won = bot.replay_roll(roll)
+                result.bets += 1
+                result.wins += int(won)
+                result.wagered += amount
+                balance = bot.current_balance
+                if balance > result.peak_balance:
+                    result.peak_balance = balance
+                elif result.peak_balance - balance > result.max_drawdown:
+                    result.max_drawdown = result.peak_balance - balance
+                if bot.consecutive_losses > result.longest_loss_streak:
+                    result.longest_loss_streak = bot.consecutive_losses
+                try:
+                    bot.apply_strategy("win" if won else "loss")
+                except ConfigError:
+                    reason = STOP_STRATEGY
+                    break
+
+            result.balance = bot.current_balance
+            if limited or exhausted:
+                # Akhir backtest: batas --bets dibedakan dari data roll yang benar-benar habis.
+                if bot.bet_count > 0:
+                    result.sessions += 1
+                result.stops[STOP_BET_LIMIT if limited else STOP_END] += 1
+                break
+            result.stops[reason] += 1
+            if bot.bet_count == 0:
+                # Sesi berhenti sebelum bet pertama (mis. balance kurang): sesi berikutnya pasti sama.
+                break
+            result.sessions += 1
+    except KeyboardInterrupt:
+        result.stops["Dihentikan user (Ctrl+C)"] += 1
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def print_result(result: BacktestResult, currency: str) -> None:
+    # Presisi penuh 8 digit: payout bisa punya digit di bawah coin_decimal_places, P&L backtest harus persis.
+    places = COIN_UNIT_PLACES
+    speed = result.bets / result.elapsed if result.elapsed > 0 else 0.0
+    win_rate = result.wins / result.bets * 100 if result.bets else 0.0
+    print("-" * 95)
+    print(f"PRESET {result.label} | bets={result.bets} sesi={result.sessions} ({speed:,.0f} bet/s)")
+    print(f"Win rate              : {win_rate:.2f}%")
+    print(
+        f"Balance               : {format_units(result.start_balance, places)} -> "
+        f"{format_units(result.balance, places)} {currency}"
+    )
+    print(f"Profit                : {format_signed_units(result.balance - result.start_balance, places)} {currency}")
+    print(f"Wagered               : {format_units(result.wagered, places)} {currency}")
+    print(f"Max drawdown          : {format_units(result.max_drawdown, places)} {currency}")
+    print(f"Loss streak terpanjang: {result.longest_loss_streak}x")
+    for reason, count in result.stops.most_common():
+        print(f"  stop {count:>7}x : {reason}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Backtest strategi DiceBot pada result_value yang sudah tercatat.")
+    parser.add_argument(
+        "files", nargs="*",
+        help="File roll (JSONL jurnal / teks / CSV, boleh .gz/.xz). Kosong = jurnal dari config + segmen rotasinya.",
+    )
+    parser.add_argument("--config", default="config.json")
+    parser.add_argument("--journal", default=None, help="Path jurnal aktif (default journal.path di config).")
+    parser.add_argument("--preset", default="config", help="config | all | custom | nama preset (boleh dipisah koma).")
+    parser.add_argument("--balance", default="1", help="Saldo awal backtest.")
+    parser.add_argument("--sessions", type=int, default=0, help="Batas jumlah sesi (0 = sampai roll habis).")
+    parser.add_argument("--bets", type=int, default=0, help="Batas total bet (0 = sampai roll habis).")
+    parser.add_argument("--seed", type=int, default=7, help="Seed untuk hilo_random / chance_random.")
+    args = parser.parse_args()
+
+    try:
+        cfg = load_config(args.config, paper=True)
+        if args.files:
+            paths = [Path(name) for name in args.files]
+            missing = [str(path) for path in paths if not path.exists()]
+            if missing:
+                raise ConfigError(f"File tidak ditemukan: {', '.join(missing)}")
+        else:
+            paths = journal_segments(args.journal or str(cfg["journal"]["path"]))
+            if not paths:
+                raise ConfigError("Jurnal bet tidak ditemukan. Isi file roll atau --journal.")
+        if args.preset == "all":
+            presets: Tuple[str | None, ...] = SUPPORTED_PRESETS + ("custom",)
+        elif args.preset == "config":
+            presets = (None,)
+        else:
+            presets = tuple(name.strip() for name in args.preset.split(",") if name.strip())
+            unknown = [name for name in presets if name not in SUPPORTED_PRESETS and name != "custom"]
+            if unknown:
+                raise ConfigError(f"Preset tidak dikenal: {', '.join(unknown)}")
+        balance = to_decimal(args.balance, "--balance")
+        if not balance.is_finite() or coin_units(balance) <= 0:
+            raise ConfigError("Saldo awal backtest harus > 0.")
+        start_balance = coin_units(balance)
+
+        print(f"Input: {len(paths)} file | {', '.join(path.name for path in paths[:3])}{' ...' if len(paths) > 3 else ''}")
+        for preset in presets:
+            random.seed(args.seed)
+            bot = build_backtest_bot(cfg, preset)
+            label = bot.preset_name if bot.preset_enabled else "custom"
+            result = run_backtest(bot, iter_rolls(paths), start_balance, args.sessions, args.bets, label)
+            print_result(result, bot.currency_display)
+            if "Dihentikan user (Ctrl+C)" in result.stops:
+                break
+    except ConfigError as exc:
+        print(f"[CONFIG] {exc}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import argparse
+import functools
+import random
+import time
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Callable, List, Tuple
+
+from main import (
+    COIN_UNIT_PLACES,
+    StepLadderStrategy,
+    coin_units,
+    coin_units_ceil,
+    format_decimal,
+    format_signed_units,
+    format_units,
+    normalize_coin_amount,
+    normalize_coin_units,
+    to_decimal,
+    units_to_decimal,
+)
+
+# Micro-benchmark hitungan uang per bet: jalur Decimal lama vs integer satuan 1e-8.
+# Tiap bet: parse profit API, update total/balance, amount berikutnya, cek stop, format kolom log.
+# Jalankan: python bench_money.py --bets 200000
+
+MULTIPLIER = Decimal("1.98")
+BASE_AMOUNT = Decimal("0.00001")
+START_BALANCE = Decimal("5")
+TARGET_PROFIT = Decimal("0.5")
+STOP_LOSS = Decimal("2")
+MAX_AMOUNT = Decimal("1")
+LADDER = dict(
+    loss_multiplier=Decimal("1.03"),
+    max_steps=6,
+    recovery_steps_on_win=3,
+    max_scale=Decimal("1.5"),
+)
+
+
+def make_outcomes(bets: int, seed: int) -> List[bool]:
+    rng = random.Random(seed)
+    return [rng.random() < 0.49 for _ in range(bets)]
+
+
+@functools.lru_cache(maxsize=None)
+def api_profit(amount: Decimal, won: bool) -> str:
+    # Teks profit seperti respons API; di-cache supaya biaya ini tidak ikut terukur.
+    if won:
+        return format_decimal(amount * (MULTIPLIER - 1), COIN_UNIT_PLACES)
+    return f"-{format_decimal(amount, COIN_UNIT_PLACES)}"
+
+
+def signed_decimal(value: Decimal, places: int) -> str:
+    # Salinan DiceBot._signed_decimal sebelum amount disimpan sebagai integer.
+    sign = "+" if value >= 0 else "-"
+    amount = value.copy_abs()
+    if places <= 0:
+        rounded = amount.quantize(Decimal("1"), rounding=ROUND_HALF_UP)
+        if rounded == 0 and amount > 0:
+            rounded = Decimal("1")
+        return f"{sign}{format_decimal(rounded, 0)}"
+
+    step = Decimal("1").scaleb(-places)
+    rounded = amount.quantize(step, rounding=ROUND_HALF_UP)
+    if rounded == 0 and amount > 0:
+        rounded = step
+    return f"{sign}{format_decimal(rounded, places)}"
+
+
+def decimal_path(outcomes: List[bool], preset: str, places: int, render: bool) -> Tuple[str, ...]:
+    base = normalize_coin_amount(BASE_AMOUNT, places)
+    scales = [min(LADDER["loss_multiplier"] ** step, LADDER["max_scale"]) for step in range(LADDER["max_steps"] + 1)]
+    ladder = [normalize_coin_amount(base * scale, places) for scale in scales]
+    amount = base
+    step = 0
+    total_profit = Decimal("0")
+    balance = START_BALANCE
+    line: Tuple[str, ...] = ()
+    for won in outcomes:
+        amount = normalize_coin_amount(amount, places)
+        if total_profit >= TARGET_PROFIT or total_profit <= -STOP_LOSS or amount > MAX_AMOUNT or amount > balance:
+            amount = base
+            total_profit = Decimal("0")
+            balance = START_BALANCE
+        profit = to_decimal(api_profit(amount, won), "bet.profit")
+        total_profit += profit
+        balance += profit
+        if render:
+            line = (
+                format_decimal(amount, places),
+                signed_decimal(profit, places),
+                signed_decimal(total_profit, places),
+                format_decimal(balance, places),
+            )
+        if preset == "martingale":
+            amount = base if won else normalize_coin_amount(amount * MULTIPLIER, places)
+        else:
+            step = max(0, step - LADDER["recovery_steps_on_win"]) if won else min(LADDER["max_steps"], step + 1)
+            amount = ladder[step]
+    return line + (format_decimal(total_profit, COIN_UNIT_PLACES), format_decimal(balance, COIN_UNIT_PLACES))
+
+
+def units_path(outcomes: List[bool], preset: str, places: int, render: bool) -> Tuple[str, ...]:
+    # Logika strategi ditulis inline seperti decimal_path supaya yang terukur hanya aritmetikanya.
+    base = coin_units(normalize_coin_amount(BASE_AMOUNT, places))
+    ladder = StepLadderStrategy(base, places, **LADDER).ladder
+    multiplier_num, multiplier_den = MULTIPLIER.as_integer_ratio()
+    step = 0
+    target_units = coin_units_ceil(TARGET_PROFIT)
+    stop_loss_units = -coin_units_ceil(STOP_LOSS)
+    max_amount_units = coin_units(MAX_AMOUNT)
+    start_units = coin_units(START_BALANCE)
+    amount = base
+    total_profit = 0
+    balance = start_units
+    line: Tuple[str, ...] = ()
+    for won in outcomes:
+        amount = normalize_coin_units(amount, places)
+        if total_profit >= target_units or total_profit <= stop_loss_units or amount > max_amount_units or amount > balance:
+            amount = base
+            total_profit = 0
+            balance = start_units
+        # units_to_decimal di sini = konversi yang sama dengan payload place_dice_bet.
+        profit = coin_units(to_decimal(api_profit(units_to_decimal(amount), won), "bet.profit"))
+        total_profit += profit
+        balance += profit
+        if render:
+            line = (
+                format_units(amount, places),
+                format_signed_units(profit, places),
+                format_signed_units(total_profit, places),
+                format_units(balance, places),
+            )
+        if preset == "martingale":
+            amount = base if won else normalize_coin_units(amount * multiplier_num, places, multiplier_den)
+        else:
+            step = max(0, step - LADDER["recovery_steps_on_win"]) if won else min(LADDER["max_steps"], step + 1)
+            amount = ladder[step]
+    return line + (format_units(total_profit, COIN_UNIT_PLACES), format_units(balance, COIN_UNIT_PLACES))
+
+
+def best_of(func: Callable[[], Tuple[str, ...]], repeat: int) -> Tuple[float, Tuple[str, ...]]:
+    best = float("inf")
+    result: Tuple[str, ...] = ()
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Micro-benchmark hitungan amount/profit per bet: Decimal vs integer.")
+    parser.add_argument("--bets", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--places", type=int, default=8, help="display.coin_decimal_places (0-8).")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    outcomes = make_outcomes(args.bets, args.seed)
+    print(f"Bet per run: {args.bets} | coin digits: {args.places} | best of {args.repeat}")
+    for preset in ("martingale", "ladder"):
+        for render in (False, True):
+            label = f"{preset:<10} {'math+log' if render else 'math':<8}"
+            old_time, old_result = best_of(lambda: decimal_path(outcomes, preset, args.places, render), args.repeat)
+            new_time, new_result = best_of(lambda: units_path(outcomes, preset, args.places, render), args.repeat)
+            same = "sama" if old_result == new_result else "BEDA"
+            print(
+                f"{label}: Decimal {old_time / args.bets * 1e6:6.2f}us/bet | "
+                f"integer {new_time / args.bets * 1e6:6.2f}us/bet | "
+                f"x{old_time / new_time:4.2f} | hasil {same}"
+            )
+
+
+if __name__ == "__main__":
+    main()
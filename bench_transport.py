@@ -0,0 +1,92 @@
+import argparse
+import socket
+import subprocess
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import List
+
+from main import SUPPORTED_TRANSPORTS, ConfigError, WolfbetClient, default_config
+
+# Benchmark overhead per call tiap backend api.transport terhadap mock_server.py lokal.
+# Server jalan di proses terpisah, jadi CPU yang terukur hanya milik client.
+# Jalankan: python bench_transport.py --calls 2000
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def start_server(port: int, latency_ms: float) -> subprocess.Popen:
+    script = Path(__file__).with_name("mock_server.py")
+    process = subprocess.Popen(
+        [sys.executable, str(script), "--port", str(port), "--balance", "1000000", "--latency-ms", str(latency_ms)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return process
+        except OSError:
+            time.sleep(0.05)
+    process.terminate()
+    raise RuntimeError("mock_server.py tidak bisa dijalankan.")
+
+
+def bench_backend(name: str, port: int, calls: int) -> str:
+    cfg = default_config()
+    cfg["api"]["base_url"] = f"http://127.0.0.1:{port}/api/v1"
+    cfg["api"]["token"] = f"bench-{name}"
+    cfg["api"]["transport"] = name
+    try:
+        client = WolfbetClient(cfg)
+    except ConfigError as exc:
+        return f"{name:<12}: dilewati ({exc})"
+
+    multiplier = Decimal("1.98")
+    bet_value = Decimal("50")
+    client.get_balances()
+    client.place_dice_bet("trx", 1, "under", multiplier, bet_value)
+    rtts: List[float] = []
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+    for _ in range(calls):
+        client.place_dice_bet("trx", 1, "under", multiplier, bet_value)
+        rtts.append(client.last_rtt_seconds)
+    wall = time.perf_counter() - wall_started
+    cpu = time.process_time() - cpu_started
+    client.transport.close()
+    rtts.sort()
+    return (
+        f"{name:<12}: {calls / wall:7.1f} call/s | CPU client {cpu / calls * 1e6:7.0f}us/call | "
+        f"RTT p50 {rtts[len(rtts) // 2] * 1000:6.2f}ms p99 {rtts[int(len(rtts) * 0.99)] * 1000:6.2f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bandingkan overhead per call backend api.transport.")
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latency buatan di mock_server.py.")
+    parser.add_argument(
+        "--backends", default=",".join(SUPPORTED_TRANSPORTS), help="Daftar backend dipisah koma."
+    )
+    args = parser.parse_args()
+
+    port = free_port()
+    server = start_server(port, args.latency_ms)
+    try:
+        print(f"mock_server.py di port {port} | {args.calls} call place_dice_bet per backend")
+        for name in args.backends.split(","):
+            print(bench_backend(name.strip(), port, args.calls))
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,28 @@
+import argparse
+import functools
+import gzip
+import hashlib
+import hmac
+import http.client
 import json
+import math
 import os
 import random
+import re
+import select
 import shutil
+import signal
+import socket
+import ssl
 import sys
+import threading
 import time
+from array import array
 from datetime import datetime
-from decimal import Decimal, InvalidOperation, ROUND_DOWN, ROUND_HALF_UP
+from decimal import Decimal, InvalidOperation, ROUND_CEILING, ROUND_DOWN, ROUND_HALF_UP
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, Tuple
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Tuple
+from urllib.parse import urlsplit
 
 try:
     import requests
@@ -17,6 +32,24 @@ except ImportError as exc:
     print("Install dulu: pip install -r requirements.txt")
     sys.exit(1)
 
+try:
+    import httpx
+except ImportError:
+    # Opsional, hanya untuk api.transport=http2.
+    httpx = None
+
+try:
+    import lzma
+except ImportError:
+    # Sebagian build Python (misal Termux lama) tanpa liblzma; journal.compress=lzma jadi tidak tersedia.
+    lzma = None
+
+try:
+    import numpy as np
+except ImportError:
+    # Opsional, hanya untuk risk of ruin eksak (display.risk_of_ruin) dan simulator.py.
+    np = None
+
 
 class ConfigError(Exception):
     pass
@@ -54,6 +87,25 @@ COINGECKO_IDS = {
     "matic": "matic-network",
     "optim": "optimism",
 }
+LADDER_PREVIEW_STEPS = 8
+LOSS_STREAK_SCAN_LIMIT = 10000
+IDR_MIN_REFRESH_SECONDS = 5
+IDR_FIRST_PRICE_WAIT_SECONDS = 8
+CHANCE_GRID_MAX_POINTS = 20000
+PAIR_SYNC_CACHE_SIZE = 512
+JOURNAL_FSYNC_POLICIES = ("always", "interval", "off")
+JOURNAL_COMPRESSIONS = ("off", "zlib", "lzma")
+# Nama segmen hasil rotasi BetJournal: <stem>.<YYYYmmdd-HHMMSS>.<urutan><suffix>[.gz|.xz]
+JOURNAL_SEGMENT_PATTERN = re.compile(r"\.(\d{8}-\d{6})\.(\d+)$")
+API_MODES = ("live", "paper")
+RUIN_HORIZON_BETS = 10000
+RUIN_MAX_CELLS = 2_000_000
+RUIN_TIME_BUDGET_SECONDS = 1.5
+RUIN_MASS_EPSILON = 1e-12
+# Di bawah porsi horizon ini (dan massa peluang masih jalan) angka eksak tidak mewakili sesi, jadi tidak ditampilkan.
+RUIN_MIN_EXACT_FRACTION = 0.1
+RUIN_REASONS = ("profit_stop", "stop_loss", "bust", "lainnya")
+SHADOW_MAX_STRATEGIES = 8
 
 
 def default_config() -> Dict[str, Any]:
@@ -64,6 +116,16 @@ def default_config() -> Dict[str, Any]:
             "timeout_seconds": 20,
             "retry_count": 3,
             "rate_limit_wait_seconds": 60,
+            "rate_limit_window_seconds": 60,
+            "rate_limit_burst": 3,
+            "transport": "requests",
+            "keepalive_idle_seconds": 45,
+            "mode": "live",
+        },
+        "paper": {
+            "balance": 100,
+            "seed": "",
+            "realtime": "OFF",
         },
         "simple": {
             "enabled": "OFF",
@@ -86,6 +148,8 @@ def default_config() -> Dict[str, Any]:
             "balance_stop": 0,
             "profit_stop": 0,
             "stop_loss": 0,
+            "drawdown_stop": 0,
+            "drawdown_stop_percent": 0,
             "max_bets": 0,
             "bet_interval_ms": 1000,
             "replay_on_take_profit": "OFF",
@@ -111,6 +175,8 @@ def default_config() -> Dict[str, Any]:
             "max_bets": 0,
             "target_profit": 0,
             "stop_loss": 0,
+            "trailing_drawdown_stop": 0,
+            "trailing_drawdown_percent": 0,
             "stop_on_balance_below": 0,
             "max_amount": 0,
             "max_consecutive_losses": 0,
@@ -211,11 +277,31 @@ def default_config() -> Dict[str, Any]:
             "balance_display_precision": 8,
             "coin_decimal_places": 8,
             "sticky_stats_footer": "ON",
+            "latency_footer": "OFF",
+            "risk_of_ruin": "ON",
+            "rolling_window": 500,
+            "footer_fps": 10,
             "balance_sync_mode": "hybrid",
             "balance_refresh_every": 20,
             "show_idr_value": "OFF",
             "idr_refresh_seconds": 30,
         },
+        "journal": {
+            "enabled": "ON",
+            "path": "journal/bets.jsonl",
+            "rotate_mb": 16,
+            "fsync": "interval",
+            "flush_interval_seconds": 1.0,
+            "compress": "zlib",
+        },
+        "checkpoint": {
+            "enabled": "ON",
+            "path": "journal/checkpoint.json",
+            "fsync": "OFF",
+        },
+        "shadow": {
+            "strategies": [],
+        },
     }
 
 
@@ -467,6 +553,10 @@ def apply_simple_settings(cfg: Dict[str, Any]) -> None:
     bot_cfg["stop_on_balance_below"] = float(to_decimal(simple_cfg.get("balance_stop", 0), "simple.balance_stop"))
     bot_cfg["target_profit"] = float(to_decimal(simple_cfg.get("profit_stop", 0), "simple.profit_stop"))
     bot_cfg["stop_loss"] = float(to_decimal(simple_cfg.get("stop_loss", 0), "simple.stop_loss"))
+    bot_cfg["trailing_drawdown_stop"] = float(to_decimal(simple_cfg.get("drawdown_stop", 0), "simple.drawdown_stop"))
+    bot_cfg["trailing_drawdown_percent"] = float(
+        to_decimal(simple_cfg.get("drawdown_stop_percent", 0), "simple.drawdown_stop_percent")
+    )
     bot_cfg["max_bets"] = int(simple_cfg.get("max_bets", 0))
     bot_cfg["save_synced_pair_to_config"] = "ON"
     bot_cfg["last_synced_multiplier"] = float(multiplier)
@@ -566,7 +656,8 @@ def resolve_selected_preset(preset_cfg: Dict[str, Any], field_prefix: str = "str
 def format_decimal(value: Decimal, places: int = 10) -> str:
     quant = Decimal("1." + ("0" * places))
     text = format(value.quantize(quant, rounding=ROUND_DOWN), "f")
-    text = text.rstrip("0").rstrip(".")
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
     return text if text else "0"
 
 
@@ -580,6 +671,118 @@ def quantize_places_half_up(value: Decimal, places: int) -> Decimal:
     return value.quantize(step, rounding=ROUND_HALF_UP)
 
 
+def normalize_coin_amount(amount: Decimal, places: int) -> Decimal:
+    normalized = quantize_places(amount, places)
+    if amount > 0 and normalized <= 0:
+        return Decimal("1").scaleb(-places)
+    return normalized
+
+
+# Amount, profit, dan balance di DiceBot disimpan sebagai integer satuan 1e-8 (skala API);
+# Decimal hanya dipakai saat baca API/config dan saat tampil.
+COIN_UNIT_PLACES = 8
+COIN_UNIT = 10 ** COIN_UNIT_PLACES
+COIN_GRID_UNITS = tuple(10 ** (COIN_UNIT_PLACES - places) for places in range(COIN_UNIT_PLACES + 1))
+
+
+def coin_units(value: Decimal) -> int:
+    # Sama seperti quantize_places(value, 8) dengan ROUND_DOWN (int() memotong ke arah nol).
+    return int(value.scaleb(COIN_UNIT_PLACES))
+
+
+def coin_units_ceil(value: Decimal) -> int:
+    return int(value.scaleb(COIN_UNIT_PLACES).to_integral_value(rounding=ROUND_CEILING))
+
+
+def units_to_decimal(units: int) -> Decimal:
+    return Decimal(units).scaleb(-COIN_UNIT_PLACES)
+
+
+def normalize_coin_units(numerator: int, places: int, denominator: int = 1) -> int:
+    # Versi integer dari normalize_coin_amount untuk nilai eksak numerator/denominator satuan.
+    step = COIN_GRID_UNITS[places]
+    if numerator <= 0:
+        return -((-numerator // denominator) // step * step)
+    units = numerator // denominator
+    units -= units % step
+    return units if units > 0 else step
+
+
+def format_units(units: int, places: int) -> str:
+    # Hasil sama dengan format_decimal(units_to_decimal(units), places) untuk places 0-8.
+    sign = "-" if units < 0 else ""
+    whole, fraction = divmod(-units if units < 0 else units, COIN_UNIT)
+    fraction -= fraction % COIN_GRID_UNITS[places]
+    if fraction:
+        return f"{sign}{whole}.{fraction:08d}".rstrip("0")
+    return f"{sign}{whole}"
+
+
+def format_signed_units(units: int, places: int) -> str:
+    # ROUND_HALF_UP ke places; nilai bukan nol tidak pernah tampil sebagai 0.
+    sign = "+" if units >= 0 else "-"
+    magnitude = -units if units < 0 else units
+    places = max(0, places)
+    step = COIN_GRID_UNITS[places]
+    whole, remainder = divmod(magnitude, step)
+    if remainder * 2 >= step:
+        whole += 1
+    if whole == 0 and magnitude > 0:
+        whole = 1
+    return f"{sign}{format_units(whole * step, places)}"
+
+
+def multiplier_for_bet_value(bet_value: Decimal, rule: str, multiplier_precision: int) -> Decimal:
+    chance = bet_value if rule == "under" else Decimal("99.99") - bet_value
+    if chance <= Decimal("0"):
+        raise ConfigError("Chance hasil kalkulasi <= 0. Ubah bot.bet_value / bot.rule.")
+    raw_multiplier = Decimal("99") / chance
+    return quantize_places_half_up(raw_multiplier, multiplier_precision)
+
+
+def bet_value_for_multiplier(multiplier: Decimal, rule: str, bet_value_precision: int) -> Decimal:
+    if multiplier <= Decimal("1"):
+        raise ConfigError("Multiplier harus > 1 untuk hitung bet_value.")
+
+    chance = Decimal("99") / multiplier
+    chance = quantize_places_half_up(chance, bet_value_precision)
+    if rule == "under":
+        bet_value = chance
+    else:
+        bet_value = Decimal("99.99") - chance
+
+    bet_value = quantize_places_half_up(bet_value, bet_value_precision)
+    if bet_value <= Decimal("0") or bet_value >= Decimal("99.99"):
+        raise ConfigError("Hasil bet_value dari multiplier di luar batas valid (0 - 99.99).")
+    return bet_value
+
+
+@functools.lru_cache(maxsize=PAIR_SYNC_CACHE_SIZE)
+def synced_bet_pair(
+    rule: str,
+    bet_value: Decimal,
+    multiplier: Decimal,
+    bet_value_precision: int,
+    multiplier_precision: int,
+    sync_mode: str,
+) -> Tuple[Decimal, Decimal]:
+    # Pair biasanya sama dari bet ke bet, jadi hasil sinkronisasi di-cache (ConfigError tidak ikut di-cache).
+    bet_value = quantize_places_half_up(bet_value, bet_value_precision)
+    if bet_value <= Decimal("0") or bet_value >= Decimal("99.99"):
+        raise ConfigError("bot.bet_value harus > 0 dan < 99.99.")
+
+    multiplier = quantize_places_half_up(multiplier, multiplier_precision)
+    if sync_mode == "lock_bet_value":
+        multiplier = multiplier_for_bet_value(bet_value, rule, multiplier_precision)
+        # Sync balik bet_value dari multiplier agar akurat 100% di mata API
+        bet_value = bet_value_for_multiplier(multiplier, rule, bet_value_precision)
+    elif sync_mode == "lock_multiplier":
+        bet_value = bet_value_for_multiplier(multiplier, rule, bet_value_precision)
+        # Paksa update multiplier agar sesuai dengan bet_value yang baru dihitung (grid chance)
+        multiplier = multiplier_for_bet_value(bet_value, rule, multiplier_precision)
+    return bet_value, multiplier
+
+
 def decimal_to_plain(value: Decimal) -> str:
     text = format(value, "f")
     if "." in text:
@@ -589,6 +792,38 @@ def decimal_to_plain(value: Decimal) -> str:
     return text
 
 
+def payout_profit(amount: int, multiplier: Decimal) -> int:
+    # Model payout API: profit win = amount * (multiplier - 1), dibulatkan ke bawah 8 desimal.
+    p, q = (multiplier - Decimal("1")).as_integer_ratio()
+    return amount * p // q
+
+
+def provably_fair_roll(server_seed: str, client_seed: str, nonce: int) -> int:
+    # Skema sama dengan mock_server.py: HMAC-SHA256(server_seed, "client_seed:nonce"), potongan 5 hex
+    # pertama yang < 1_000_000 lalu mod 10000. Hasil dalam satuan 0.01 (0-9999).
+    digest = hmac.new(server_seed.encode(), f"{client_seed}:{nonce}".encode(), hashlib.sha256).hexdigest()
+    for idx in range(0, len(digest) - 4, 5):
+        number = int(digest[idx:idx + 5], 16)
+        if number < 1_000_000:
+            return number % 10000
+    return 9999
+
+
+@functools.lru_cache(maxsize=32)
+def bet_body_prefix(currency: str) -> bytes:
+    return f"{{\"currency\":\"{currency.lower()}\",\"game\":\"dice\",\"amount\":".encode()
+
+
+@functools.lru_cache(maxsize=PAIR_SYNC_CACHE_SIZE)
+def bet_body_suffix(rule: str, multiplier: Decimal, bet_value: Decimal) -> bytes:
+    # Bagian body setelah amount; pair jarang berubah, jadi bytes-nya di-cache.
+    return (
+        f",\"rule\":\"{rule}\","
+        f"\"multiplier\":{decimal_to_plain(multiplier)},"
+        f"\"bet_value\":{decimal_to_plain(bet_value)}}}"
+    ).encode()
+
+
 def clear_screen() -> None:
     os.system("cls" if os.name == "nt" else "clear")
 
@@ -612,6 +847,431 @@ def print_banner() -> None:
     print("")
 
 
+class RatePacer:
+    # Token bucket dari header x-ratelimit-*: request disebar rata sepanjang window
+    # supaya tidak pernah menghabiskan kuota lalu freeze menunggu window berikutnya.
+    def __init__(self, window_seconds: float, burst: int) -> None:
+        self.window_seconds = window_seconds
+        self.burst = max(1, burst)
+        self.limit = 0
+        self.capacity = 0.0
+        self.rate = 0.0
+        self.tokens = 0.0
+        self.updated_at = time.monotonic()
+        self.total_wait = 0.0
+        self.throttled_count = 0
+
+    def _refill(self, now: float) -> None:
+        if self.rate > 0:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def acquire(self) -> float:
+        if self.rate <= 0:
+            return 0.0
+        now = time.monotonic()
+        self._refill(now)
+        wait_time = 0.0
+        if self.tokens < 1:
+            wait_time = (1 - self.tokens) / self.rate
+            time.sleep(wait_time)
+            self._refill(time.monotonic())
+            self.total_wait += wait_time
+        self.tokens -= 1
+        return wait_time
+
+    def observe(self, limit_header: str | None, remaining_header: str | None) -> None:
+        try:
+            limit = int(limit_header) if limit_header is not None else 0
+        except ValueError:
+            limit = 0
+        if limit > 0 and limit != self.limit and self.window_seconds > 0:
+            self.limit = limit
+            self.capacity = float(min(self.burst, limit))
+            # Sisakan ruang burst supaya total per window tetap <= limit.
+            self.rate = max(1, limit - int(self.capacity)) / self.window_seconds
+            self._refill(time.monotonic())
+            self.tokens = min(self.tokens, self.capacity)
+
+        if remaining_header is None or self.rate <= 0:
+            return
+        try:
+            remaining = int(remaining_header)
+        except ValueError:
+            return
+        if remaining < self.tokens:
+            self.tokens = float(max(0, remaining))
+
+    def penalty(self, retry_after: str | None, attempt: int, fallback_seconds: float) -> float:
+        self.throttled_count += 1
+        self.tokens = 0.0
+        self.updated_at = time.monotonic()
+        if retry_after is not None:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                pass
+        if self.rate > 0:
+            return min(fallback_seconds, (2 ** attempt) / self.rate)
+        return fallback_seconds
+
+
+class FooterTemplate(NamedTuple):
+    header: str
+    row: str
+    stats: str
+    total_idr: Tuple[str, ...]
+    total: str
+
+
+def build_footer_template(columns: int, currency: str) -> FooterTemplate:
+    # Template footer per tier lebar terminal; per repaint cukup str.format dengan nilai terbaru.
+    if columns >= 136:
+        return FooterTemplate(
+            header=(
+                f"{'TIME':<8} | {'ROLL':>7} | {'WIN/LOSS':<8} | {'MULTI':>12} | "
+                f"{'AMOUNT':>14} | {'PROFIT':>14} | {('BALANCE ' + currency):>14} | {'TOTAL PROFIT':>14}"
+            ),
+            row=(
+                "{time:<8} | {roll:>7} | {state:<8} | {multiplier:>12} | {amount:>14} | {profit:>14} | "
+                "{balance:>14} | {total:>14}"
+            ),
+            stats=(
+                "STATS | BET:{bets:<6} WIN:{wins:<6} LOSS:{losses:<6} WR:{winrate:>6}% | "
+                "LAST {window}: WR {rolling_winrate:>6}% {rolling_profit:>12} | "
+                f"BALANCE {currency}:" + "{balance_now:>14}"
+            ),
+            total_idr=(
+                f"BALANCE IDR: {{balance_idr}} | TOTAL PROFIT {currency}: {{total_now}} | TOTAL PROFIT IDR: {{total_idr}} "
+                "| DD {drawdown}",
+                f"BALANCE IDR: {{balance_idr}} | TOTAL PROFIT {currency}: {{total_now}} | TOTAL PROFIT IDR: {{total_idr}}",
+                f"BALANCE IDR: {{balance_idr}} | TOTAL PROFIT {currency}: {{total_now}}",
+                "BALANCE IDR: {balance_idr} | TOTAL PROFIT IDR: {total_idr}",
+                "BALANCE IDR: {balance_idr}",
+                f"TOTAL PROFIT {currency}: {{total_now}}",
+            ),
+            total=(
+                f"TOTAL PROFIT {currency}: {{total_now}} | DRAWDOWN {{drawdown}} (max {{max_drawdown}}) "
+                "| PEAK {peak_balance}"
+            ),
+        )
+    if columns >= 108:
+        return FooterTemplate(
+            header=(
+                f"{'TIME':<8} | {'ROLL':>7} | {'RESULT':<6} | {'MULTI':>8} | {'AMOUNT':>10} | "
+                f"{'PROFIT':>11} | {'BALANCE':>11} | {'TOTAL':>11}"
+            ),
+            row=(
+                "{time:<8} | {roll:>7} | {state:<6} | {multiplier:>8} | {amount:>10} | {profit:>11} | "
+                "{balance:>11} | {total:>11}"
+            ),
+            stats="STATS BET:{bets} WIN:{wins} LOSS:{losses} WR:{winrate}% L{window}:{rolling_winrate}% BALANCE:{balance_now}",
+            total_idr=(
+                f"BALANCE IDR: {{balance_idr}} | TOTAL PROFIT {currency}: {{total_now}} | TOTAL PROFIT IDR: {{total_idr}}",
+                f"BALANCE IDR: {{balance_idr}} | TOTAL PROFIT {currency}: {{total_now}}",
+                "BALANCE IDR: {balance_idr} | TOTAL PROFIT IDR: {total_idr}",
+                "BALANCE IDR: {balance_idr}",
+                f"TOTAL PROFIT {currency}: {{total_now}}",
+            ),
+            total=f"TOTAL PROFIT {currency}: {{total_now}} | DD {{drawdown}} (max {{max_drawdown}})",
+        )
+    if columns >= 82:
+        return FooterTemplate(
+            header=f"{'TIME':<8} | {'ROLL':>7} | {'RESULT':<6} | {'PROFIT':>12} | {'TOTAL':>12}",
+            row="{time:<8} | {roll:>7} | {state:<6} | {profit:>12} | {total:>12}",
+            stats="BET:{bets} WIN:{wins} LOSS:{losses} WR:{winrate}% BALANCE:{balance_now}",
+            total_idr=(
+                f"BALANCE IDR: {{balance_idr}} | TOTAL {currency}: {{total_now}} | TOTAL IDR: {{total_idr}}",
+                f"BALANCE IDR: {{balance_idr}} | TOTAL {currency}: {{total_now}}",
+                "BALANCE IDR: {balance_idr} | TOTAL IDR: {total_idr}",
+                "BALANCE IDR: {balance_idr}",
+                f"TOTAL {currency}: {{total_now}}",
+            ),
+            total=f"TOTAL {currency}: {{total_now}}",
+        )
+    return FooterTemplate(
+        header="TIME | RESULT | PROFIT | TOTAL",
+        row="{time} | {state} | {profit} | {total}",
+        stats="BET:{bets} WR:{winrate}% BAL:{balance_now}",
+        total_idr=(
+            f"BALANCE IDR: {{balance_idr}} | {currency} {{total_now}}",
+            "BALANCE IDR: {balance_idr}",
+            f"{currency} {{total_now}}",
+        ),
+        total=f"{currency} {{total_now}}",
+    )
+
+
+class TransportError(Exception):
+    pass
+
+
+class TransportResponse(NamedTuple):
+    status_code: int
+    headers: Dict[str, str]
+    body: bytes
+
+
+class HttpTransport:
+    # Backend HTTP untuk WolfbetClient. Header response selalu dikembalikan dengan key lowercase,
+    # error jaringan dibungkus jadi TransportError supaya logika retry sama untuk semua backend.
+    name = ""
+
+    def __init__(self, headers: Dict[str, str], timeout: float) -> None:
+        self.headers = headers
+        self.timeout = timeout
+        self.request_count = 0
+        self.reused_count = 0
+        self.connect_count = 0
+        self.drop_count = 0
+        self.idle_refresh_count = 0
+        self.last_used_at = 0.0
+
+    def request(self, method: str, url: str, body: bytes | None = None) -> TransportResponse:
+        raise NotImplementedError
+
+    def connect(self, url: str) -> bool:
+        # Buka koneksi kalau belum ada atau sudah ditutup server; True jika koneksi baru dibuka.
+        return False
+
+    def maintain(self, url: str, idle_limit: float, upcoming_idle: float = 0.0) -> bool:
+        # Dipanggil di jendela sleep: koneksi yang idle-nya akan lewat idle_limit dibuka ulang sekarang,
+        # bukan saat request berikutnya.
+        if idle_limit > 0 and self.last_used_at > 0:
+            if time.monotonic() - self.last_used_at + upcoming_idle >= idle_limit and self._reopen(url):
+                self.idle_refresh_count += 1
+                return True
+        return self.connect(url)
+
+    def _reopen(self, url: str) -> bool:
+        return False
+
+    def _count_request(self, opened: bool) -> None:
+        self.request_count += 1
+        if not opened:
+            self.reused_count += 1
+        self.last_used_at = time.monotonic()
+
+    def close(self) -> None:
+        pass
+
+
+class RequestsTransport(HttpTransport):
+    name = "requests"
+
+    def __init__(self, headers: Dict[str, str], timeout: float) -> None:
+        super().__init__(headers, timeout)
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        self._prepared: Dict[Tuple[str, str], requests.PreparedRequest] = {}
+        self._send_settings: Dict[str, Any] | None = None
+        self._fresh_connection = False
+
+    def _prepared_request(self, method: str, url: str) -> requests.PreparedRequest:
+        # Header session, cookie, dan setting environment (proxy/verify) digabung sekali per endpoint;
+        # request berikutnya cukup ganti body.
+        prepared = self._prepared.get((method, url))
+        if prepared is None:
+            prepared = self.session.prepare_request(requests.Request(method, url, data=b"{}"))
+            self._prepared[(method, url)] = prepared
+        return prepared
+
+    def _settings(self, url: str) -> Dict[str, Any]:
+        if self._send_settings is None:
+            self._send_settings = self.session.merge_environment_settings(url, {}, None, None, None)
+        return self._send_settings
+
+    def _pooled_connection(self, url: str, reopen: bool) -> bool:
+        # Cek koneksi teratas di pool urllib3 (yang dipakai request berikutnya). Hanya lewat maintain() di
+        # jendela sleep, jadi API privat pool tidak ikut di jalur bet. Lewat proxy dilewati.
+        if self._settings(url).get("proxies"):
+            return False
+        pool = self.session.get_adapter(url).poolmanager.connection_from_url(url)
+        try:
+            conn = pool._get_conn()
+        except Exception:
+            return False
+        opened = False
+        try:
+            # _get_conn sudah menutup koneksi yang diputus server; sock None setelah connect pertama = drop.
+            if conn.sock is not None and reopen:
+                conn.close()
+            elif conn.sock is None and self.connect_count > 0 and not reopen:
+                self.drop_count += 1
+            if conn.sock is None:
+                conn.connect()
+                self.connect_count += 1
+                opened = True
+        except OSError as exc:
+            conn.close()
+            raise TransportError(str(exc) or type(exc).__name__) from exc
+        finally:
+            pool._put_conn(conn)
+        if opened:
+            # Pool LIFO: koneksi baru ini yang dipakai request berikutnya, jadi request itu tidak dihitung reuse.
+            self._fresh_connection = True
+        return opened
+
+    def connect(self, url: str) -> bool:
+        return self._pooled_connection(url, reopen=False)
+
+    def _reopen(self, url: str) -> bool:
+        return self._pooled_connection(url, reopen=True)
+
+    def request(self, method: str, url: str, body: bytes | None = None) -> TransportResponse:
+        opened, self._fresh_connection = self._fresh_connection, False
+        try:
+            if body is None:
+                response = self.session.request(method=method, url=url, timeout=self.timeout)
+            else:
+                prepared = self._prepared_request(method, url)
+                prepared.body = body
+                prepared.headers["Content-Length"] = str(len(body))
+                response = self.session.send(prepared, timeout=self.timeout, **self._settings(url))
+            content = response.content
+        except requests.RequestException as exc:
+            raise TransportError(str(exc)) from exc
+        self._count_request(opened)
+        headers = {key.lower(): value for key, value in response.headers.items()}
+        if "set-cookie" in headers:
+            # Cookie baru masuk ke session; siapkan ulang supaya request berikutnya ikut membawanya.
+            self._prepared.clear()
+        return TransportResponse(response.status_code, headers, content)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class HttpClientTransport(HttpTransport):
+    # Satu koneksi keep-alive http.client dengan TCP_NODELAY: header+body bet tidak tertahan Nagle,
+    # dan tidak ada lapisan session/adapter/pool requests per call.
+    name = "http_client"
+
+    def __init__(self, headers: Dict[str, str], timeout: float, base_url: str) -> None:
+        super().__init__(headers, timeout)
+        parts = urlsplit(base_url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            raise ConfigError(f"api.base_url tidak valid untuk transport http_client: {base_url}")
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.connection: http.client.HTTPConnection | None = None
+        self.cookies: Dict[str, str] = {}
+
+    def _open(self) -> None:
+        if self.scheme == "https":
+            connection: http.client.HTTPConnection = http.client.HTTPSConnection(
+                self.host, self.port, timeout=self.timeout, context=ssl.create_default_context()
+            )
+        else:
+            connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            connection.connect()
+            connection.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as exc:
+            connection.close()
+            raise TransportError(str(exc) or type(exc).__name__) from exc
+        self.connection = connection
+        self.connect_count += 1
+
+    def _connection_dropped(self) -> bool:
+        # Socket idle yang "bisa dibaca" berarti server sudah kirim FIN/RST (koneksi keep-alive ditutup).
+        sock = self.connection.sock if self.connection is not None else None
+        if sock is None:
+            return True
+        try:
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+    def connect(self, url: str) -> bool:
+        if not self._connection_dropped():
+            return False
+        if self.connection is not None:
+            self.drop_count += 1
+            self.close()
+        self._open()
+        return True
+
+    def _reopen(self, url: str) -> bool:
+        self.close()
+        self._open()
+        return True
+
+    def request(self, method: str, url: str, body: bytes | None = None) -> TransportResponse:
+        parts = urlsplit(url)
+        target = parts.path + (f"?{parts.query}" if parts.query else "")
+        headers = dict(self.headers)
+        if self.cookies:
+            headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in self.cookies.items())
+        opened = self.connect(url)
+        try:
+            self.connection.request(method, target, body=body, headers=headers)
+            response = self.connection.getresponse()
+            content = response.read()
+        except (OSError, http.client.HTTPException) as exc:
+            self.close()
+            raise TransportError(str(exc) or type(exc).__name__) from exc
+        self._count_request(opened)
+
+        for cookie in response.msg.get_all("set-cookie") or ():
+            name, _, value = cookie.split(";", 1)[0].partition("=")
+            if name.strip():
+                self.cookies[name.strip()] = value.strip()
+        response_headers = {key.lower(): value for key, value in response.getheaders()}
+        if response.will_close:
+            self.close()
+        return TransportResponse(response.status, response_headers, content)
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+class Http2Transport(HttpTransport):
+    # Opsional: butuh `pip install httpx[http2]`. Multiplexing HTTP/2 lewat satu koneksi TLS.
+    # Pool koneksi diurus httpx sendiri, jadi statistik reuse tidak tersedia.
+    name = "http2"
+
+    def __init__(self, headers: Dict[str, str], timeout: float) -> None:
+        super().__init__(headers, timeout)
+        if httpx is None:
+            raise ConfigError("api.transport=http2 butuh library httpx. Install dulu: pip install httpx[http2]")
+        try:
+            self.client = httpx.Client(http2=True, headers=headers, timeout=timeout)
+        except ImportError as exc:
+            raise ConfigError("api.transport=http2 butuh paket h2. Install dulu: pip install httpx[http2]") from exc
+
+    def request(self, method: str, url: str, body: bytes | None = None) -> TransportResponse:
+        try:
+            response = self.client.request(method, url, content=body)
+            content = response.content
+        except httpx.HTTPError as exc:
+            raise TransportError(str(exc) or type(exc).__name__) from exc
+        self.request_count += 1
+        self.last_used_at = time.monotonic()
+        headers = {key.lower(): value for key, value in response.headers.items()}
+        return TransportResponse(response.status_code, headers, content)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+SUPPORTED_TRANSPORTS = ("requests", "http_client", "http2")
+
+
+def build_transport(name: str, base_url: str, headers: Dict[str, str], timeout: float) -> HttpTransport:
+    if name == "http_client":
+        return HttpClientTransport(headers, timeout, base_url)
+    if name == "http2":
+        return Http2Transport(headers, timeout)
+    if name == "requests":
+        return RequestsTransport(headers, timeout)
+    raise ConfigError(f"api.transport harus salah satu: {', '.join(SUPPORTED_TRANSPORTS)}.")
+
+
 class WolfbetClient:
     def __init__(self, cfg: Dict[str, Any]) -> None:
         self.base_url = str(cfg["api"]["base_url"]).rstrip("/")
@@ -622,17 +1282,57 @@ class WolfbetClient:
         self.timeout = float(cfg["api"]["timeout_seconds"])
         self.retry_count = int(cfg["api"]["retry_count"])
         self.rate_limit_wait_seconds = int(cfg["api"]["rate_limit_wait_seconds"])
+        self.pacer = RatePacer(
+            float(cfg["api"]["rate_limit_window_seconds"]),
+            int(cfg["api"]["rate_limit_burst"]),
+        )
         self.runtime_warn_logger: Callable[[str], None] | None = None
-
-        self.session = requests.Session()
-        self.session.headers.update(
+        self.last_pace_seconds = 0.0
+        self.last_rtt_seconds = 0.0
+        self.last_parse_seconds = 0.0
+        self.keepalive_idle_seconds = float(cfg["api"].get("keepalive_idle_seconds", 45))
+
+        self.transport = build_transport(
+            str(cfg["api"].get("transport", "requests")).lower(),
+            self.base_url,
             {
                 "Authorization": token,
                 "X-Requested-With": "XMLHttpRequest",
                 "Accept": "application/json",
                 "Content-Type": "application/json",
                 "User-Agent": "NUSANTARA-BOT/1.0",
-            }
+            },
+            self.timeout,
+        )
+
+    def warmup(self) -> float:
+        # Buka dan validasi koneksi sebelum bet pertama supaya handshake TCP/TLS tidak masuk RTT bet.
+        started = time.perf_counter()
+        try:
+            self.transport.maintain(self.base_url, self.keepalive_idle_seconds)
+        except TransportError as exc:
+            raise APIError(f"Gagal konek ke API: {exc}") from exc
+        return time.perf_counter() - started
+
+    def maintain_connection(self, upcoming_idle: float = 0.0) -> bool:
+        # Dipanggil sebelum sleep: koneksi yang ditutup server atau hampir lewat batas idle dibuka ulang
+        # sekarang. Gagal konek tidak fatal di sini; request berikutnya yang akan retry.
+        try:
+            return self.transport.maintain(self.base_url, self.keepalive_idle_seconds, upcoming_idle)
+        except TransportError:
+            return False
+
+    def connection_summary(self) -> str:
+        transport = self.transport
+        if transport.request_count == 0:
+            return f"transport {transport.name} | belum ada request"
+        if isinstance(transport, Http2Transport):
+            return f"transport {transport.name} | {transport.request_count} request (pool diurus httpx)"
+        reuse_pct = transport.reused_count / transport.request_count * 100
+        return (
+            f"transport {transport.name} | reuse {reuse_pct:.1f}% "
+            f"({transport.reused_count}/{transport.request_count} request) | "
+            f"connect {transport.connect_count} (drop {transport.drop_count}, idle {transport.idle_refresh_count})"
         )
 
     def set_runtime_warn_logger(self, logger: Callable[[str], None] | None) -> None:
@@ -644,9 +1344,9 @@ class WolfbetClient:
             return
         print(THEME_SECONDARY + message)
 
-    def _safe_error_body(self, response: requests.Response) -> str:
+    def _safe_error_body(self, response: TransportResponse) -> str:
         try:
-            body = response.json()
+            body = json.loads(response.body)
             if isinstance(body, dict):
                 if "message" in body:
                     return str(body["message"])
@@ -654,11 +1354,11 @@ class WolfbetClient:
                     return str(body["error"])
             return json.dumps(body, ensure_ascii=False)[:400]
         except ValueError:
-            return (response.text or "Unknown error")[:400]
+            return (response.body.decode("utf-8", "replace") or "Unknown error")[:400]
 
-    def _parse_json(self, response: requests.Response) -> Dict[str, Any]:
+    def _parse_json(self, response: TransportResponse) -> Dict[str, Any]:
         try:
-            parsed = response.json()
+            parsed = json.loads(response.body)
             if isinstance(parsed, dict):
                 return parsed
             return {"data": parsed}
@@ -670,47 +1370,53 @@ class WolfbetClient:
         method: str,
         path: str,
         payload: Dict[str, Any] | None = None,
-        raw_json_payload: str | None = None,
-    ) -> Tuple[Dict[str, Any], requests.Response]:
+        raw_json_payload: bytes | None = None,
+    ) -> Tuple[Dict[str, Any], TransportResponse]:
         url = f"{self.base_url}{path}"
+        body = raw_json_payload
+        if body is None and payload is not None:
+            body = json.dumps(payload, allow_nan=False).encode()
+        self.last_pace_seconds = 0.0
+        self.last_rtt_seconds = 0.0
+        self.last_parse_seconds = 0.0
         for attempt in range(self.retry_count + 1):
+            self.last_pace_seconds += self.pacer.acquire()
             try:
-                request_kwargs: Dict[str, Any] = {"method": method, "url": url, "timeout": self.timeout}
-                if raw_json_payload is not None:
-                    request_kwargs["data"] = raw_json_payload
-                else:
-                    request_kwargs["json"] = payload
-                response = self.session.request(**request_kwargs)
-            except requests.RequestException as exc:
+                sent_at = time.perf_counter()
+                response = self.transport.request(method, url, body)
+                self.last_rtt_seconds += time.perf_counter() - sent_at
+            except TransportError as exc:
                 if attempt >= self.retry_count:
                     raise APIError(f"Gagal konek ke API: {exc}") from exc
                 wait_time = min(2 + attempt, 10)
                 self._warn(f"[WARN] Network error, retry dalam {wait_time}s ...")
                 time.sleep(wait_time)
+                self.maintain_connection()
                 continue
 
-            remaining = response.headers.get("x-ratelimit-remaining")
+            self.pacer.observe(
+                response.headers.get("x-ratelimit-limit"),
+                response.headers.get("x-ratelimit-remaining"),
+            )
             if response.status_code == 429:
                 if attempt >= self.retry_count:
                     raise APIError("Rate limit kena (429) dan retry habis.")
-                self._warn(f"[WARN] Rate limit tercapai. Tunggu {self.rate_limit_wait_seconds}s lalu retry ...")
-                time.sleep(self.rate_limit_wait_seconds)
+                wait_time = self.pacer.penalty(
+                    response.headers.get("retry-after"), attempt, self.rate_limit_wait_seconds
+                )
+                self._warn(f"[WARN] Rate limit tercapai. Tunggu {wait_time:.1f}s lalu retry ...")
+                time.sleep(wait_time)
+                self.maintain_connection()
+                self.last_pace_seconds += wait_time
                 continue
 
-            if not response.ok:
+            if response.status_code >= 400:
                 detail = self._safe_error_body(response)
                 raise APIError(f"HTTP {response.status_code}: {detail}")
 
+            parse_started_at = time.perf_counter()
             parsed = self._parse_json(response)
-
-            if remaining is not None:
-                try:
-                    if int(remaining) <= 0:
-                        self._warn(f"[WARN] x-ratelimit-remaining=0, cooldown {self.rate_limit_wait_seconds}s ...")
-                        time.sleep(self.rate_limit_wait_seconds)
-                except ValueError:
-                    pass
-
+            self.last_parse_seconds = time.perf_counter() - parse_started_at
             return parsed, response
 
         raise APIError("Request gagal setelah seluruh retry.")
@@ -722,22 +1428,15 @@ class WolfbetClient:
     def place_dice_bet(
         self,
         currency: str,
-        amount: Decimal,
+        amount: Decimal | int,
         rule: str,
         multiplier: Decimal,
         bet_value: Decimal,
     ) -> Dict[str, Any]:
-        payload_json = (
-            "{"
-            f"\"currency\":\"{currency.lower()}\","
-            "\"game\":\"dice\","
-            f"\"amount\":{decimal_to_plain(amount)},"
-            f"\"rule\":\"{rule}\","
-            f"\"multiplier\":{decimal_to_plain(multiplier)},"
-            f"\"bet_value\":{decimal_to_plain(bet_value)}"
-            "}"
-        )
-        data, _ = self._request("POST", "/bet/place", raw_json_payload=payload_json)
+        # amount int = satuan 1e-8 (format internal DiceBot), langsung ditulis tanpa lewat Decimal.
+        amount_text = format_units(amount, COIN_UNIT_PLACES) if isinstance(amount, int) else decimal_to_plain(amount)
+        body = bet_body_prefix(currency) + amount_text.encode() + bet_body_suffix(rule, multiplier, bet_value)
+        data, _ = self._request("POST", "/bet/place", raw_json_payload=body)
         return data
 
     def refresh_client_seed(self, client_seed: str) -> Dict[str, Any]:
@@ -749,10 +1448,1485 @@ class WolfbetClient:
         return data
 
 
+class PaperClient:
+    # Pengganti WolfbetClient tanpa HTTP: balance, hasil bet, seed, dan nonce disimulasikan di memori,
+    # jadi loop DiceBot.run asli (stop, replay, render, strategi) jalan secepat CPU.
+    def __init__(self, cfg: Dict[str, Any]) -> None:
+        paper_cfg = cfg.get("paper", {}) or {}
+        start_balance = coin_units(to_decimal(paper_cfg.get("balance", 100), "paper.balance"))
+        seed = str(paper_cfg.get("seed", "")).strip()
+        # seed kosong = hasil beda tiap run; seed diisi = urutan roll bisa diulang persis.
+        self.rng = random.Random(seed) if seed else random.Random()
+        self.balances = {currency: start_balance for currency in COINGECKO_IDS}
+        self.balances.setdefault(str(cfg["bot"]["currency"]).lower(), start_balance)
+        self.server_seed = self._new_server_seed()
+        self.client_seed = f"{self.rng.getrandbits(96):024x}"
+        self.nonce = 0
+        self.bet_total = 0
+        self.seed_refresh_count = 0
+        self.last_pace_seconds = 0.0
+        self.last_rtt_seconds = 0.0
+        self.last_parse_seconds = 0.0
+        self.runtime_warn_logger: Callable[[str], None] | None = None
+        # (rule, multiplier, bet_value) -> (is_under, threshold roll, multiplier); dicek sekali per pair.
+        self._pairs: Dict[Tuple[str, Decimal, Decimal], Tuple[bool, int, Decimal]] = {}
+
+    def _new_server_seed(self) -> str:
+        return f"{self.rng.getrandbits(256):064x}"
+
+    def warmup(self) -> float:
+        return 0.0
+
+    def maintain_connection(self, upcoming_idle: float = 0.0) -> bool:
+        return True
+
+    def connection_summary(self) -> str:
+        return (
+            f"paper (tanpa HTTP) | {self.bet_total} bet simulasi | nonce {self.nonce} "
+            f"| refresh seed {self.seed_refresh_count}"
+        )
+
+    def set_runtime_warn_logger(self, logger: Callable[[str], None] | None) -> None:
+        self.runtime_warn_logger = logger
+
+    def get_balances(self) -> Dict[str, Any]:
+        return {
+            "balances": [
+                {"currency": currency, "amount": format_units(amount, COIN_UNIT_PLACES)}
+                for currency, amount in self.balances.items()
+            ]
+        }
+
+    def _pair(self, rule: str, multiplier: Decimal, bet_value: Decimal) -> Tuple[bool, int, Decimal]:
+        key = (rule, multiplier, bet_value)
+        pair = self._pairs.get(key)
+        if pair is not None:
+            return pair
+        if rule not in {"under", "over"}:
+            raise APIError("HTTP 422: The selected rule is invalid.")
+        if bet_value <= 0 or bet_value >= Decimal("99.99"):
+            raise APIError("HTTP 422: The bet value is out of range.")
+        # Validasi pair sama seperti API: multiplier harus 99 / chance (4 desimal, toleransi 0.0001).
+        expected = multiplier_for_bet_value(bet_value, rule, 4)
+        if abs(expected - multiplier) > Decimal("0.0001"):
+            raise APIError("HTTP 400: Incorrect win chance given.")
+        scaled = bet_value * 100
+        threshold = math.ceil(scaled) if rule == "under" else math.floor(scaled)
+        pair = (rule == "under", threshold, multiplier)
+        self._pairs[key] = pair
+        return pair
+
+    def place_dice_bet(
+        self,
+        currency: str,
+        amount: Decimal | int,
+        rule: str,
+        multiplier: Decimal,
+        bet_value: Decimal,
+    ) -> Dict[str, Any]:
+        started = time.perf_counter()
+        currency = currency.lower()
+        if currency not in self.balances:
+            raise APIError("HTTP 422: The selected currency is invalid.")
+        if not isinstance(amount, int):
+            if -amount.as_tuple().exponent > COIN_UNIT_PLACES:
+                raise APIError("HTTP 400: Amount scale is too high.")
+            amount = coin_units(amount)
+        if amount <= 0:
+            raise APIError("HTTP 422: The amount must be greater than 0.")
+        is_under, threshold, multiplier = self._pair(rule, multiplier, bet_value)
+        balance = self.balances[currency]
+        if amount > balance:
+            raise APIError("HTTP 400: Insufficient balance.")
+
+        self.nonce += 1
+        self.bet_total += 1
+        roll = provably_fair_roll(self.server_seed, self.client_seed, self.nonce)
+        won = roll < threshold if is_under else roll > threshold
+        profit = payout_profit(amount, multiplier) if won else -amount
+        balance += profit
+        self.balances[currency] = balance
+        response = {
+            "bet": {
+                "hash": f"paper-{self.nonce}",
+                "nonce": self.nonce,
+                "currency": currency,
+                "amount": format_units(amount, COIN_UNIT_PLACES),
+                "profit": format_units(profit, COIN_UNIT_PLACES),
+                "multiplier": decimal_to_plain(multiplier),
+                "bet_value": decimal_to_plain(bet_value),
+                "result_value": f"{roll // 100}.{roll % 100:02d}",
+                "state": "win" if won else "loss",
+            },
+            "user_balance": {"amount": format_units(balance, COIN_UNIT_PLACES), "currency": currency},
+        }
+        self.last_rtt_seconds = time.perf_counter() - started
+        return response
+
+    def refresh_client_seed(self, client_seed: str) -> Dict[str, Any]:
+        if len(client_seed) < 10 or len(client_seed) > 64:
+            raise APIError("HTTP 422: The client seed must be between 10 and 64 characters.")
+        self.client_seed = client_seed
+        self.nonce = 0
+        self.seed_refresh_count += 1
+        return {"seed": client_seed}
+
+    def refresh_server_seed(self) -> Dict[str, Any]:
+        self.server_seed = self._new_server_seed()
+        self.nonce = 0
+        self.seed_refresh_count += 1
+        return {"server_seed_hashed": hashlib.sha256(self.server_seed.encode()).hexdigest()}
+
+
+def build_client(cfg: Dict[str, Any]) -> "WolfbetClient | PaperClient":
+    if str(cfg["api"].get("mode", "live")).lower() == "paper":
+        return PaperClient(cfg)
+    return WolfbetClient(cfg)
+
+
+def paper_path(path: str) -> str:
+    # Jurnal/checkpoint mode paper dipisah dari file sesi live: bets.jsonl -> bets.paper.jsonl.
+    target = Path(path)
+    return str(target.with_name(f"{target.stem}.paper{target.suffix}"))
+
+
+def parse_roll_value(text: Any) -> int | None:
+    # result_value "42.17" -> 4217 (satuan 0.01, 0-9999). Nilai lain (header CSV, "-") -> None.
+    try:
+        roll = round(float(text) * 100)
+    except (TypeError, ValueError):
+        return None
+    return roll if 0 <= roll <= 9999 else None
+
+
+def shadow_config(cfg: Dict[str, Any], entry: Any) -> Tuple[str, str | None, Dict[str, Any]]:
+    # Entri shadow.strategies: nama preset, atau object {name, preset, simple, bot, strategy} yang
+    # di-merge ke config utama. Engine shadow tidak pernah menulis jurnal/checkpoint.
+    if isinstance(entry, str):
+        entry = {"preset": entry}
+    if not isinstance(entry, dict):
+        raise ConfigError("harus nama preset atau object JSON")
+    preset = entry.get("preset")
+    if preset is not None:
+        preset = str(preset).strip().lower()
+        if preset not in SUPPORTED_PRESETS and preset != "custom":
+            raise ConfigError(f"preset '{preset}' tidak dikenal")
+    merged = json.loads(json.dumps(cfg))
+    if "simple" in entry:
+        merged = deep_merge(merged, {"simple": entry["simple"]})
+        apply_simple_settings(merged)
+    merged = deep_merge(merged, {key: entry[key] for key in ("bot", "strategy") if key in entry})
+    merged["api"]["mode"] = "paper"
+    merged["journal"] = {**(merged.get("journal") or {}), "enabled": "OFF"}
+    merged["checkpoint"] = {**(merged.get("checkpoint") or {}), "enabled": "OFF"}
+    merged["shadow"] = {"strategies": []}
+    return str(entry.get("name") or preset or "shadow"), preset, merged
+
+
+def build_offline_bot(cfg: Dict[str, Any], preset: str | None = None) -> "DiceBot":
+    # DiceBot tanpa API (backtest.py, strategi shadow). PaperClient hanya supaya bot bisa dibuat tanpa token;
+    # bet dijalankan lewat DiceBot.replay_roll, tidak ada yang dikirim.
+    bot = DiceBot(cfg, PaperClient(cfg))
+    if preset is not None:
+        bot.current_amount = bot.base_amount
+        bot.preset_enabled = preset != "custom"
+        bot.preset_name = preset if bot.preset_enabled else ""
+        bot.simple_system = bot.preset_name
+        bot._activate_strategy()
+    return bot
+
+
+class IdrPriceSnapshot(NamedTuple):
+    price: Decimal
+    updated_ts: float
+    updated_at: str
+    status: str
+    error: str
+
+
+class IdrPriceFeed:
+    # Harga coin -> IDR diambil di thread background; bet loop cukup baca snapshot terakhir.
+    def __init__(self, coin_id: str, refresh_seconds: int) -> None:
+        self.coin_id = coin_id
+        # 0 atau nilai kecil dinaikkan ke batas minimal supaya tidak kena rate limit CoinGecko.
+        self.refresh_seconds = max(refresh_seconds, IDR_MIN_REFRESH_SECONDS)
+        self.snapshot = IdrPriceSnapshot(Decimal("0"), 0.0, "--:--:--", "INIT", "")
+        self._stop_event = threading.Event()
+        self._first_result = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._worker, name="idr-price-feed", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def wait_first(self, timeout: float) -> bool:
+        return self._first_result.wait(timeout)
+
+    def _fetch(self) -> Decimal:
+        response = requests.get(
+            "https://api.coingecko.com/api/v3/simple/price",
+            params={"ids": self.coin_id, "vs_currencies": "idr"},
+            headers={"Accept": "application/json", "User-Agent": "NUSANTARA-BOT/1.0"},
+            timeout=8,
+        )
+        if not response.ok:
+            raise APIError(f"HTTP {response.status_code}")
+
+        payload = response.json()
+        idr_value = payload.get(self.coin_id, {}).get("idr")
+        if idr_value is None:
+            raise APIError("field 'idr' tidak ditemukan di response price")
+
+        idr_price = Decimal(str(idr_value))
+        if idr_price <= 0:
+            raise APIError("harga IDR tidak valid (<= 0)")
+        return idr_price
+
+    def _worker(self) -> None:
+        while not self._stop_event.is_set():
+            current = self.snapshot
+            try:
+                idr_price = self._fetch()
+                self.snapshot = IdrPriceSnapshot(
+                    idr_price, time.time(), datetime.now().strftime("%H:%M:%S"), "OK", ""
+                )
+            except Exception as exc:
+                self.snapshot = current._replace(status="ERROR", error=str(exc))
+            self._first_result.set()
+            self._stop_event.wait(self.refresh_seconds)
+
+
+class BetScheduler:
+    # Cadence bet berbasis deadline monotonic: waktu request/render dikurangkan dari jeda,
+    # jadi bet_interval_ms = jarak antar bet, bukan jeda tambahan setelah bet.
+    def __init__(self, interval_seconds: float) -> None:
+        self.interval = max(0.0, interval_seconds)
+        self.start()
+
+    def start(self) -> None:
+        self.started_at = time.monotonic()
+        self.next_deadline = self.started_at
+        self.slots = 0
+        self.missed_slots = 0
+        self.late_slots = 0
+        self.total_drift = 0.0
+        self.max_drift = 0.0
+
+    def wait(self) -> float:
+        self.slots += 1
+        if self.interval <= 0:
+            return 0.0
+        self.next_deadline += self.interval
+        now = time.monotonic()
+        slept = 0.0
+        if now < self.next_deadline:
+            slept = self.next_deadline - now
+            time.sleep(slept)
+            now = time.monotonic()
+        drift = now - self.next_deadline
+        self.total_drift += drift
+        if drift > self.max_drift:
+            self.max_drift = drift
+        if drift >= self.interval:
+            # Telat satu slot atau lebih: slot yang lewat dihitung missed, jadwal di-anchor ulang tanpa burst.
+            self.late_slots += 1
+            self.missed_slots += int(drift // self.interval)
+            self.next_deadline = now
+        return slept
+
+    def seconds_until_next(self) -> float:
+        if self.interval <= 0:
+            return 0.0
+        return self.next_deadline + self.interval - time.monotonic()
+
+    def actual_rate(self) -> float:
+        elapsed = time.monotonic() - self.started_at
+        if elapsed <= 0:
+            return 0.0
+        return self.slots / elapsed
+
+    def average_drift(self) -> float:
+        if self.slots <= 0:
+            return 0.0
+        return self.total_drift / self.slots
+
+
+class LatencyHistogram:
+    # Bucket logaritmik (lebar ~15%) dari 10us sampai ~2 menit: memori tetap berapa pun jumlah bet.
+    MIN_SECONDS = 0.00001
+    GROWTH = 1.15
+    BUCKETS = 120
+
+    def __init__(self) -> None:
+        self.counts = [0] * self.BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.max_value = 0.0
+        self._log_growth = math.log(self.GROWTH)
+
+    def record(self, seconds: float) -> None:
+        if seconds <= self.MIN_SECONDS:
+            index = 0
+        else:
+            index = min(self.BUCKETS - 1, int(math.log(seconds / self.MIN_SECONDS) / self._log_growth) + 1)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max_value:
+            self.max_value = seconds
+
+    def percentile(self, fraction: float) -> float:
+        if self.count <= 0:
+            return 0.0
+        target = max(1, math.ceil(self.count * fraction))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                upper = self.MIN_SECONDS * (self.GROWTH ** index)
+                return min(upper, self.max_value)
+        return self.max_value
+
+    def mean(self) -> float:
+        return self.total / self.count if self.count > 0 else 0.0
+
+
+class PhaseProfiler:
+    PHASES = (
+        "controls", "sync", "pace", "rtt", "parse", "balance", "journal", "render", "strategy", "shadow", "io", "sleep",
+    )
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.histograms = {phase: LatencyHistogram() for phase in self.PHASES}
+
+    def record(self, phase: str, seconds: float) -> None:
+        self.histograms[phase].record(seconds)
+
+    def percentiles_ms(self, phase: str, fractions: Tuple[float, ...] = (0.5, 0.95, 0.99)) -> Tuple[float, ...]:
+        histogram = self.histograms[phase]
+        return tuple(histogram.percentile(fraction) * 1000 for fraction in fractions)
+
+
+class BetRecord:
+    __slots__ = ("at", "won", "roll", "multiplier", "amount", "profit", "balance", "total_profit")
+
+    def __init__(self) -> None:
+        self.at = 0.0
+        self.won = False
+        self.roll: Any = "-"
+        self.multiplier = Decimal("0")
+        self.amount = 0
+        self.profit = 0
+        self.balance = 0
+        self.total_profit = 0
+
+
+class BetHistory:
+    # Ring buffer N bet terakhir. Record __slots__ dialokasikan sekali lalu ditimpa, jadi memori tetap sama
+    # walau sesi jalan berhari-hari. Win rate/profit rolling di-update per bet (O(1)).
+    def __init__(self, capacity: int) -> None:
+        self.capacity = max(1, capacity)
+        self.records = [BetRecord() for _ in range(self.capacity)]
+        self.reset()
+
+    def reset(self) -> None:
+        self.size = 0
+        self._next = 0
+        self.window_wins = 0
+        self.window_profit = 0
+
+    def append(
+        self,
+        at: float,
+        won: bool,
+        roll: Any,
+        multiplier: Decimal,
+        amount: int,
+        profit: int,
+        balance: int,
+        total_profit: int,
+    ) -> None:
+        record = self.records[self._next]
+        if self.size == self.capacity:
+            # Bet tertua keluar dari window rolling.
+            self.window_wins -= record.won
+            self.window_profit -= record.profit
+        else:
+            self.size += 1
+        record.at = at
+        record.won = won
+        record.roll = roll
+        record.multiplier = multiplier
+        record.amount = amount
+        record.profit = profit
+        record.balance = balance
+        record.total_profit = total_profit
+        self.window_wins += won
+        self.window_profit += profit
+        self._next += 1
+        if self._next == self.capacity:
+            self._next = 0
+
+    def last(self) -> BetRecord | None:
+        if self.size == 0:
+            return None
+        return self.records[self._next - 1]
+
+    def recent(self) -> Iterable[BetRecord]:
+        # Urut dari bet terlama ke terbaru di dalam window.
+        start = self._next - self.size
+        for offset in range(self.size):
+            yield self.records[start + offset]
+
+    def rolling_winrate(self) -> Decimal:
+        if self.size == 0:
+            return Decimal("0")
+        return Decimal(self.window_wins) * Decimal("100") / Decimal(self.size)
+
+
+
+class RiskMetrics:
+    # Metrik risiko streaming, O(1) per bet tanpa scan ulang history: puncak profit, drawdown berjalan/maksimum,
+    # varians profit per bet (Welford), streak terpanjang, dan histogram lengkap panjang streak.
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.peak_profit = 0
+        self.drawdown = 0
+        self.max_drawdown = 0
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.streak = 0
+        self.longest_win_streak = 0
+        self.longest_loss_streak = 0
+        # Index = panjang streak yang sudah selesai; array tumbuh hanya sampai streak terpanjang.
+        self.win_streaks = array("q", [0])
+        self.loss_streaks = array("q", [0])
+
+    def update(self, won: bool, profit: int, total_profit: int) -> None:
+        if total_profit > self.peak_profit:
+            self.peak_profit = total_profit
+        self.drawdown = self.peak_profit - total_profit
+        if self.drawdown > self.max_drawdown:
+            self.max_drawdown = self.drawdown
+
+        self.count += 1
+        delta = profit - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (profit - self.mean)
+
+        if won:
+            if self.streak < 0:
+                self._close_streak(self.loss_streaks, -self.streak)
+                self.streak = 0
+            self.streak += 1
+            if self.streak > self.longest_win_streak:
+                self.longest_win_streak = self.streak
+        else:
+            if self.streak > 0:
+                self._close_streak(self.win_streaks, self.streak)
+                self.streak = 0
+            self.streak -= 1
+            if -self.streak > self.longest_loss_streak:
+                self.longest_loss_streak = -self.streak
+
+    @staticmethod
+    def _close_streak(buckets: array, length: int) -> None:
+        if length >= len(buckets):
+            buckets.extend([0] * (length + 1 - len(buckets)))
+        buckets[length] += 1
+
+    def stddev(self) -> float:
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self.m2 / (self.count - 1))
+
+    def streak_histogram(self, won: bool) -> List[Tuple[int, int]]:
+        # Streak yang masih berjalan ikut dihitung supaya summary di akhir sesi lengkap.
+        buckets = list(self.win_streaks if won else self.loss_streaks)
+        current = self.streak if won else -self.streak
+        if current > 0:
+            if current >= len(buckets):
+                buckets.extend([0] * (current + 1 - len(buckets)))
+            buckets[current] += 1
+        return [(length, count) for length, count in enumerate(buckets) if count > 0]
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "peak_profit": self.peak_profit,
+            "max_drawdown": self.max_drawdown,
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "streak": self.streak,
+            "longest_win_streak": self.longest_win_streak,
+            "longest_loss_streak": self.longest_loss_streak,
+            "win_streaks": self.win_streaks.tolist(),
+            "loss_streaks": self.loss_streaks.tolist(),
+        }
+
+    def restore(self, state: Dict[str, Any], total_profit: int) -> None:
+        self.peak_profit = int(state["peak_profit"])
+        self.drawdown = self.peak_profit - total_profit
+        self.max_drawdown = int(state["max_drawdown"])
+        self.count = int(state["count"])
+        self.mean = float(state["mean"])
+        self.m2 = float(state["m2"])
+        self.streak = int(state["streak"])
+        self.longest_win_streak = int(state["longest_win_streak"])
+        self.longest_loss_streak = int(state["longest_loss_streak"])
+        self.win_streaks = array("q", [int(value) for value in state["win_streaks"]] or [0])
+        self.loss_streaks = array("q", [int(value) for value in state["loss_streaks"]] or [0])
+
+
+class BetJournal:
+    # Jurnal bet append-only (JSON Lines). record() hanya menaruh baris di buffer memori; write+fsync
+    # dikerjakan maintain() di jendela sleep antar bet (kecuali fsync=always), jadi jalur bet tidak kena I/O disk.
+    # Segmen yang sudah penuh di-rename lalu dikompres di thread background.
+    BUFFER_LIMIT_BYTES = 64 * 1024
+
+    def __init__(
+        self,
+        path: str,
+        rotate_bytes: int,
+        fsync_policy: str,
+        flush_interval: float,
+        compression: str,
+    ) -> None:
+        self.path = Path(path)
+        self.rotate_bytes = rotate_bytes
+        self.fsync_policy = fsync_policy
+        self.flush_interval = flush_interval
+        self.compression = compression
+        self.record_count = 0
+        self.rotated_count = 0
+        self._pending: List[bytes] = []
+        self._pending_bytes = 0
+        self._handle: Any = None
+        self._segment_bytes = 0
+        self._unsynced = False
+        self._last_flush_at = time.monotonic()
+        self._workers: List[threading.Thread] = []
+        self._errors: List[str] = []
+        self.warn_logger: Callable[[str], None] | None = None
+
+    def open(self) -> None:
+        if self._handle is not None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            handle = open(self.path, "ab")
+            size = handle.tell()
+            if size > 0:
+                with open(self.path, "rb") as probe:
+                    probe.seek(-1, os.SEEK_END)
+                    if probe.read(1) != b"\n":
+                        # Baris terakhir terpotong (crash di tengah write): tutup dulu supaya record baru tetap valid.
+                        handle.write(b"\n")
+                        size += 1
+        except OSError as exc:
+            raise ConfigError(f"Jurnal bet tidak bisa dibuka ({self.path}): {exc}") from exc
+        self._handle = handle
+        self._segment_bytes = size
+        if self.compression != "off":
+            # Segmen hasil rotasi yang belum sempat dikompres (misal proses mati) diselesaikan sekarang.
+            # Hanya nama hasil rotasi; file lain dengan stem sama (mis. jurnal paper bets.paper.jsonl) tidak disentuh.
+            for segment in sorted(self.path.parent.glob(f"{self.path.stem}.*{self.path.suffix}")):
+                if JOURNAL_SEGMENT_PATTERN.search(segment.name[: -len(self.path.suffix) or None]):
+                    self._start_compress(segment)
+
+    def record(self, fields: Dict[str, Any]) -> None:
+        line = (json.dumps(fields, separators=(",", ":"), ensure_ascii=False) + "\n").encode()
+        self._pending.append(line)
+        self._pending_bytes += len(line)
+        self.record_count += 1
+        if self.fsync_policy == "always":
+            self.flush(sync=True)
+
+    def maintain(self) -> None:
+        now = time.monotonic()
+        if self._pending_bytes >= self.BUFFER_LIMIT_BYTES or now - self._last_flush_at >= self.flush_interval:
+            self.flush(sync=self.fsync_policy != "off")
+        self._report_errors()
+
+    def flush(self, sync: bool = False) -> None:
+        self._last_flush_at = time.monotonic()
+        if self._handle is None:
+            return
+        try:
+            if self._pending:
+                data = b"".join(self._pending)
+                self._pending.clear()
+                self._pending_bytes = 0
+                self._handle.write(data)
+                self._handle.flush()
+                self._segment_bytes += len(data)
+                self._unsynced = True
+            if sync and self._unsynced:
+                os.fsync(self._handle.fileno())
+                self._unsynced = False
+            if self.rotate_bytes > 0 and self._segment_bytes >= self.rotate_bytes:
+                self._rotate()
+        except OSError as exc:
+            self._errors.append(f"write {self.path}: {exc}")
+
+    def close(self) -> None:
+        self.flush(sync=self.fsync_policy != "off")
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+        for worker in self._workers:
+            worker.join()
+        self._workers.clear()
+        self._report_errors()
+
+    def _rotate(self) -> None:
+        # Handle lama tetap dipakai sampai rename dan file baru sama-sama berhasil; kalau rotasi gagal,
+        # bet berikutnya tetap ditulis ke segmen sekarang dan rotasi dicoba lagi setelah rotate_bytes berikutnya.
+        os.fsync(self._handle.fileno())
+        self._unsynced = False
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        sequence = 1
+        while True:
+            target = self.path.with_name(f"{self.path.stem}.{stamp}.{sequence}{self.path.suffix}")
+            if not any(self.path.parent.glob(target.name + "*")):
+                break
+            sequence += 1
+        try:
+            os.replace(self.path, target)
+        except OSError:
+            self._segment_bytes = 0
+            raise
+        try:
+            handle = open(self.path, "ab")
+        except OSError:
+            self._segment_bytes = 0
+            try:
+                os.replace(target, self.path)
+            except OSError:
+                # Handle lama masih menunjuk ke segmen yang sudah di-rename, jadi record tetap tersimpan di sana.
+                pass
+            raise
+        old_handle, self._handle = self._handle, handle
+        old_handle.close()
+        self.rotated_count += 1
+        self._segment_bytes = 0
+        if self.compression != "off":
+            self._start_compress(target)
+
+    def _start_compress(self, segment: Path) -> None:
+        self._workers = [worker for worker in self._workers if worker.is_alive()]
+        worker = threading.Thread(target=self._compress, args=(segment,), name="journal-compress", daemon=True)
+        self._workers.append(worker)
+        worker.start()
+
+    def _compress(self, segment: Path) -> None:
+        if self.compression == "lzma":
+            opener: Callable[..., Any] = lzma.open
+            target = segment.with_name(segment.name + ".xz")
+        else:
+            opener = gzip.open
+            target = segment.with_name(segment.name + ".gz")
+        partial = target.with_name(target.name + ".tmp")
+        try:
+            with open(segment, "rb") as source, opener(partial, "wb") as sink:
+                shutil.copyfileobj(source, sink, 1024 * 1024)
+            with open(partial, "rb") as written:
+                os.fsync(written.fileno())
+            # Segmen asli baru dihapus setelah file terkompres utuh di disk.
+            os.replace(partial, target)
+            segment.unlink()
+        except OSError as exc:
+            self._errors.append(f"kompres {segment.name}: {exc}")
+
+    def _report_errors(self) -> None:
+        while self._errors:
+            message = f"[WARN] Jurnal bet gagal ({self._errors.pop(0)})."
+            if self.warn_logger is not None:
+                self.warn_logger(message)
+            else:
+                print(THEME_SECONDARY + message)
+
+
+class SessionCheckpoint:
+    # Snapshot progresi strategi + total sesi, ditulis atomik (file .tmp lalu os.replace) setiap bet.
+    # Pembaca selalu melihat checkpoint lama atau baru yang utuh, tidak pernah setengah tertulis.
+    VERSION = 1
+
+    def __init__(self, path: str, fsync: bool) -> None:
+        self.path = Path(path)
+        self.fsync = fsync
+        self.write_count = 0
+        self.warn_logger: Callable[[str], None] | None = None
+        self._partial = self.path.with_name(self.path.name + ".tmp")
+        self._failing = False
+
+    def save(self, state: Dict[str, Any]) -> None:
+        data = json.dumps({"version": self.VERSION, **state}, separators=(",", ":")).encode()
+        try:
+            if self.write_count == 0:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self._partial, "wb") as handle:
+                handle.write(data)
+                if self.fsync:
+                    handle.flush()
+                    os.fsync(handle.fileno())
+            os.replace(self._partial, self.path)
+        except OSError as exc:
+            # Cukup sekali warning per rangkaian gagal; bet tetap jalan tanpa checkpoint baru.
+            if not self._failing and self.warn_logger is not None:
+                self.warn_logger(f"[WARN] Checkpoint gagal ditulis ({self.path}): {exc}")
+            self._failing = True
+            return
+        self._failing = False
+        self.write_count += 1
+
+    def load(self) -> Dict[str, Any]:
+        try:
+            state = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError as exc:
+            raise ConfigError(f"--resume: checkpoint {self.path} tidak ditemukan.") from exc
+        except (OSError, ValueError) as exc:
+            raise ConfigError(f"--resume: checkpoint {self.path} tidak bisa dibaca: {exc}") from exc
+        if not isinstance(state, dict) or state.get("version") != self.VERSION:
+            raise ConfigError(f"--resume: format checkpoint {self.path} tidak dikenali.")
+        return state
+
+
+class StrategyState:
+    __slots__ = ("amount", "step", "cooldown")
+
+    def __init__(self, amount: int) -> None:
+        self.reset(amount)
+
+    def reset(self, amount: int) -> None:
+        self.amount = amount
+        self.step = 0
+        self.cooldown = 0
+
+
+class StrategyContext:
+    # Data sesi yang dibaca strategi. DiceBot punya atribut dengan nama yang sama,
+    # jadi bot bisa langsung dipakai sebagai context tanpa salinan.
+    # Balance/profit dalam satuan 1e-8 (int), multiplier tetap Decimal.
+    __slots__ = (
+        "consecutive_losses",
+        "current_balance",
+        "total_profit",
+        "start_balance",
+        "multiplier",
+        "premium_target_profit_abs",
+    )
+
+    def __init__(self) -> None:
+        self.consecutive_losses = 0
+        self.current_balance = 0
+        self.total_profit = 0
+        self.start_balance = 0
+        self.multiplier = Decimal("0")
+        self.premium_target_profit_abs = 0
+
+
+class BetStrategy:
+    # Semua amount dalam satuan 1e-8 (int). Faktor Decimal dari config disimpan sebagai
+    # rasio integer eksak supaya hasil per bet sama dengan hitungan Decimal lalu ROUND_DOWN.
+    name = ""
+
+    def __init__(self, base_amount: int, coin_places: int) -> None:
+        self.base_amount = base_amount
+        self.coin_places = coin_places
+
+    def initial_state(self) -> StrategyState:
+        return StrategyState(self.base_amount)
+
+    def advance(self, state: StrategyState, won: bool, ctx: Any) -> int:
+        raise NotImplementedError
+
+    def rebase(self, base_amount: int) -> None:
+        self.base_amount = base_amount
+
+    def _settle(self, state: StrategyState, numerator: int, denominator: int = 1) -> int:
+        state.amount = normalize_coin_units(numerator, self.coin_places, denominator)
+        return state.amount
+
+    def _settle_decimal(self, state: StrategyState, amount: Decimal) -> int:
+        numerator, denominator = amount.as_integer_ratio()
+        return self._settle(state, numerator * COIN_UNIT, denominator)
+
+
+class FlatStrategy(BetStrategy):
+    name = "flat"
+
+    def advance(self, state: StrategyState, won: bool, ctx: Any) -> int:
+        return self._settle(state, self.base_amount)
+
+
+class MartingaleStrategy(BetStrategy):
+    name = "martingale"
+
+    def __init__(self, base_amount: int, coin_places: int, multiplier: Decimal) -> None:
+        super().__init__(base_amount, coin_places)
+        self.multiplier = multiplier
+        self.multiplier_ratio = multiplier.as_integer_ratio()
+
+    def advance(self, state: StrategyState, won: bool, ctx: Any) -> int:
+        if won:
+            return self._settle(state, self.base_amount)
+        numerator, denominator = self.multiplier_ratio
+        return self._settle(state, state.amount * numerator, denominator)
+
+
+class FibonacciStrategy(BetStrategy):
+    name = "fibonacci"
+
+    def __init__(self, base_amount: int, coin_places: int, unit: Decimal, step_back_on_win: int) -> None:
+        super().__init__(base_amount, coin_places)
+        self.unit = unit
+        self.unit_ratio = unit.as_integer_ratio()
+        self.step_back_on_win = step_back_on_win
+        self.sequence = [1, 1]
+
+    def fibonacci_value(self, index: int) -> int:
+        while index >= len(self.sequence):
+            self.sequence.append(self.sequence[-1] + self.sequence[-2])
+        return self.sequence[index]
+
+    def advance(self, state: StrategyState, won: bool, ctx: Any) -> int:
+        if won:
+            state.step = max(0, state.step - self.step_back_on_win)
+        else:
+            state.step += 1
+        numerator, denominator = self.unit_ratio
+        return self._settle(state, self.base_amount * numerator * self.fibonacci_value(state.step), denominator)
+
+
+class ParoliStrategy(BetStrategy):
+    name = "paroli"
+
+    def __init__(self, base_amount: int, coin_places: int, multiplier: Decimal, max_win_streak: int) -> None:
+        super().__init__(base_amount, coin_places)
+        self.multiplier = multiplier
+        self.multiplier_ratio = multiplier.as_integer_ratio()
+        self.max_win_streak = max_win_streak
+
+    def advance(self, state: StrategyState, won: bool, ctx: Any) -> int:
+        if not won:
+            state.step = 0
+            return self._settle(state, self.base_amount)
+        state.step += 1
+        if state.step >= self.max_win_streak:
+            state.step = 0
+            return self._settle(state, self.base_amount)
+        numerator, denominator = self.multiplier_ratio
+        return self._settle(state, state.amount * numerator, denominator)
+
+
+class DalembertStrategy(BetStrategy):
+    name = "dalembert"
+
+    def __init__(self, base_amount: int, coin_places: int, step: Decimal) -> None:
+        super().__init__(base_amount, coin_places)
+        self.step = step
+        self.step_ratio = step.as_integer_ratio()
+
+    def advance(self, state: StrategyState, won: bool, ctx: Any) -> int:
+        if won:
+            state.step = max(0, state.step - 1)
+        else:
+            state.step += 1
+        # base + base * step * level, dihitung eksak dalam satu pecahan.
+        numerator, denominator = self.step_ratio
+        return self._settle(state, self.base_amount * (denominator + numerator * state.step), denominator)
+
+
+class StepLadderStrategy(BetStrategy):
+    # Preset berbasis step (mining, mining_v2, pro_safe, pro_recovery, premium_*):
+    # transisi step dan skala per step dihitung sekali saat compile.
+    name = "step_ladder"
+
+    def __init__(
+        self,
+        base_amount: int,
+        coin_places: int,
+        loss_multiplier: Decimal,
+        max_steps: int,
+        recovery_steps_on_win: int,
+        max_scale: Decimal,
+        cooldown_trigger_losses: int = 0,
+        cooldown_rounds: int = 0,
+        cooldown_after_trigger: int | None = None,
+        cooldown_recovery_steps_on_win: int | None = None,
+    ) -> None:
+        super().__init__(base_amount, coin_places)
+        self.loss_multiplier = loss_multiplier
+        self.max_steps = max_steps
+        self.recovery_steps_on_win = recovery_steps_on_win
+        self.max_scale = max_scale
+        self.cooldown_trigger_losses = cooldown_trigger_losses
+        self.cooldown_rounds = cooldown_rounds
+        self.cooldown_enabled = cooldown_trigger_losses > 0 and cooldown_rounds > 0
+        if cooldown_after_trigger is None:
+            cooldown_after_trigger = cooldown_rounds
+        if cooldown_recovery_steps_on_win is None:
+            cooldown_recovery_steps_on_win = recovery_steps_on_win
+        self.cooldown_after_trigger = cooldown_after_trigger
+
+        steps = range(max_steps + 1)
+        self.loss_next = tuple(min(max_steps, step + 1) for step in steps)
+        self.win_next = tuple(max(0, step - recovery_steps_on_win) for step in steps)
+        self.cooldown_win_next = tuple(max(0, step - cooldown_recovery_steps_on_win) for step in steps)
+        self.raw_scales = tuple(loss_multiplier ** step for step in steps)
+        scales = []
+        for scale in self.raw_scales:
+            if scale > max_scale:
+                scale = max_scale
+            scales.append(scale)
+        self.scales = tuple(scales)
+        self.scale_ratios = tuple(scale.as_integer_ratio() for scale in self.scales)
+        self._build_ladder()
+
+    def _build_ladder(self) -> None:
+        # Amount final per step (sudah dinormalisasi ke grid coin), dibangun ulang hanya saat base berubah.
+        self.ladder = tuple(
+            normalize_coin_units(self.base_amount * numerator, self.coin_places, denominator)
+            for numerator, denominator in self.scale_ratios
+        )
+        self.rest_amount = normalize_coin_units(self.base_amount, self.coin_places)
+
+    def rebase(self, base_amount: int) -> None:
+        if base_amount == self.base_amount:
+            return
+        self.base_amount = base_amount
+        self._build_ladder()
+
+    def _step_amount(self, state: StrategyState, ctx: Any) -> int:
+        state.amount = self.ladder[state.step]
+        return state.amount
+
+    def advance(self, state: StrategyState, won: bool, ctx: Any) -> int:
+        if state.cooldown > 0:
+            state.step = (self.cooldown_win_next if won else self.loss_next)[state.step]
+            state.cooldown -= 1
+            state.amount = self.rest_amount
+            return state.amount
+
+        if won:
+            state.step = self.win_next[state.step]
+        else:
+            state.step = self.loss_next[state.step]
+            if self.cooldown_enabled and ctx.consecutive_losses >= self.cooldown_trigger_losses:
+                state.cooldown = self.cooldown_after_trigger
+                state.amount = self.rest_amount
+                return state.amount
+        return self._step_amount(state, ctx)
+
+
+class PremiumGuardStrategy(StepLadderStrategy):
+    name = "premium_guard"
+
+    def __init__(self, base_amount: int, coin_places: int, risk_percent: Decimal, **ladder: Any) -> None:
+        super().__init__(base_amount, coin_places, **ladder)
+        self.risk_percent = risk_percent
+
+    def advance(self, state: StrategyState, won: bool, ctx: Any) -> int:
+        if ctx.current_balance <= 0:
+            return self._settle(state, self.base_amount)
+        return super().advance(state, won, ctx)
+
+    def _step_amount(self, state: StrategyState, ctx: Any) -> int:
+        base_amount = units_to_decimal(self.base_amount)
+        scaled_amount = base_amount * self.scales[state.step]
+        risk_cap_amount = units_to_decimal(ctx.current_balance) * self.risk_percent / Decimal("100")
+        if risk_cap_amount > Decimal("0"):
+            scaled_amount = min(scaled_amount, risk_cap_amount)
+        return self._settle_decimal(state, max(base_amount, scaled_amount))
+
+
+class PremiumCompoundStrategy(StepLadderStrategy):
+    name = "premium_compound"
+
+    def __init__(self, base_amount: int, coin_places: int, profit_boost_percent: Decimal, **ladder: Any) -> None:
+        super().__init__(base_amount, coin_places, **ladder)
+        self.profit_boost_percent = profit_boost_percent
+
+    def _step_amount(self, state: StrategyState, ctx: Any) -> int:
+        scale = self.raw_scales[state.step]
+        boost_scale = Decimal("1")
+        if ctx.start_balance > 0 and ctx.total_profit > 0 and self.profit_boost_percent > Decimal("0"):
+            boost_scale += (Decimal(ctx.total_profit) / Decimal(ctx.start_balance)) * self.profit_boost_percent / Decimal("100")
+        scale = scale * boost_scale
+        if scale > self.max_scale:
+            scale = self.max_scale
+        return self._settle_decimal(state, units_to_decimal(self.base_amount) * scale)
+
+
+class PremiumStrategy(StepLadderStrategy):
+    name = "premium"
+
+    def __init__(
+        self,
+        base_amount: int,
+        coin_places: int,
+        risk_percent: Decimal,
+        max_risk_percent: Decimal,
+        **ladder: Any,
+    ) -> None:
+        super().__init__(base_amount, coin_places, **ladder)
+        self.risk_percent = risk_percent
+        self.max_risk_percent = max_risk_percent
+
+    def advance(self, state: StrategyState, won: bool, ctx: Any) -> int:
+        if ctx.current_balance <= 0:
+            return self._settle(state, self.base_amount)
+        return super().advance(state, won, ctx)
+
+    def _step_amount(self, state: StrategyState, ctx: Any) -> int:
+        base_amount = units_to_decimal(self.base_amount)
+        scale = self.scales[state.step]
+        scaled_amount = base_amount * scale
+
+        risk_percent = self.risk_percent * scale
+        if risk_percent > self.max_risk_percent:
+            risk_percent = self.max_risk_percent
+        risk_cap_amount = units_to_decimal(ctx.current_balance) * risk_percent / Decimal("100")
+
+        target_cap_amount = scaled_amount
+        if ctx.premium_target_profit_abs > 0:
+            remaining_target = units_to_decimal(ctx.premium_target_profit_abs - ctx.total_profit)
+            if remaining_target > Decimal("0") and ctx.multiplier > Decimal("1"):
+                amount_to_target = remaining_target / (ctx.multiplier - Decimal("1"))
+                if amount_to_target > Decimal("0"):
+                    target_cap_amount = min(target_cap_amount, amount_to_target)
+
+        capped_amount = scaled_amount
+        if risk_cap_amount > Decimal("0"):
+            capped_amount = min(capped_amount, risk_cap_amount)
+        capped_amount = min(capped_amount, target_cap_amount)
+        return self._settle_decimal(state, max(base_amount, capped_amount))
+
+
+class CustomStrategy(BetStrategy):
+    name = "custom"
+
+    def __init__(
+        self,
+        base_amount: int,
+        coin_places: int,
+        on_win_reset: bool,
+        on_win_multiplier: Decimal,
+        on_win_addition: Decimal,
+        on_loss_reset: bool,
+        on_loss_multiplier: Decimal,
+        on_loss_addition: Decimal,
+    ) -> None:
+        super().__init__(base_amount, coin_places)
+        self.on_win_reset = on_win_reset
+        self.on_win_multiplier = on_win_multiplier
+        self.on_win_addition = on_win_addition
+        self.on_loss_reset = on_loss_reset
+        self.on_loss_multiplier = on_loss_multiplier
+        self.on_loss_addition = on_loss_addition
+        self.on_win_terms = self._linear_terms(on_win_multiplier, on_win_addition)
+        self.on_loss_terms = self._linear_terms(on_loss_multiplier, on_loss_addition)
+
+    @staticmethod
+    def _linear_terms(multiplier: Decimal, addition: Decimal) -> Tuple[int, int, int]:
+        # amount * multiplier + addition == (amount * a + b) / c, eksak untuk addition > 8 desimal.
+        mul_num, mul_den = multiplier.as_integer_ratio()
+        add_num, add_den = addition.as_integer_ratio()
+        return mul_num * add_den, add_num * COIN_UNIT * mul_den, mul_den * add_den
+
+    def advance(self, state: StrategyState, won: bool, ctx: Any) -> int:
+        if won:
+            if self.on_win_reset:
+                return self._settle(state, self.base_amount)
+            factor, offset, denominator = self.on_win_terms
+        else:
+            if self.on_loss_reset:
+                return self._settle(state, self.base_amount)
+            factor, offset, denominator = self.on_loss_terms
+        return self._settle(state, state.amount * factor + offset, denominator)
+
+
+class RuinEstimate(NamedTuple):
+    probabilities: Dict[str, float]
+    running: float
+    expected_bets: float
+    steps: int
+    horizon: int
+    nodes: int
+    cells: int
+    elapsed: float
+
+    @property
+    def truncated(self) -> bool:
+        return self.running >= RUIN_MASS_EPSILON and self.steps < self.horizon * RUIN_MIN_EXACT_FRACTION
+
+
+class RuinSolver:
+    # Risk of ruin eksak untuk preset step ladder (mining, mining_v2, pro_safe, pro_recovery). Rantai Markov
+    # dengan state (profit, node strategi); node = amount, step, cooldown, loss/win beruntun, dan rule. Node
+    # dienumerasi lewat StepLadderStrategy.advance asli, jadi transisinya sama dengan DiceBot bet per bet.
+    # Profit disimpan di lattice kelipatan FPB semua amount/profit, distribusinya dirambatkan bet per bet
+    # sampai semua massa peluang berhenti atau horizon habis.
+    def __init__(
+        self,
+        bot: Any,
+        start_balance: int,
+        total_profit: int = 0,
+        state: StrategyState | None = None,
+        consecutive_losses: int = 0,
+        consecutive_wins: int = 0,
+        bets_done: int = 0,
+        horizon: int | None = None,
+    ) -> None:
+        if np is None:
+            raise ConfigError("butuh numpy (pip install numpy)")
+        strategy = bot.strategy
+        if type(strategy) is not StepLadderStrategy:
+            raise ConfigError("hanya untuk preset mining, mining_v2, pro_safe, pro_recovery")
+        if bot.simple_mode_enabled and bot.simple_chance_random_enabled:
+            raise ConfigError("simple.chance_random=ON belum didukung (pair harus tetap)")
+        if bot.trailing_drawdown_units is not None or bot.trailing_drawdown_ratio is not None:
+            raise ConfigError("trailing drawdown bergantung puncak profit, belum didukung")
+        if start_balance <= 0:
+            raise ConfigError("balance awal harus > 0")
+
+        self.start_balance = start_balance
+        if horizon is None:
+            horizon = bot.max_bets - bets_done if bot.max_bets > 0 else RUIN_HORIZON_BETS
+        self.horizon = horizon
+        self._build_nodes(bot, strategy, state, consecutive_losses, consecutive_wins)
+        self._build_lattice(bot, total_profit)
+
+    def _rule_outcomes(self, bot: Any) -> Tuple[Tuple[str, ...], Dict[str, Tuple[Decimal, Decimal]], bool]:
+        # Mode simple: rule ditentukan ulang tiap bet (tetap / random 50:50), switch rule tidak berlaku.
+        if bot.simple_mode_enabled:
+            rules = ("under", "over") if bot.simple_hilo_random else (bot.simple_fixed_rule,)
+            per_bet = bot.simple_hilo_random
+        else:
+            rules = (bot.rule,)
+            if bot.switch_rule_on_win or bot.switch_rule_on_loss:
+                rules += ("over" if bot.rule == "under" else "under",)
+            per_bet = False
+        sync_mode = bot._effective_sync_mode()
+        precision = (bot.bet_value_precision, bot.multiplier_precision)
+        first = synced_bet_pair(rules[0], bot.bet_value, bot.multiplier, *precision, sync_mode)
+        pairs = {rules[0]: first}
+        if len(rules) > 1:
+            other = synced_bet_pair(rules[1], *first, *precision, sync_mode)
+            if synced_bet_pair(rules[0], *other, *precision, sync_mode) != first:
+                raise ConfigError("pair bet_value/multiplier tidak stabil saat ganti rule")
+            pairs[rules[1]] = other
+        return rules, pairs, per_bet
+
+    def _build_nodes(
+        self, bot: Any, strategy: StepLadderStrategy, state: StrategyState | None, losses: int, wins: int
+    ) -> None:
+        rules, pairs, per_bet = self._rule_outcomes(bot)
+        win_odds: Dict[str, Tuple[float, Decimal]] = {}
+        for rule, (bet_value, multiplier) in pairs.items():
+            scaled = bet_value * 100
+            winning = math.ceil(scaled) if rule == "under" else 9999 - math.floor(scaled)
+            win_odds[rule] = (winning / 10000, multiplier)
+
+        # Loss/win beruntun hanya perlu dihitung sampai batas terbesar yang dicek (cooldown / max_consecutive_*).
+        loss_cap = max(strategy.cooldown_trigger_losses if strategy.cooldown_enabled else 0, bot.max_consecutive_losses)
+        win_cap = bot.max_consecutive_wins
+        ctx = StrategyContext()
+        if state is None:
+            state = strategy.initial_state()
+        start_rule = None if per_bet else rules[0]
+        start = (
+            bot._normalize_amount(state.amount), state.step, state.cooldown,
+            min(losses, loss_cap), min(wins, win_cap), start_rule,
+        )
+        index = {start: 0}
+        queue = [start]
+        # outcomes[k] = [(peluang, delta profit, node tujuan), ...]
+        self.outcomes: List[List[Tuple[float, int, int]]] = []
+        self.amounts: List[int] = []
+        self.node_stop: List[bool] = []
+        while len(self.outcomes) < len(queue):
+            amount, step, cooldown, node_losses, node_wins, rule = queue[len(self.outcomes)]
+            self.amounts.append(amount)
+            self.node_stop.append(
+                (bot.max_consecutive_losses > 0 and node_losses >= bot.max_consecutive_losses)
+                or (win_cap > 0 and node_wins >= win_cap)
+                or (bot.max_amount_units is not None and amount > bot.max_amount_units)
+            )
+            bet_rules = rules if rule is None else (rule,)
+            rule_weight = 1 / len(bet_rules)
+            transitions: List[Tuple[float, int, int]] = []
+            for bet_rule in bet_rules:
+                win_probability, multiplier = win_odds[bet_rule]
+                for won in (True, False):
+                    next_rule = rule
+                    if rule is not None and (
+                        (won and bot.switch_rule_on_win) or (not won and bot.switch_rule_on_loss)
+                    ):
+                        next_rule = rules[1] if rule == rules[0] else rules[0]
+                    next_losses = 0 if won else min(node_losses + 1, loss_cap)
+                    next_wins = min(node_wins + 1, win_cap) if won else 0
+                    ctx.consecutive_losses = next_losses
+                    probe = StrategyState(amount)
+                    probe.step, probe.cooldown = step, cooldown
+                    next_amount = bot._normalize_amount(strategy.advance(probe, won, ctx))
+                    target = (next_amount, probe.step, probe.cooldown, next_losses, next_wins, next_rule)
+                    if target not in index:
+                        index[target] = len(queue)
+                        queue.append(target)
+                    probability = rule_weight * (win_probability if won else 1 - win_probability)
+                    delta = payout_profit(amount, multiplier) if won else -amount
+                    transitions.append((probability, delta, index[target]))
+            self.outcomes.append(transitions)
+
+    def _build_lattice(self, bot: Any, total_profit: int) -> None:
+        deltas = [delta for transitions in self.outcomes for _, delta, _ in transitions if delta != 0]
+        self.unit = functools.reduce(math.gcd, deltas + [abs(total_profit)], 0) or 1
+        unit = self.unit
+        # Profit selalu kelipatan unit; semua batas stop diterjemahkan ke index lattice.
+        self.start_index = total_profit // unit
+        self.target_index = -(-bot.target_profit_units // unit) if bot.target_profit_units is not None else None
+        self.stop_loss_index = bot.stop_loss_units // unit if bot.stop_loss_units is not None else None
+        self.balance_index = (
+            (bot.stop_on_balance_below_units - self.start_balance) // unit
+            if bot.stop_on_balance_below_units is not None
+            else None
+        )
+        # Amount tidak pernah melebihi balance, jadi profit tidak pernah di bawah -start_balance.
+        self.floor_index = -(self.start_balance // unit)
+        self.max_down = max(-delta for transitions in self.outcomes for _, delta, _ in transitions) // unit
+        self.max_up = max(0, max(delta for transitions in self.outcomes for _, delta, _ in transitions)) // unit
+
+    def _window(self, horizon: int) -> Tuple[int, int]:
+        low = max(self.floor_index, self.start_index - horizon * self.max_down)
+        # Di bawah stop_loss/balance_stop massa sudah berhenti, jadi paling jauh turun satu bet lagi.
+        stops = [index for index in (self.stop_loss_index, self.balance_index) if index is not None]
+        if stops:
+            low = max(low, min(self.start_index, max(stops)) - self.max_down)
+        high = self.start_index + horizon * self.max_up
+        if self.target_index is not None:
+            high = min(high, max(self.start_index, self.target_index - 1) + self.max_up)
+        return low, high
+
+    def _fit_horizon(self) -> int:
+        # Horizon dipotong kalau lattice (node x profit) melebihi RUIN_MAX_CELLS.
+        nodes = len(self.outcomes)
+        low, high = self._window(self.horizon)
+        if nodes * (high - low + 1) <= RUIN_MAX_CELLS:
+            return self.horizon
+        lo_h, hi_h = 0, self.horizon
+        while lo_h < hi_h:
+            middle = (lo_h + hi_h + 1) // 2
+            low, high = self._window(middle)
+            if nodes * (high - low + 1) <= RUIN_MAX_CELLS:
+                lo_h = middle
+            else:
+                hi_h = middle - 1
+        if lo_h <= 0:
+            raise ConfigError(f"lattice terlalu besar ({nodes} node, unit {self.unit}); pakai simulator.py")
+        return lo_h
+
+    def _reason_map(self, low: int, width: int) -> "np.ndarray":
+        # 0 = masih jalan, selain itu index RUIN_REASONS + 1. Urutan cek sama dengan DiceBot.stop_reason
+        # (target > stop_loss > balance_stop > streak/max_amount), lalu amount > balance.
+        profits = np.arange(low, low + width, dtype=np.int64)
+        reasons = np.zeros((len(self.outcomes), width), dtype=np.int8)
+        for node, amount in enumerate(self.amounts):
+            insufficient_index = -(-(amount - self.start_balance) // self.unit) - 1
+            reasons[node, profits <= insufficient_index] = 3
+        reasons[np.array(self.node_stop, dtype=bool), :] = 4
+        if self.balance_index is not None:
+            reasons[:, profits <= self.balance_index] = 3
+        if self.stop_loss_index is not None:
+            reasons[:, profits <= self.stop_loss_index] = 2
+        if self.target_index is not None:
+            reasons[:, profits >= self.target_index] = 1
+        return reasons
+
+    def solve(self, time_budget: float = RUIN_TIME_BUDGET_SECONDS) -> RuinEstimate:
+        started = time.perf_counter()
+        horizon = self._fit_horizon()
+        low, high = self._window(horizon)
+        width = high - low + 1
+        nodes = len(self.outcomes)
+        reasons = self._reason_map(low, width)
+        # Sel yang masih jalan di tiap baris selalu satu rentang [lo, hi]: sisi kiri berhenti karena
+        # stop_loss/balance, sisi kanan karena target, baris streak/max_amount berhenti semua (lo > hi).
+        bounds: List[Tuple[int, int]] = []
+        for node in range(nodes):
+            running_cells = np.flatnonzero(reasons[node] == 0)
+            bounds.append((int(running_cells[0]), int(running_cells[-1])) if running_cells.size else (width, -1))
+        mass = np.zeros((nodes, width))
+        spare = np.zeros((nodes, width))
+        stopped = np.zeros((nodes, width))
+        origin = self.start_index - low
+        lo, hi = bounds[0]
+        absorbed = 0.0
+        if lo <= origin <= hi:
+            mass[0, origin] = 1.0
+        else:
+            stopped[0, origin] = absorbed = 1.0
+
+        plans = [
+            [(probability, delta // self.unit, target) for probability, delta, target in transitions]
+            for transitions in self.outcomes
+        ]
+        expected_bets = 0.0
+        left, right = origin, origin
+        steps = 0
+        while steps < horizon:
+            running = 1.0 - absorbed
+            if running < RUIN_MASS_EPSILON:
+                break
+            expected_bets += running
+            next_left = max(0, left - self.max_down)
+            next_right = min(width - 1, right + self.max_up)
+            # Window hanya melebar, jadi cukup nolkan bagian buffer yang akan ditulis.
+            step_mass = spare
+            step_mass[:, next_left:next_right + 1] = 0.0
+            for node, transitions in enumerate(plans):
+                lo, hi = bounds[node]
+                lo, hi = max(left, lo), min(right, hi)
+                if lo > hi:
+                    continue
+                row = mass[node]
+                for probability, shift, target in transitions:
+                    src_left = max(lo, -shift)
+                    src_right = min(hi, width - 1 - shift)
+                    if src_left <= src_right:
+                        step_mass[target, src_left + shift:src_right + shift + 1] += probability * row[src_left:src_right + 1]
+            left, right = next_left, next_right
+            # Pindahkan massa yang jatuh di sel berhenti ke `stopped`; cukup potong di luar rentang jalan tiap baris.
+            for node, (lo, hi) in enumerate(bounds):
+                for cut_left, cut_right in ((left, min(lo - 1, right)), (max(hi + 1, left), right)):
+                    if cut_left > cut_right:
+                        continue
+                    segment = step_mass[node, cut_left:cut_right + 1]
+                    total = float(segment.sum())
+                    if total:
+                        absorbed += total
+                        stopped[node, cut_left:cut_right + 1] += segment
+                        segment[:] = 0.0
+                    if lo > hi:
+                        break
+            mass, spare = step_mass, mass
+            steps += 1
+            if steps % 64 == 0 and time.perf_counter() - started > time_budget:
+                break
+
+        probabilities = {
+            reason: float(stopped[reasons == code + 1].sum()) for code, reason in enumerate(RUIN_REASONS)
+        }
+        return RuinEstimate(
+            probabilities,
+            max(0.0, 1.0 - absorbed),
+            expected_bets,
+            steps,
+            self.horizon,
+            nodes,
+            nodes * width,
+            time.perf_counter() - started,
+        )
+
+
+class ShadowStrategy:
+    # Strategi bayangan: preset/config lain yang ikut dihitung di roll live yang sama tanpa kirim bet.
+    # Engine-nya DiceBot offline (strategi hasil compile + stop_reason yang sama dengan bot live) dan
+    # dijalankan di jendela sleep setelah bet live selesai, jadi tidak menambah latency bet.
+    def __init__(self, label: str, engine: "DiceBot") -> None:
+        self.label = label
+        self.engine = engine
+        self.start_balance: int | None = None
+        self.balance = 0
+        self.peak_balance = 0
+        self.max_drawdown = 0
+        self.bets = 0
+        self.wagered = 0
+        self.active = False
+        self.halted = False
+        self.stops: Dict[str, int] = {}
+        self.last_stop = ""
+        self.last_stop_bet = 0
+
+    def begin(self, balance: int) -> None:
+        # Saldo awal = saldo live saat sesi pertama mulai; replay sesi live tidak mereset shadow.
+        if self.start_balance is None:
+            self.start_balance = self.balance = self.peak_balance = balance
+
+    def observe(self, roll: int) -> str:
+        # Return alasan stop kalau sesi shadow berhenti di roll ini. Sesi shadow berikutnya mulai di roll
+        # live berikutnya dengan balance terakhir, sama seperti backtest.py.
+        if self.halted or self.start_balance is None:
+            return ""
+        engine = self.engine
+        if not self.active:
+            engine._reset_session_runtime()
+            engine.start_balance = engine.current_balance = self.balance
+            engine.api_balance = engine.estimated_balance = self.balance
+            engine._init_premium_targets()
+            self.active = True
+            reason = self._stop_check()
+            if reason:
+                # Berhenti sebelum bet pertama (mis. balance kurang dari base amount): sesi berikutnya pasti sama.
+                self.halted = True
+                return self._record_stop(reason)
+
+        amount = engine.current_amount
+        won = engine.replay_roll(roll)
+        self.bets += 1
+        self.wagered += amount
+        self.balance = engine.current_balance
+        if self.balance > self.peak_balance:
+            self.peak_balance = self.balance
+        elif self.peak_balance - self.balance > self.max_drawdown:
+            self.max_drawdown = self.peak_balance - self.balance
+        try:
+            engine.apply_strategy("win" if won else "loss")
+            reason = self._stop_check()
+        except ConfigError as exc:
+            reason = f"Strategi error: {exc}"
+        return self._record_stop(reason) if reason else ""
+
+    def _stop_check(self) -> str:
+        engine = self.engine
+        engine.current_amount = engine._normalize_amount(engine.current_amount)
+        reason = engine.stop_reason()
+        if not reason and engine.current_amount > engine.current_balance:
+            reason = "Current amount melebihi current balance"
+        return reason
+
+    def _record_stop(self, reason: str) -> str:
+        self.active = False
+        self.stops[reason] = self.stops.get(reason, 0) + 1
+        self.last_stop = reason
+        self.last_stop_bet = self.bets
+        return reason
+
+
 class DiceBot:
-    def __init__(self, cfg: Dict[str, Any], client: WolfbetClient) -> None:
+    def __init__(self, cfg: Dict[str, Any], client: WolfbetClient | PaperClient, resume: bool = False) -> None:
         self.cfg = cfg
         self.client = client
+        self.resume_requested = resume
+        self.connection_warmup_seconds = 0.0
+        self.paper_mode = isinstance(client, PaperClient)
+        # Paper tanpa realtime: jeda antar bet dan jeda replay dilewati supaya simulasi jalan secepat CPU.
+        self.paper_fast = self.paper_mode and not parse_toggle(
+            (cfg.get("paper", {}) or {}).get("realtime", "OFF"), "paper.realtime"
+        )
 
         bot = cfg["bot"]
         self.currency = str(bot["currency"]).lower()
@@ -788,11 +2962,32 @@ class DiceBot:
             raise ConfigError("bot.bet_value_precision harus 0-8.")
 
         self.delay_seconds = float(bot["delay_seconds"])
+        self.scheduler = BetScheduler(0.0 if self.paper_fast else self.delay_seconds)
         self.max_bets = int(bot["max_bets"])
         self.target_profit = to_decimal(bot["target_profit"], "bot.target_profit")
         self.stop_loss = to_decimal(bot["stop_loss"], "bot.stop_loss")
         self.stop_on_balance_below = to_decimal(bot["stop_on_balance_below"], "bot.stop_on_balance_below")
         self.max_amount = to_decimal(bot["max_amount"], "bot.max_amount")
+        # Batas stop dalam satuan 1e-8, dibulatkan supaya perbandingan integer = perbandingan Decimal.
+        # stop_loss_units sudah negatif (batas bawah total_profit). None berarti batas OFF.
+        self.target_profit_units = coin_units_ceil(self.target_profit) if self.target_profit > 0 else None
+        self.stop_loss_units = -coin_units_ceil(self.stop_loss) if self.stop_loss > 0 else None
+        self.stop_on_balance_below_units = (
+            coin_units(self.stop_on_balance_below) if self.stop_on_balance_below > 0 else None
+        )
+        self.max_amount_units = coin_units(self.max_amount) if self.max_amount > 0 else None
+        # Trailing drawdown dihitung dari puncak total_profit sesi (RiskMetrics), tanpa scan history.
+        self.trailing_drawdown_stop = to_decimal(bot.get("trailing_drawdown_stop", 0), "bot.trailing_drawdown_stop")
+        self.trailing_drawdown_percent = to_decimal(
+            bot.get("trailing_drawdown_percent", 0), "bot.trailing_drawdown_percent"
+        )
+        self.trailing_drawdown_units = (
+            coin_units_ceil(self.trailing_drawdown_stop) if self.trailing_drawdown_stop > 0 else None
+        )
+        # Persen dibandingkan sebagai pecahan integer: drawdown * 100 * q >= p * peak_balance.
+        self.trailing_drawdown_ratio = (
+            self.trailing_drawdown_percent.as_integer_ratio() if self.trailing_drawdown_percent > 0 else None
+        )
         self.max_consecutive_losses = int(bot["max_consecutive_losses"])
         self.max_consecutive_wins = int(bot["max_consecutive_wins"])
         self.continue_on_api_error = parse_toggle(bot.get("continue_on_api_error", "ON"), "bot.continue_on_api_error")
@@ -814,6 +3009,10 @@ class DiceBot:
         self.sticky_stats_footer = parse_toggle(
             cfg["display"].get("sticky_stats_footer", "ON"), "display.sticky_stats_footer"
         )
+        self.footer_fps = int(cfg["display"].get("footer_fps", 10))
+        self.latency_footer = parse_toggle(cfg["display"].get("latency_footer", "OFF"), "display.latency_footer")
+        self.show_risk_of_ruin = parse_toggle(cfg["display"].get("risk_of_ruin", "ON"), "display.risk_of_ruin")
+        self.rolling_window = int(cfg["display"].get("rolling_window", 500))
         self.balance_sync_mode = str(cfg["display"].get("balance_sync_mode", "hybrid")).lower()
         self.balance_refresh_every = int(cfg["display"].get("balance_refresh_every", 20))
         self.show_idr_value = parse_toggle(cfg["display"].get("show_idr_value", "OFF"), "display.show_idr_value")
@@ -848,6 +3047,10 @@ class DiceBot:
 
         self.currency_display = self.currency.upper()
         self.sticky_footer_enabled = self.sticky_stats_footer and sys.stdout.isatty()
+        self.footer_frame_interval = 1 / self.footer_fps if self.footer_fps > 0 else 0.0
+        self._pending_lines: List[str] = []
+        self._footer_dirty = False
+        self._last_frame_at = 0.0
         self._sticky_region_active = False
         self._sticky_region_size: Tuple[int, int] = (0, 0)
         self.idr_coin_id = COINGECKO_IDS.get(self.currency)
@@ -856,12 +3059,37 @@ class DiceBot:
         self.idr_last_update_at = "--:--:--"
         self.idr_status = "OFF"
         self.idr_error_notified = False
+        self.idr_feed: IdrPriceFeed | None = None
         if self.show_idr_value:
             if self.idr_coin_id is None:
                 self.idr_status = "UNSUPPORTED"
                 self.show_idr_value = False
             else:
                 self.idr_status = "INIT"
+                self.idr_feed = IdrPriceFeed(self.idr_coin_id, self.idr_refresh_seconds)
+        journal_cfg = cfg.get("journal", {}) or {}
+        self.journal: BetJournal | None = None
+        if parse_toggle(journal_cfg.get("enabled", "ON"), "journal.enabled"):
+            journal_path = str(journal_cfg.get("path", "journal/bets.jsonl"))
+            self.journal = BetJournal(
+                paper_path(journal_path) if self.paper_mode else journal_path,
+                int(to_decimal(journal_cfg.get("rotate_mb", 16), "journal.rotate_mb") * 1024 * 1024),
+                str(journal_cfg.get("fsync", "interval")).lower(),
+                float(journal_cfg.get("flush_interval_seconds", 1.0)),
+                str(journal_cfg.get("compress", "zlib")).lower(),
+            )
+        self.session_id = ""
+        checkpoint_cfg = cfg.get("checkpoint", {}) or {}
+        self.checkpoint: SessionCheckpoint | None = None
+        if parse_toggle(checkpoint_cfg.get("enabled", "ON"), "checkpoint.enabled"):
+            checkpoint_path = str(checkpoint_cfg.get("path", "journal/checkpoint.json"))
+            self.checkpoint = SessionCheckpoint(
+                paper_path(checkpoint_path) if self.paper_mode else checkpoint_path,
+                parse_toggle(checkpoint_cfg.get("fsync", "OFF"), "checkpoint.fsync"),
+            )
+        if self.resume_requested and self.checkpoint is None:
+            raise ConfigError("--resume butuh checkpoint.enabled=ON.")
+        self._checkpoint_fingerprint = ""
         simple_cfg = cfg.get("simple", {})
         if simple_cfg is None:
             simple_cfg = {}
@@ -915,7 +3143,7 @@ class DiceBot:
             self.simple_replay_count = 0
             self.simple_fixed_rule = self.rule
         self.base_amount_before_normalize = self.base_amount
-        self.base_amount = self._normalize_amount(self.base_amount)
+        self.base_amount = coin_units(normalize_coin_amount(self.base_amount, self.coin_decimal_places))
         self.current_amount = self.base_amount
         if self.base_amount <= 0:
             raise ConfigError("bot.base_amount terlalu kecil untuk skala desimal coin saat ini.")
@@ -1176,32 +3404,16 @@ class DiceBot:
         if self.preset_premium_cooldown_rounds < 0:
             raise ConfigError("strategy.preset.premium_cooldown_rounds tidak boleh negatif.")
 
-        self.fibonacci_index = 0
-        self.paroli_step = 0
-        self.dalembert_level = 0
-        self.long_run_step = 0
-        self.long_run_shield_remaining = 0
-        self.mining_v2_step = 0
-        self.mining_v2_cooldown_remaining = 0
-        self.pro_safe_step = 0
-        self.pro_recovery_step = 0
-        self.pro_recovery_cooldown_remaining = 0
-        self.pro_scalper_streak = 0
-        self.premium_guard_step = 0
-        self.premium_guard_cooldown_remaining = 0
-        self.premium_compound_step = 0
-        self.premium_step = 0
-        self.premium_cooldown_remaining = 0
-        self.fibonacci_cache = [1, 1]
-
-        self.total_profit = Decimal("0")
-        self.current_balance = Decimal("0")
-        self.api_balance = Decimal("0")
-        self.estimated_balance = Decimal("0")
+        self._activate_strategy()
+
+        self.total_profit = 0
+        self.current_balance = 0
+        self.api_balance = 0
+        self.estimated_balance = 0
         self.balance_source = "API"
-        self.start_balance = Decimal("0")
-        self.premium_target_profit_abs = Decimal("0")
-        self.premium_stop_loss_abs = Decimal("0")
+        self.start_balance = 0
+        self.premium_target_profit_abs = 0
+        self.premium_stop_loss_abs = 0
         self.bet_count = 0
         self.win_count = 0
         self.loss_count = 0
@@ -1209,17 +3421,29 @@ class DiceBot:
         self.consecutive_losses = 0
         self.api_error_count = 0
         self.started_at = time.time()
-        self.sticky_footer_lines = 4
+        self.shadows: List[ShadowStrategy] = []
+        for entry in (cfg.get("shadow", {}) or {}).get("strategies", []) or []:
+            label, preset, shadow_cfg = shadow_config(cfg, entry)
+            self.shadows.append(ShadowStrategy(label, build_offline_bot(shadow_cfg, preset)))
+        self.sticky_footer_lines = 4 + int(self.latency_footer) + int(bool(self.shadows))
+        self._layout_columns = 0
+        self._layout_lines = 0
+        self._layout_content_bottom = 0
+        self._layout_checked_at = 0.0
+        self._footer_line_moves: Tuple[str, ...] = ()
+        self._footer_template = build_footer_template(0, self.currency_display)
+        self._refresh_layout()
+        self._resize_signal_enabled = self._install_resize_handler()
+        self.profiler = PhaseProfiler()
         self.client.set_runtime_warn_logger(self.warn)
-        self.last_bet_time = "--:--:--"
-        self.last_bet_roll = "-"
-        self.last_bet_state = "WAIT"
-        self.last_bet_multiplier = self.multiplier
-        self.last_bet_amount = self.current_amount
-        self.last_bet_profit = Decimal("0")
-        self.last_bet_balance = self.current_balance
-        self.last_bet_total_profit = self.total_profit
+        if self.journal is not None:
+            self.journal.warn_logger = self.warn
+        if self.checkpoint is not None:
+            self.checkpoint.warn_logger = self.warn
+        self.history = BetHistory(self.rolling_window)
+        self.risk = RiskMetrics()
         self.active_sync_mode = self._detect_auto_sync_mode()
+        self._build_chance_grid()
 
         self.sync_bet_pair()
 
@@ -1228,24 +3452,64 @@ class DiceBot:
             return ""
         return datetime.now().strftime("[%H:%M:%S] ")
 
+    def _install_resize_handler(self) -> bool:
+        if not hasattr(signal, "SIGWINCH"):
+            return False
+        try:
+            signal.signal(signal.SIGWINCH, self._on_terminal_resize)
+        except ValueError:
+            # signal hanya bisa dipasang dari main thread.
+            return False
+        return True
+
+    def _on_terminal_resize(self, signum: int, frame: Any) -> None:
+        self._layout_dirty = True
+
+    def _refresh_layout(self) -> None:
+        # Ukuran terminal, template footer, dan posisi baris footer dihitung ulang hanya saat resize.
+        try:
+            size = shutil.get_terminal_size(fallback=(120, 30))
+            columns, lines = size.columns, size.lines
+        except OSError:
+            columns, lines = 120, 30
+        self._layout_dirty = False
+        self._layout_checked_at = time.monotonic()
+        if (columns, lines) == (self._layout_columns, self._layout_lines):
+            return
+        self._layout_columns = columns
+        self._layout_lines = lines
+        self._layout_content_bottom = lines - self.sticky_footer_lines
+        start_line = max(1, lines - self.sticky_footer_lines + 1)
+        self._footer_line_moves = tuple(
+            f"\x1b[{start_line + idx};1H\x1b[2K" for idx in range(self.sticky_footer_lines)
+        )
+        template = build_footer_template(columns, self.currency_display)
+        self._footer_template = template._replace(header=self._fit_exact_width(template.header, columns))
+
+    def _ensure_layout(self) -> None:
+        if self._layout_dirty:
+            self._refresh_layout()
+        elif not self._resize_signal_enabled and time.monotonic() - self._layout_checked_at >= 1.0:
+            self._refresh_layout()
+
     def _prepare_sticky_layout(self) -> Tuple[int, int, int] | None:
         if not self.sticky_footer_enabled:
             return None
 
-        size = shutil.get_terminal_size(fallback=(120, 30))
-        content_bottom = size.lines - self.sticky_footer_lines
+        self._ensure_layout()
+        content_bottom = self._layout_content_bottom
         if content_bottom < 1:
             self.sticky_footer_enabled = False
             return None
 
-        current_size = (size.columns, size.lines)
+        current_size = (self._layout_columns, self._layout_lines)
         if not self._sticky_region_active or self._sticky_region_size != current_size:
             sys.stdout.write(f"\x1b[1;{content_bottom}r")
             self._sticky_region_active = True
             self._sticky_region_size = current_size
             sys.stdout.flush()
 
-        return size.columns, size.lines, content_bottom
+        return self._layout_columns, self._layout_lines, content_bottom
 
     def _reset_sticky_layout(self) -> None:
         if not self._sticky_region_active:
@@ -1255,19 +3519,41 @@ class DiceBot:
         self._sticky_region_active = False
         self._sticky_region_size = (0, 0)
 
-    def _emit_runtime_lines(self, lines: Iterable[str]) -> None:
+    def _emit_runtime_lines(self, lines: Iterable[str], urgent: bool = False) -> None:
         rendered = list(lines)
         if not rendered:
             return
-        if self.sticky_footer_enabled:
-            self._clear_sticky_footer()
-        for line in rendered:
-            print(line)
-        if self.sticky_footer_enabled:
-            self._render_sticky_footer()
+        if not self.sticky_footer_enabled:
+            for line in rendered:
+                print(line)
+            return
+        self._pending_lines.extend(rendered)
+        self._footer_dirty = True
+        if urgent or self.footer_frame_interval <= 0:
+            self._flush_frame()
+        elif time.monotonic() - self._last_frame_at >= self.footer_frame_interval:
+            self._flush_frame()
+
+    def _emit_runtime_line(self, line: str, urgent: bool = False) -> None:
+        self._emit_runtime_lines((line,), urgent)
+
+    def _flush_frame(self) -> None:
+        # Satu frame = baris history yang tertunda + repaint footer, ditulis sekali lalu flush.
+        if not self._pending_lines and not self._footer_dirty:
+            return
+        pending = self._pending_lines
+        self._pending_lines = []
+        self._footer_dirty = False
+        self._last_frame_at = time.monotonic()
 
-    def _emit_runtime_line(self, line: str) -> None:
-        self._emit_runtime_lines((line,))
+        layout = self._prepare_sticky_layout()
+        parts = [line + Style.RESET_ALL + "\n" for line in pending]
+        if layout is not None:
+            columns, lines, _ = layout
+            parts.append(self._sticky_footer_frame(columns, lines))
+        if parts:
+            sys.stdout.write("".join(parts))
+            sys.stdout.flush()
 
     def info(self, message: str) -> None:
         plain = self._fit_width(self.now_prefix() + message)
@@ -1279,19 +3565,17 @@ class DiceBot:
 
     def warn(self, message: str) -> None:
         plain = self._fit_width(self.now_prefix() + message)
-        self._emit_runtime_line(THEME_SECONDARY + plain)
+        self._emit_runtime_line(THEME_SECONDARY + plain, urgent=True)
 
     def error(self, message: str) -> None:
         plain = self._fit_width(self.now_prefix() + message)
-        self._emit_runtime_line(THEME_SECONDARY_BRIGHT + plain)
+        self._emit_runtime_line(THEME_SECONDARY_BRIGHT + plain, urgent=True)
 
     def _terminal_width(self) -> int:
         if self.history_width > 0:
             return self.history_width
-        try:
-            return shutil.get_terminal_size(fallback=(120, 20)).columns
-        except OSError:
-            return 120
+        self._ensure_layout()
+        return self._layout_columns
 
     def _fit_width(self, text: str) -> str:
         width = self._terminal_width()
@@ -1320,21 +3604,6 @@ class DiceBot:
         except (InvalidOperation, TypeError):
             return str(value)
 
-    def _signed_decimal(self, value: Decimal, places: int) -> str:
-        sign = "+" if value >= 0 else "-"
-        amount = value.copy_abs()
-        if places <= 0:
-            rounded = amount.quantize(Decimal("1"), rounding=ROUND_HALF_UP)
-            if rounded == 0 and amount > 0:
-                rounded = Decimal("1")
-            return f"{sign}{format_decimal(rounded, 0)}"
-
-        step = Decimal("1").scaleb(-places)
-        rounded = amount.quantize(step, rounding=ROUND_HALF_UP)
-        if rounded == 0 and amount > 0:
-            rounded = step
-        return f"{sign}{format_decimal(rounded, places)}"
-
     def _format_rupiah(self, value: Decimal, signed: bool = False) -> str:
         amount = value
         sign = ""
@@ -1367,221 +3636,164 @@ class DiceBot:
     def _refresh_idr_price(self, force: bool = False) -> None:
         if not self.show_idr_value:
             return
-        if not self.idr_coin_id:
+        if self.idr_feed is None:
             return
 
-        now_ts = time.time()
-        if not force and self.idr_refresh_seconds > 0:
-            if now_ts - self.idr_last_update_ts < self.idr_refresh_seconds:
-                return
-
-        try:
-            response = requests.get(
-                "https://api.coingecko.com/api/v3/simple/price",
-                params={"ids": self.idr_coin_id, "vs_currencies": "idr"},
-                headers={"Accept": "application/json", "User-Agent": "NUSANTARA-BOT/1.0"},
-                timeout=8,
-            )
-            if not response.ok:
-                raise APIError(f"HTTP {response.status_code}")
-
-            payload = response.json()
-            idr_value = payload.get(self.idr_coin_id, {}).get("idr")
-            if idr_value is None:
-                raise APIError("field 'idr' tidak ditemukan di response price")
-
-            idr_price = Decimal(str(idr_value))
-            if idr_price <= 0:
-                raise APIError("harga IDR tidak valid (<= 0)")
-
-            self.idr_price = idr_price
-            self.idr_last_update_ts = now_ts
-            self.idr_last_update_at = datetime.now().strftime("%H:%M:%S")
-            self.idr_status = "OK"
-            self.idr_error_notified = False
-        except Exception as exc:
-            self.idr_status = "ERROR"
+        if force:
+            # Hanya saat start sesi: tunggu hasil pertama sebentar, di bet loop cukup baca snapshot.
+            self.idr_feed.start()
+            self.idr_feed.wait_first(IDR_FIRST_PRICE_WAIT_SECONDS)
+
+        snapshot = self.idr_feed.snapshot
+        self.idr_price = snapshot.price
+        self.idr_last_update_ts = snapshot.updated_ts
+        self.idr_last_update_at = snapshot.updated_at
+        self.idr_status = snapshot.status
+        if snapshot.status == "ERROR":
             if not self.idr_error_notified:
-                self.warn(f"Gagal update harga IDR: {exc}")
+                self.warn(f"Gagal update harga IDR: {snapshot.error}")
                 self.idr_error_notified = True
+        elif snapshot.status == "OK":
+            self.idr_error_notified = False
 
-    def _normalize_amount(self, amount: Decimal) -> Decimal:
-        normalized = quantize_places(amount, self.coin_decimal_places)
-        if amount > 0 and normalized <= 0:
-            return Decimal("1").scaleb(-self.coin_decimal_places)
-        return normalized
-
-    def _clear_sticky_footer(self) -> None:
-        layout = self._prepare_sticky_layout()
-        if layout is None:
-            return
-        _, lines, _ = layout
-        start_line = max(1, lines - self.sticky_footer_lines + 1)
-        sys.stdout.write("\x1b[s")
-        for idx in range(self.sticky_footer_lines):
-            sys.stdout.write(f"\x1b[{start_line + idx};1H")
-            sys.stdout.write("\x1b[2K")
-        sys.stdout.write("\x1b[u")
-        sys.stdout.flush()
-
-    def _update_last_bet_snapshot(
-        self,
-        state: str,
-        amount: Decimal,
-        result_value: Any,
-        profit: Decimal,
-    ) -> None:
-        if state == "win":
-            status = "WIN"
-        elif state == "loss":
-            status = "LOSS"
-        else:
-            status = "WAIT"
+    def _idr_age_label(self) -> str:
+        if self.idr_last_update_ts <= 0:
+            return "-"
+        age = max(0, int(time.time() - self.idr_last_update_ts))
+        label = f"{age}s" if age < 120 else f"{age // 60}m"
+        if self.idr_status == "ERROR":
+            label += "!"
+        return label
+
+    def _normalize_amount(self, amount: int) -> int:
+        return normalize_coin_units(amount, self.coin_decimal_places)
+
+    def _journal_bet(self, bet: Dict[str, Any], state: str, result_value: str, profit: int, sent_at: float) -> None:
+        # Nilai uang ditulis sebagai teks desimal 8 digit supaya jurnal bisa dibaca ulang tanpa kehilangan presisi.
+        self.journal.record(
+            {
+                "session": self.session_id,
+                "bet": self.bet_count,
+                "sent_at": round(sent_at, 3),
+                "received_at": round(time.time(), 3),
+                "currency": self.currency,
+                "hash": bet.get("hash"),
+                "nonce": bet.get("nonce"),
+                "rule": self.rule,
+                "bet_value": format_decimal(self.bet_value),
+                "multiplier": format_decimal(self.multiplier),
+                "amount": format_units(self.current_amount, COIN_UNIT_PLACES),
+                "result_value": result_value,
+                "state": state,
+                "profit": format_units(profit, COIN_UNIT_PLACES),
+                "balance": format_units(self.current_balance, COIN_UNIT_PLACES),
+                "rtt_ms": round(self.client.last_rtt_seconds * 1000, 3),
+                "pace_ms": round(self.client.last_pace_seconds * 1000, 3),
+            }
+        )
 
-        self.last_bet_time = datetime.now().strftime("%H:%M:%S") if self.show_timestamp else "--:--:--"
-        self.last_bet_roll = self._format_roll(result_value)
-        self.last_bet_state = status
-        self.last_bet_multiplier = self.multiplier
-        self.last_bet_amount = amount
-        self.last_bet_profit = profit
-        self.last_bet_balance = self.current_balance
-        self.last_bet_total_profit = self.total_profit
+    def _streak_summary(self, won: bool) -> str:
+        parts = [f"{length}x:{count}" for length, count in self.risk.streak_histogram(won)]
+        return " ".join(parts) if parts else "-"
+
+    def _drawdown_percent(self) -> Decimal:
+        peak_balance = self.start_balance + self.risk.peak_profit
+        if peak_balance <= 0:
+            return Decimal("0")
+        return Decimal(self.risk.drawdown) * Decimal("100") / Decimal(peak_balance)
+
+    def _record_history(self, state: str, amount: int, result_value: Any, profit: int) -> None:
+        self.risk.update(state == "win", profit, self.total_profit)
+        self.history.append(
+            time.time(),
+            state == "win",
+            result_value,
+            self.multiplier,
+            amount,
+            profit,
+            self.current_balance,
+            self.total_profit,
+        )
+        self._footer_dirty = True
 
     def _render_sticky_footer(self) -> None:
         layout = self._prepare_sticky_layout()
         if layout is None:
             return
-
         columns, lines, _ = layout
-        start_line = max(1, lines - self.sticky_footer_lines + 1)
+        sys.stdout.write(self._sticky_footer_frame(columns, lines))
+        sys.stdout.flush()
+
+    def _sticky_footer_frame(self, columns: int, lines: int) -> str:
+        template = self._footer_template
         winrate = Decimal("0")
         if self.bet_count > 0:
             winrate = (Decimal(self.win_count) / Decimal(self.bet_count)) * Decimal("100")
 
-        row_profit_col = self._signed_decimal(self.last_bet_profit, self.profit_display_precision)
-        row_total_col = self._signed_decimal(self.last_bet_total_profit, self.profit_display_precision)
-        stats_total_col = self._signed_decimal(self.total_profit, self.profit_display_precision)
-        last_multiplier = format_decimal(self.last_bet_multiplier, self.multiplier_precision)
-        last_amount = format_decimal(self.last_bet_amount, self.amount_display_precision)
-        last_balance = format_decimal(self.last_bet_balance, self.balance_display_precision)
-        last_roll = self.last_bet_roll
-        wr_col = format_decimal(winrate, 2)
-        bal_col = format_decimal(self.current_balance, self.balance_display_precision)
         idr_enabled = self.show_idr_value and self.idr_price > 0
-        bal_idr_col = self._format_rupiah(self.current_balance * self.idr_price) if idr_enabled else "n/a"
-        total_idr_col = self._format_rupiah(self.total_profit * self.idr_price, signed=True) if idr_enabled else "n/a"
-
-        def choose_line(options: Tuple[str, ...]) -> str:
-            for text in options:
-                if len(text) <= columns:
-                    return text
-            return options[-1]
+        last = self.history.last()
+        if last is None:
+            state = "WAIT"
+            fields = {
+                "time": "--:--:--",
+                "roll": "-",
+                "multiplier": format_decimal(self.multiplier, self.multiplier_precision),
+                "amount": format_units(self.current_amount, self.amount_display_precision),
+                "profit": format_signed_units(0, self.profit_display_precision),
+                "balance": format_units(self.current_balance, self.balance_display_precision),
+                "total": format_signed_units(self.total_profit, self.profit_display_precision),
+            }
+        else:
+            state = "WIN" if last.won else "LOSS"
+            fields = {
+                "time": datetime.fromtimestamp(last.at).strftime("%H:%M:%S") if self.show_timestamp else "--:--:--",
+                "roll": self._format_roll(last.roll),
+                "multiplier": format_decimal(last.multiplier, self.multiplier_precision),
+                "amount": format_units(last.amount, self.amount_display_precision),
+                "profit": format_signed_units(last.profit, self.profit_display_precision),
+                "balance": format_units(last.balance, self.balance_display_precision),
+                "total": format_signed_units(last.total_profit, self.profit_display_precision),
+            }
+        fields.update(
+            state=state,
+            bets=self.bet_count,
+            wins=self.win_count,
+            losses=self.loss_count,
+            winrate=format_decimal(winrate, 2),
+            window=self.history.size,
+            rolling_winrate=format_decimal(self.history.rolling_winrate(), 2),
+            rolling_profit=format_signed_units(self.history.window_profit, self.profit_display_precision),
+            balance_now=format_units(self.current_balance, self.balance_display_precision),
+            total_now=format_signed_units(self.total_profit, self.profit_display_precision),
+            drawdown=format_units(self.risk.drawdown, self.profit_display_precision),
+            max_drawdown=format_units(self.risk.max_drawdown, self.profit_display_precision),
+            peak_balance=format_units(self.start_balance + self.risk.peak_profit, self.balance_display_precision),
+        )
 
-        if columns >= 136:
-            header = (
-                f"{'TIME':<8} | {'ROLL':>7} | {'WIN/LOSS':<8} | {'MULTI':>12} | "
-                f"{'AMOUNT':>14} | {'PROFIT':>14} | {('BALANCE ' + self.currency_display):>14} | {'TOTAL PROFIT':>14}"
-            )
-            row = (
-                f"{self.last_bet_time:<8} | {last_roll:>7} | {self.last_bet_state:<8} | "
-                f"{last_multiplier:>12} | {last_amount:>14} | {row_profit_col:>14} | "
-                f"{last_balance:>14} | {row_total_col:>14}"
-            )
-            stats = (
-                f"STATS | BET:{self.bet_count:<6} WIN:{self.win_count:<6} LOSS:{self.loss_count:<6} "
-                f"WR:{wr_col:>6}% | BALANCE {self.currency_display}:{bal_col:>14}"
-            )
-            if idr_enabled:
-                total_line = choose_line(
-                    (
-                        f"BALANCE IDR: {bal_idr_col} | TOTAL PROFIT {self.currency_display}: {stats_total_col} | "
-                        f"TOTAL PROFIT IDR: {total_idr_col}",
-                        f"BALANCE IDR: {bal_idr_col} | TOTAL PROFIT {self.currency_display}: {stats_total_col}",
-                        f"BALANCE IDR: {bal_idr_col} | TOTAL PROFIT IDR: {total_idr_col}",
-                        f"BALANCE IDR: {bal_idr_col}",
-                        f"TOTAL PROFIT {self.currency_display}: {stats_total_col}",
-                    )
-                )
-            else:
-                total_line = f"TOTAL PROFIT {self.currency_display}: {stats_total_col}"
-        elif columns >= 108:
-            header = (
-                f"{'TIME':<8} | {'ROLL':>7} | {'RESULT':<6} | {'MULTI':>8} | {'AMOUNT':>10} | "
-                f"{'PROFIT':>11} | {'BALANCE':>11} | {'TOTAL':>11}"
-            )
-            row = (
-                f"{self.last_bet_time:<8} | {last_roll:>7} | {self.last_bet_state:<6} | {last_multiplier:>8} | "
-                f"{last_amount:>10} | {row_profit_col:>11} | {last_balance:>11} | {row_total_col:>11}"
-            )
-            stats = (
-                f"STATS BET:{self.bet_count} WIN:{self.win_count} LOSS:{self.loss_count} WR:{wr_col}% "
-                f"BALANCE:{bal_col}"
-            )
-            if idr_enabled:
-                total_line = choose_line(
-                    (
-                        f"BALANCE IDR: {bal_idr_col} | TOTAL PROFIT {self.currency_display}: {stats_total_col} | "
-                        f"TOTAL PROFIT IDR: {total_idr_col}",
-                        f"BALANCE IDR: {bal_idr_col} | TOTAL PROFIT {self.currency_display}: {stats_total_col}",
-                        f"BALANCE IDR: {bal_idr_col} | TOTAL PROFIT IDR: {total_idr_col}",
-                        f"BALANCE IDR: {bal_idr_col}",
-                        f"TOTAL PROFIT {self.currency_display}: {stats_total_col}",
-                    )
-                )
-            else:
-                total_line = f"TOTAL PROFIT {self.currency_display}: {stats_total_col}"
-        elif columns >= 82:
-            header = (
-                f"{'TIME':<8} | {'ROLL':>7} | {'RESULT':<6} | {'PROFIT':>12} | {'TOTAL':>12}"
+        row = template.row.format(**fields)
+        stats = template.stats.format(**fields)
+        if idr_enabled:
+            fields["balance_idr"] = (
+                f"{self._format_rupiah(units_to_decimal(self.current_balance) * self.idr_price)} ({self._idr_age_label()})"
             )
-            row = (
-                f"{self.last_bet_time:<8} | {last_roll:>7} | {self.last_bet_state:<6} | "
-                f"{row_profit_col:>12} | {row_total_col:>12}"
-            )
-            stats = (
-                f"BET:{self.bet_count} WIN:{self.win_count} LOSS:{self.loss_count} WR:{wr_col}% "
-                f"BALANCE:{bal_col}"
-            )
-            if idr_enabled:
-                total_line = choose_line(
-                    (
-                        f"BALANCE IDR: {bal_idr_col} | TOTAL {self.currency_display}: {stats_total_col} | TOTAL IDR: {total_idr_col}",
-                        f"BALANCE IDR: {bal_idr_col} | TOTAL {self.currency_display}: {stats_total_col}",
-                        f"BALANCE IDR: {bal_idr_col} | TOTAL IDR: {total_idr_col}",
-                        f"BALANCE IDR: {bal_idr_col}",
-                        f"TOTAL {self.currency_display}: {stats_total_col}",
-                    )
-                )
-            else:
-                total_line = f"TOTAL {self.currency_display}: {stats_total_col}"
+            fields["total_idr"] = self._format_rupiah(units_to_decimal(self.total_profit) * self.idr_price, signed=True)
+            total_line = ""
+            for option in template.total_idr:
+                total_line = option.format(**fields)
+                if len(total_line) <= columns:
+                    break
         else:
-            header = "TIME | RESULT | PROFIT | TOTAL"
-            row = (
-                f"{self.last_bet_time} | {self.last_bet_state} | {row_profit_col} | {row_total_col}"
-            )
-            stats = (
-                f"BET:{self.bet_count} WR:{wr_col}% BAL:{bal_col}"
-            )
-            if idr_enabled:
-                total_line = choose_line(
-                    (
-                        f"BALANCE IDR: {bal_idr_col} | {self.currency_display} {stats_total_col}",
-                        f"BALANCE IDR: {bal_idr_col}",
-                        f"{self.currency_display} {stats_total_col}",
-                    )
-                )
-            else:
-                total_line = f"{self.currency_display} {stats_total_col}"
+            total_line = template.total.format(**fields)
 
-        header = self._fit_exact_width(header, columns)
+        header = template.header
         row = self._fit_exact_width(row, columns)
         stats = self._fit_exact_width(stats, columns)
         total_line = self._fit_exact_width(total_line, columns)
 
         header_color = THEME_TEXT_DIM
-        if self.last_bet_state == "WIN":
+        if state == "WIN":
             row_color = THEME_PRIMARY_BRIGHT
-        elif self.last_bet_state == "LOSS":
+        elif state == "LOSS":
             row_color = THEME_SECONDARY_BRIGHT
         else:
             row_color = THEME_TEXT
@@ -1593,21 +3805,33 @@ class DiceBot:
         else:
             total_color = THEME_TEXT_BRIGHT
 
-        sys.stdout.write("\x1b[s")
-        sys.stdout.write(f"\x1b[{start_line};1H")
-        sys.stdout.write("\x1b[2K")
-        sys.stdout.write(header_color + header + Style.RESET_ALL)
-        sys.stdout.write(f"\x1b[{start_line + 1};1H")
-        sys.stdout.write("\x1b[2K")
-        sys.stdout.write(row_color + row + Style.RESET_ALL)
-        sys.stdout.write(f"\x1b[{start_line + 2};1H")
-        sys.stdout.write("\x1b[2K")
-        sys.stdout.write(stats_color + stats + Style.RESET_ALL)
-        sys.stdout.write(f"\x1b[{start_line + 3};1H")
-        sys.stdout.write("\x1b[2K")
-        sys.stdout.write(total_color + total_line + Style.RESET_ALL)
-        sys.stdout.write("\x1b[u")
-        sys.stdout.flush()
+        moves = self._footer_line_moves
+        frame = [
+            "\x1b[s",
+            moves[0],
+            header_color + header + Style.RESET_ALL,
+            moves[1],
+            row_color + row + Style.RESET_ALL,
+            moves[2],
+            stats_color + stats + Style.RESET_ALL,
+            moves[3],
+            total_color + total_line + Style.RESET_ALL,
+        ]
+        if self.latency_footer:
+            frame.append(moves[4])
+            frame.append(THEME_TEXT_DIM + self._fit_exact_width(self._latency_line(), columns) + Style.RESET_ALL)
+        if self.shadows:
+            frame.append(moves[-1])
+            frame.append(THEME_TEXT + self._fit_exact_width(self._shadow_line(), columns) + Style.RESET_ALL)
+        frame.append("\x1b[u")
+        return "".join(frame)
+
+    def _latency_line(self) -> str:
+        parts = []
+        for phase, label in (("rtt", "RTT"), ("parse", "PARSE"), ("render", "RENDER"), ("pace", "PACE"), ("sleep", "SLEEP")):
+            p50, p95 = self.profiler.percentiles_ms(phase, (0.5, 0.95))
+            parts.append(f"{label} {p50:.1f}/{p95:.1f}")
+        return "LAT ms p50/p95 | " + " | ".join(parts)
 
     def _print_history_header(self) -> None:
         header = (
@@ -1625,18 +3849,18 @@ class DiceBot:
     def _history_line(
         self,
         state: str,
-        amount: Decimal,
+        amount: int,
         result_value: Any,
-        profit: Decimal,
+        profit: int,
     ) -> str:
         time_col = datetime.now().strftime("%H:%M:%S") if self.show_timestamp else "--:--:--"
         status = "WIN" if state == "win" else "LOSS"
-        amount_col = format_decimal(amount, self.amount_display_precision)
+        amount_col = format_units(amount, self.amount_display_precision)
         mult_col = format_decimal(self.multiplier, self.multiplier_precision)
         roll_col = self._format_roll(result_value)
-        profit_col = self._signed_decimal(profit, self.profit_display_precision)
-        total_col = self._signed_decimal(self.total_profit, self.profit_display_precision)
-        balance_col = format_decimal(self.current_balance, self.balance_display_precision)
+        profit_col = format_signed_units(profit, self.profit_display_precision)
+        total_col = format_signed_units(self.total_profit, self.profit_display_precision)
+        balance_col = format_units(self.current_balance, self.balance_display_precision)
 
         line = (
             f"{time_col:<8} | {roll_col:>7} | {status:<8} | {mult_col:>12} | "
@@ -1644,18 +3868,18 @@ class DiceBot:
         )
         return self._fit_width(line)
 
-    def _print_mining_log(self, state: str, amount: Decimal, result_value: Any, profit: Decimal) -> None:
+    def _print_mining_log(self, state: str, amount: int, result_value: Any, profit: int) -> None:
         time_col = datetime.now().strftime("%H:%M:%S") if self.show_timestamp else "--:--:--"
         roll_col = self._format_roll(result_value)
         state_text = "WIN" if state == "win" else "LOSS"
         state_color = THEME_PRIMARY_BRIGHT if state == "win" else THEME_SECONDARY_BRIGHT
-        profit_col = self._signed_decimal(profit, self.profit_display_precision)
-        total_col = self._signed_decimal(self.total_profit, self.profit_display_precision)
-        amount_col = format_decimal(amount, self.amount_display_precision)
+        profit_col = format_signed_units(profit, self.profit_display_precision)
+        total_col = format_signed_units(self.total_profit, self.profit_display_precision)
+        amount_col = format_units(amount, self.amount_display_precision)
         mult_col = format_decimal(self.multiplier, self.multiplier_precision)
         profit_idr_col = ""
         if self.show_idr_value and self.idr_price > 0:
-            profit_idr_col = self._format_rupiah_micro(profit * self.idr_price, signed=True, places=4)
+            profit_idr_col = self._format_rupiah_micro(units_to_decimal(profit) * self.idr_price, signed=True, places=4)
         width = self._terminal_width()
 
         if width >= 150:
@@ -1698,13 +3922,13 @@ class DiceBot:
         line_plain = self._fit_width(line_plain)
         self._emit_runtime_line(state_color + line_plain + Style.RESET_ALL)
 
-    def _update_balances(self, user_balance: Dict[str, Any], profit: Decimal) -> None:
+    def _update_balances(self, user_balance: Dict[str, Any], profit: int) -> None:
         self.estimated_balance += profit
         api_updated = False
 
         if isinstance(user_balance, dict) and user_balance.get("amount") is not None:
             try:
-                api_balance = self._safe_decimal(user_balance.get("amount"))
+                api_balance = coin_units(self._safe_decimal(user_balance.get("amount")))
                 if api_balance != self.api_balance:
                     api_updated = True
                 self.api_balance = api_balance
@@ -1749,27 +3973,10 @@ class DiceBot:
         return Decimal("99.99") - bet_value
 
     def compute_multiplier(self, bet_value: Decimal, rule: str) -> Decimal:
-        chance = self.chance_from_bet_value(bet_value, rule)
-        if chance <= Decimal("0"):
-            raise ConfigError("Chance hasil kalkulasi <= 0. Ubah bot.bet_value / bot.rule.")
-        raw_multiplier = Decimal("99") / chance
-        return quantize_places_half_up(raw_multiplier, self.multiplier_precision)
+        return multiplier_for_bet_value(bet_value, rule, self.multiplier_precision)
 
     def compute_bet_value_from_multiplier(self, multiplier: Decimal, rule: str) -> Decimal:
-        if multiplier <= Decimal("1"):
-            raise ConfigError("Multiplier harus > 1 untuk hitung bet_value.")
-
-        chance = Decimal("99") / multiplier
-        chance = quantize_places_half_up(chance, self.bet_value_precision)
-        if rule == "under":
-            bet_value = chance
-        else:
-            bet_value = Decimal("99.99") - chance
-
-        bet_value = quantize_places_half_up(bet_value, self.bet_value_precision)
-        if bet_value <= Decimal("0") or bet_value >= Decimal("99.99"):
-            raise ConfigError("Hasil bet_value dari multiplier di luar batas valid (0 - 99.99).")
-        return bet_value
+        return bet_value_for_multiplier(multiplier, rule, self.bet_value_precision)
 
     def _is_pair_value_changed(self, current: Decimal, previous: Decimal, places: int) -> bool:
         current_q = quantize_places(current, places)
@@ -1807,22 +4014,57 @@ class DiceBot:
         return self.sync_mode
 
     def sync_bet_pair(self) -> None:
-        self.bet_value = quantize_places_half_up(self.bet_value, self.bet_value_precision)
-        if self.bet_value <= Decimal("0") or self.bet_value >= Decimal("99.99"):
-            raise ConfigError("bot.bet_value harus > 0 dan < 99.99.")
+        self.bet_value, self.multiplier = synced_bet_pair(
+            self.rule,
+            self.bet_value,
+            self.multiplier,
+            self.bet_value_precision,
+            self.multiplier_precision,
+            self._effective_sync_mode(),
+        )
 
-        self.multiplier = quantize_places_half_up(self.multiplier, self.multiplier_precision)
-        active_mode = self._effective_sync_mode()
-        if active_mode == "lock_bet_value":
-            self.multiplier = self.compute_multiplier(self.bet_value, self.rule)
-            # Sync balik bet_value dari multiplier agar akurat 100% di mata API
-            self.bet_value = self.compute_bet_value_from_multiplier(self.multiplier, self.rule)
-            return
+    def _chance_pair(self, chance: Decimal, rule: str) -> Tuple[Decimal, Decimal] | None:
+        if chance <= Decimal("0"):
+            chance = Decimal("0.01")
+        if chance >= Decimal("99.99"):
+            chance = Decimal("99.98")
+        bet_value = chance if rule == "under" else Decimal("99.99") - chance
+        bet_value = quantize_places_half_up(bet_value, self.bet_value_precision)
+        try:
+            multiplier = self.compute_multiplier(bet_value, rule)
+            bet_value = self.compute_bet_value_from_multiplier(multiplier, rule)
+            # Pair final harus lolos cek "incorrect win chance" API: multiplier = 99 / chance(bet_value).
+            multiplier = self.compute_multiplier(bet_value, rule)
+        except ConfigError:
+            return None
+        return bet_value, multiplier
 
-        if active_mode == "lock_multiplier":
-            self.bet_value = self.compute_bet_value_from_multiplier(self.multiplier, self.rule)
-            # Paksa update multiplier agar sesuai dengan bet_value yang baru dihitung (grid chance)
-            self.multiplier = self.compute_multiplier(self.bet_value, self.rule)
+    def _build_chance_grid(self) -> None:
+        # Semua titik chance pada chance_random_precision sudah dipetakan ke pair (bet_value, multiplier) final,
+        # jadi undian chance tiap bet cukup lookup index.
+        self.chance_grid: Dict[str, Tuple[Tuple[Decimal, Decimal] | None, ...]] = {}
+        if not (self.simple_mode_enabled and self.simple_chance_random_enabled):
+            return
+        step = Decimal("1").scaleb(-self.simple_chance_random_precision)
+        low = quantize_places_half_up(self.simple_chance_random_min, self.simple_chance_random_precision)
+        high = quantize_places_half_up(self.simple_chance_random_max, self.simple_chance_random_precision)
+        points = int((high - low) / step) + 1
+        if points > CHANCE_GRID_MAX_POINTS:
+            return
+        for rule in ("under", "over"):
+            self.chance_grid[rule] = tuple(self._chance_pair(low + step * idx, rule) for idx in range(points))
+        self._chance_grid_step = float(step)
+        self._chance_grid_offset = int(low / step)
+        self._chance_grid_last = points - 1
+
+    def _draw_chance_index(self) -> int:
+        raw = random.uniform(float(self.simple_chance_random_min), float(self.simple_chance_random_max))
+        index = math.floor(raw / self._chance_grid_step + 0.5) - self._chance_grid_offset
+        if index < 0:
+            return 0
+        if index > self._chance_grid_last:
+            return self._chance_grid_last
+        return index
 
     def _simple_random_chance(self) -> Decimal:
         raw = Decimal(str(random.uniform(float(self.simple_chance_random_min), float(self.simple_chance_random_max))))
@@ -1845,6 +4087,11 @@ class DiceBot:
         if self.simple_chance_random_enabled:
             self.sync_mode = "lock_bet_value"
             self.active_sync_mode = "lock_bet_value"
+            if self.chance_grid:
+                pair = self.chance_grid[self.rule][self._draw_chance_index()]
+                if pair is not None:
+                    self.bet_value, self.multiplier = pair
+                    return
             random_chance = self._simple_random_chance()
             if self.rule == "under":
                 self.bet_value = random_chance
@@ -1859,26 +4106,80 @@ class DiceBot:
             self.active_sync_mode = "lock_multiplier"
 
     def _reset_strategy_progression(self) -> None:
-        self.fibonacci_index = 0
-        self.paroli_step = 0
-        self.dalembert_level = 0
-        self.long_run_step = 0
-        self.long_run_shield_remaining = 0
-        self.mining_v2_step = 0
-        self.mining_v2_cooldown_remaining = 0
-        self.pro_safe_step = 0
-        self.pro_recovery_step = 0
-        self.pro_recovery_cooldown_remaining = 0
-        self.pro_scalper_streak = 0
-        self.premium_guard_step = 0
-        self.premium_guard_cooldown_remaining = 0
-        self.premium_compound_step = 0
-        self.premium_step = 0
-        self.premium_cooldown_remaining = 0
+        self.strategy.rebase(self.base_amount)
+        self.strategy_state.reset(self.base_amount)
+
+    def _loss_streak_capacity(self) -> Tuple[int, str]:
+        # Jalankan strategi dengan loss beruntun dari state awal sampai amount berikutnya tidak bisa dipasang.
+        ctx = StrategyContext()
+        ctx.current_balance = self.current_balance
+        ctx.start_balance = self.start_balance
+        ctx.multiplier = self.multiplier
+        ctx.premium_target_profit_abs = self.premium_target_profit_abs
+        state = self.strategy.initial_state()
+        amount = state.amount
+        for losses in range(LOSS_STREAK_SCAN_LIMIT):
+            if self.max_amount_units is not None and amount > self.max_amount_units:
+                return losses, "max_bet_stop"
+            if amount > ctx.current_balance:
+                return losses, "balance"
+            ctx.current_balance -= amount
+            ctx.total_profit -= amount
+            ctx.consecutive_losses = losses + 1
+            amount = self.strategy.advance(state, False, ctx)
+        return LOSS_STREAK_SCAN_LIMIT, ""
+
+    def _print_strategy_ladder(self) -> None:
+        if isinstance(self.strategy, StepLadderStrategy):
+            ladder = self.strategy.ladder
+            preview = " > ".join(format_units(amount, self.coin_decimal_places) for amount in ladder[:LADDER_PREVIEW_STEPS])
+            if len(ladder) > LADDER_PREVIEW_STEPS:
+                preview += f" > ... ({len(ladder)} step)"
+            self.info(f"Ladder       : {preview}")
+
+        losses, limiter = self._loss_streak_capacity()
+        if limiter == "balance":
+            self.info(f"Loss streak  : tahan {losses}x loss beruntun (batas: balance)")
+        elif limiter == "max_bet_stop":
+            self.info(f"Loss streak  : tahan {losses}x loss beruntun (batas: max_bet_stop)")
+        else:
+            self.info(f"Loss streak  : tahan >= {losses}x loss beruntun")
+
+        if self.show_risk_of_ruin and type(self.strategy) is StepLadderStrategy:
+            self._print_risk_of_ruin()
+
+    def _print_risk_of_ruin(self) -> None:
+        # Dihitung dari posisi sekarang, jadi setelah --resume progresi ladder dan profit ikut diperhitungkan.
+        try:
+            estimate = RuinSolver(
+                self,
+                self.start_balance,
+                self.total_profit,
+                self.strategy_state,
+                self.consecutive_losses,
+                self.consecutive_wins,
+                self.bet_count,
+            ).solve()
+        except ConfigError as exc:
+            self.info(f"Risk of ruin : dilewati ({exc})")
+            return
+        if estimate.truncated:
+            self.info(f"Risk of ruin : dilewati (lattice terlalu besar, eksak hanya {estimate.steps} bet)")
+            return
+        shares = estimate.probabilities
+        self.info(
+            f"Risk of ruin : bust {shares['bust'] * 100:.3f}% | stop_loss {shares['stop_loss'] * 100:.3f}% | "
+            f"profit_stop {shares['profit_stop'] * 100:.3f}% | lain {shares['lainnya'] * 100:.3f}% | "
+            f"jalan {estimate.running * 100:.3f}%"
+        )
+        self.info(
+            f"Risk detail : E[bet] {estimate.expected_bets:,.0f} | eksak {estimate.steps}/{estimate.horizon} bet | "
+            f"{estimate.nodes} node, {estimate.cells:,} sel | {estimate.elapsed:.2f}s"
+        )
 
     def _reset_session_runtime(self) -> None:
         self.current_amount = self.base_amount
-        self.total_profit = Decimal("0")
+        self.total_profit = 0
         self.bet_count = 0
         self.win_count = 0
         self.loss_count = 0
@@ -1886,13 +4187,18 @@ class DiceBot:
         self.consecutive_losses = 0
         self.api_error_count = 0
         self.started_at = time.time()
+        self.session_id = datetime.fromtimestamp(self.started_at).strftime("%Y%m%d-%H%M%S")
+        self.history.reset()
+        self.risk.reset()
+        self.scheduler.start()
+        self.profiler.reset()
         self._reset_strategy_progression()
 
     def _is_take_profit_reason(self, reason: str) -> bool:
         return reason in {"Mencapai target_profit", "Target harian premium tercapai"}
 
     def _is_stop_loss_reason(self, reason: str) -> bool:
-        return reason in {"Mencapai stop_loss", "Batas rugi premium tercapai"}
+        return reason in {"Mencapai stop_loss", "Batas rugi premium tercapai", "Trailing drawdown tercapai"}
 
     def _replay_reason_label(self, reason: str) -> str:
         if self._is_take_profit_reason(reason):
@@ -1936,6 +4242,7 @@ class DiceBot:
         if not sys.stdin.isatty():
             return
 
+        self._flush_frame()
         current = self.preset_name if self.preset_enabled else "custom"
         entries = self._preset_prompt_entries()
         print(THEME_TEXT_DIM + "-" * 95)
@@ -1981,7 +4288,6 @@ class DiceBot:
             self.warn("Pilihan preset tidak dikenali. Menggunakan preset sesuai config.")
             return
 
-        self._reset_strategy_progression()
         self.current_amount = self.base_amount
         if selected:
             self.preset_enabled = True
@@ -1993,8 +4299,9 @@ class DiceBot:
             self.preset_name = ""
             self.simple_system = ""
             self.info("Preset runtime dipilih: custom (no preset)")
+        self._activate_strategy()
 
-    def get_currency_balance(self) -> Decimal:
+    def get_currency_balance(self) -> int:
         data = self.client.get_balances()
         balances = data.get("balances", [])
         if not isinstance(balances, list):
@@ -2004,7 +4311,7 @@ class DiceBot:
             if not isinstance(item, dict):
                 continue
             if str(item.get("currency", "")).lower() == self.currency:
-                return to_decimal(item.get("amount", "0"), f"balance[{self.currency}]")
+                return coin_units(to_decimal(item.get("amount", "0"), f"balance[{self.currency}]"))
 
         available = [str(x.get("currency", "")).lower() for x in balances if isinstance(x, dict)]
         raise APIError(
@@ -2092,320 +4399,287 @@ class DiceBot:
             except APIError as exc:
                 self.warn(f"Gagal refresh client seed: {exc}")
 
-    def _fibonacci_value(self, index: int) -> int:
-        while index >= len(self.fibonacci_cache):
-            self.fibonacci_cache.append(self.fibonacci_cache[-1] + self.fibonacci_cache[-2])
-        return self.fibonacci_cache[index]
-
     def _apply_rule_switch(self, outcome: str) -> None:
         if outcome == "win" and self.switch_rule_on_win:
             self.rule = "under" if self.rule == "over" else "over"
         elif outcome == "loss" and self.switch_rule_on_loss:
             self.rule = "under" if self.rule == "over" else "over"
 
-    def _apply_custom_strategy(self, outcome: str) -> None:
-        if outcome == "win":
-            if self.custom_on_win_reset:
-                self.current_amount = self.base_amount
-            else:
-                self.current_amount = (self.current_amount * self.custom_on_win_multiplier) + self.custom_on_win_addition
-        else:
-            if self.custom_on_loss_reset:
-                self.current_amount = self.base_amount
-            else:
-                self.current_amount = (self.current_amount * self.custom_on_loss_multiplier) + self.custom_on_loss_addition
-
-    def _apply_preset_strategy(self, outcome: str) -> None:
-        if self.preset_name == "flat":
-            self.current_amount = self.base_amount
-            return
-
-        if self.preset_name == "martingale":
-            if outcome == "win":
-                self.current_amount = self.base_amount
-            else:
-                self.current_amount = self.current_amount * self.preset_martingale_multiplier
-            return
-
-        if self.preset_name == "fibonacci":
-            if outcome == "loss":
-                self.fibonacci_index += 1
-            else:
-                self.fibonacci_index = max(0, self.fibonacci_index - self.preset_fibonacci_step_back_on_win)
-            fib_value = Decimal(str(self._fibonacci_value(self.fibonacci_index)))
-            self.current_amount = self.base_amount * self.preset_fibonacci_unit * fib_value
-            return
-
-        if self.preset_name in {"paroli", "anti_martingale"}:
-            if outcome == "win":
-                self.paroli_step += 1
-                if self.paroli_step >= self.preset_paroli_max_win_streak:
-                    self.paroli_step = 0
-                    self.current_amount = self.base_amount
-                else:
-                    self.current_amount = self.current_amount * self.preset_paroli_multiplier
-            else:
-                self.paroli_step = 0
-                self.current_amount = self.base_amount
-            return
-
-        if self.preset_name == "dalembert":
-            if outcome == "loss":
-                self.dalembert_level += 1
-            else:
-                self.dalembert_level = max(0, self.dalembert_level - 1)
-
-            increment = self.base_amount * self.preset_dalembert_step * Decimal(str(self.dalembert_level))
-            self.current_amount = self.base_amount + increment
-            return
-
-        if self.preset_name in {"mining", "long_run_guard", "anti_losstrack"}:
-            if self.long_run_shield_remaining > 0:
-                if outcome == "loss":
-                    self.long_run_step = min(self.preset_long_run_max_steps, self.long_run_step + 1)
-                else:
-                    self.long_run_step = max(0, self.long_run_step - self.preset_long_run_recovery_steps_on_win)
-                self.current_amount = self.base_amount
-                self.long_run_shield_remaining -= 1
-                return
-
-            if outcome == "loss":
-                self.long_run_step = min(self.preset_long_run_max_steps, self.long_run_step + 1)
-                shield_triggered = (
-                    self.preset_long_run_shield_after_losses > 0
-                    and self.consecutive_losses >= self.preset_long_run_shield_after_losses
-                    and self.preset_long_run_shield_rounds > 0
-                )
-                if shield_triggered:
-                    self.current_amount = self.base_amount
-                    self.long_run_shield_remaining = max(0, self.preset_long_run_shield_rounds - 1)
-                    return
-            else:
-                self.long_run_step = max(0, self.long_run_step - self.preset_long_run_recovery_steps_on_win)
+    def _compile_strategy(self) -> BetStrategy:
+        base = self.base_amount
+        places = self.coin_decimal_places
+        if not self.preset_enabled:
+            return CustomStrategy(
+                base,
+                places,
+                self.custom_on_win_reset,
+                self.custom_on_win_multiplier,
+                self.custom_on_win_addition,
+                self.custom_on_loss_reset,
+                self.custom_on_loss_multiplier,
+                self.custom_on_loss_addition,
+            )
 
-            scale = self.preset_long_run_loss_multiplier ** self.long_run_step
-            if scale > self.preset_long_run_max_scale:
-                scale = self.preset_long_run_max_scale
-            self.current_amount = self.base_amount * scale
-            return
+        name = self.preset_name
+        if name == "flat":
+            return FlatStrategy(base, places)
+        if name == "martingale":
+            return MartingaleStrategy(base, places, self.preset_martingale_multiplier)
+        if name == "fibonacci":
+            return FibonacciStrategy(
+                base, places, self.preset_fibonacci_unit, self.preset_fibonacci_step_back_on_win
+            )
+        if name in {"paroli", "anti_martingale"}:
+            return ParoliStrategy(base, places, self.preset_paroli_multiplier, self.preset_paroli_max_win_streak)
+        if name == "pro_scalper":
+            return ParoliStrategy(
+                base, places, self.preset_pro_scalper_win_multiplier, self.preset_pro_scalper_max_win_streak
+            )
+        if name == "dalembert":
+            return DalembertStrategy(base, places, self.preset_dalembert_step)
+        if name in {"mining", "long_run_guard", "anti_losstrack"}:
+            return StepLadderStrategy(
+                base,
+                places,
+                loss_multiplier=self.preset_long_run_loss_multiplier,
+                max_steps=self.preset_long_run_max_steps,
+                recovery_steps_on_win=self.preset_long_run_recovery_steps_on_win,
+                max_scale=self.preset_long_run_max_scale,
+                cooldown_trigger_losses=self.preset_long_run_shield_after_losses,
+                cooldown_rounds=self.preset_long_run_shield_rounds,
+                cooldown_after_trigger=max(0, self.preset_long_run_shield_rounds - 1),
+            )
+        if name == "mining_v2":
+            return StepLadderStrategy(
+                base,
+                places,
+                loss_multiplier=self.preset_mining_v2_loss_multiplier,
+                max_steps=self.preset_mining_v2_max_steps,
+                recovery_steps_on_win=self.preset_mining_v2_recovery_steps_on_win,
+                max_scale=self.preset_mining_v2_max_scale,
+                cooldown_trigger_losses=self.preset_mining_v2_cooldown_trigger_losses,
+                cooldown_rounds=self.preset_mining_v2_cooldown_rounds,
+            )
+        if name == "pro_safe":
+            return StepLadderStrategy(
+                base,
+                places,
+                loss_multiplier=self.preset_pro_safe_loss_multiplier,
+                max_steps=self.preset_pro_safe_max_steps,
+                recovery_steps_on_win=self.preset_pro_safe_recovery_steps_on_win,
+                max_scale=self.preset_pro_safe_max_scale,
+            )
+        if name == "pro_recovery":
+            return StepLadderStrategy(
+                base,
+                places,
+                loss_multiplier=self.preset_pro_recovery_loss_multiplier,
+                max_steps=self.preset_pro_recovery_max_steps,
+                recovery_steps_on_win=self.preset_pro_recovery_recovery_steps_on_win,
+                max_scale=self.preset_pro_recovery_max_scale,
+                cooldown_trigger_losses=self.preset_pro_recovery_cooldown_trigger_losses,
+                cooldown_rounds=self.preset_pro_recovery_cooldown_rounds,
+            )
+        if name == "premium_guard":
+            return PremiumGuardStrategy(
+                base,
+                places,
+                self.preset_premium_guard_risk_percent,
+                loss_multiplier=self.preset_premium_guard_loss_multiplier,
+                max_steps=self.preset_premium_guard_max_steps,
+                recovery_steps_on_win=1,
+                max_scale=self.preset_premium_guard_max_scale,
+                cooldown_trigger_losses=self.preset_premium_guard_cooldown_trigger_losses,
+                cooldown_rounds=self.preset_premium_guard_cooldown_rounds,
+            )
+        if name == "premium_compound":
+            return PremiumCompoundStrategy(
+                base,
+                places,
+                self.preset_premium_compound_profit_boost_percent,
+                loss_multiplier=self.preset_premium_compound_loss_multiplier,
+                max_steps=self.preset_premium_compound_max_steps,
+                recovery_steps_on_win=self.preset_premium_compound_recovery_steps_on_win,
+                max_scale=self.preset_premium_compound_max_scale,
+            )
+        if name == "premium":
+            return PremiumStrategy(
+                base,
+                places,
+                self.preset_premium_risk_percent,
+                self.preset_premium_max_risk_percent,
+                loss_multiplier=self.preset_premium_loss_multiplier,
+                max_steps=self.preset_premium_max_steps,
+                recovery_steps_on_win=self.preset_premium_recovery_steps_on_win,
+                max_scale=self.preset_premium_max_scale,
+                cooldown_trigger_losses=self.preset_premium_cooldown_trigger_losses,
+                cooldown_rounds=self.preset_premium_cooldown_rounds,
+            )
+        raise ConfigError(f"Preset strategy '{self.preset_name}' belum didukung.")
 
-        if self.preset_name == "mining_v2":
-            if self.mining_v2_cooldown_remaining > 0:
-                if outcome == "win":
-                    self.mining_v2_step = max(0, self.mining_v2_step - self.preset_mining_v2_recovery_steps_on_win)
-                elif outcome == "loss":
-                    self.mining_v2_step = min(self.preset_mining_v2_max_steps, self.mining_v2_step + 1)
-                self.current_amount = self.base_amount
-                self.mining_v2_cooldown_remaining -= 1
-                return
-
-            if outcome == "loss":
-                self.mining_v2_step = min(self.preset_mining_v2_max_steps, self.mining_v2_step + 1)
-                if (
-                    self.preset_mining_v2_cooldown_trigger_losses > 0
-                    and self.consecutive_losses >= self.preset_mining_v2_cooldown_trigger_losses
-                    and self.preset_mining_v2_cooldown_rounds > 0
-                ):
-                    self.mining_v2_cooldown_remaining = self.preset_mining_v2_cooldown_rounds
-                    self.current_amount = self.base_amount
-                    return
-            else:
-                self.mining_v2_step = max(0, self.mining_v2_step - self.preset_mining_v2_recovery_steps_on_win)
+    def _activate_strategy(self) -> None:
+        self.strategy = self._compile_strategy()
+        self.strategy_state = self.strategy.initial_state()
 
-            scale = self.preset_mining_v2_loss_multiplier ** self.mining_v2_step
-            if scale > self.preset_mining_v2_max_scale:
-                scale = self.preset_mining_v2_max_scale
-            self.current_amount = self.base_amount * scale
-            return
+    def _strategy_fingerprint(self) -> str:
+        # Progresi di checkpoint hanya berlaku untuk strategi + parameter yang sama (ladder, multiplier, dst).
+        payload = json.dumps(
+            [self.currency, self.strategy.name, self.base_amount, self.coin_decimal_places, self.cfg.get("strategy", {})],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()[:16]
 
-        if self.preset_name == "pro_safe":
-            if outcome == "loss":
-                self.pro_safe_step = min(self.preset_pro_safe_max_steps, self.pro_safe_step + 1)
-            else:
-                self.pro_safe_step = max(0, self.pro_safe_step - self.preset_pro_safe_recovery_steps_on_win)
+    def _save_checkpoint(self, finished: bool = False, stop_reason: str = "") -> None:
+        self.checkpoint.save(
+            {
+                "fingerprint": self._checkpoint_fingerprint,
+                "preset": self.preset_name if self.preset_enabled else "",
+                "session": self.session_id,
+                "finished": finished,
+                "stop_reason": stop_reason,
+                "saved_at": round(time.time(), 3),
+                "amount": self.current_amount,
+                "step": self.strategy_state.step,
+                "cooldown": self.strategy_state.cooldown,
+                "rule": self.rule,
+                "bet_value": str(self.bet_value),
+                "multiplier": str(self.multiplier),
+                "total_profit": self.total_profit,
+                "bets": self.bet_count,
+                "wins": self.win_count,
+                "losses": self.loss_count,
+                "consecutive_wins": self.consecutive_wins,
+                "consecutive_losses": self.consecutive_losses,
+                "start_balance": self.start_balance,
+                "premium_target_profit_abs": self.premium_target_profit_abs,
+                "premium_stop_loss_abs": self.premium_stop_loss_abs,
+                "replay_done": self.simple_replay_done,
+                "risk": self.risk.snapshot(),
+            }
+        )
 
-            scale = self.preset_pro_safe_loss_multiplier ** self.pro_safe_step
-            if scale > self.preset_pro_safe_max_scale:
-                scale = self.preset_pro_safe_max_scale
-            self.current_amount = self.base_amount * scale
-            return
+    def _load_resume_state(self) -> Dict[str, Any] | None:
+        state = self.checkpoint.load()
+        if state.get("finished"):
+            self.warn(
+                f"Checkpoint sesi {state.get('session', '-')} sudah selesai ({state.get('stop_reason') or '-'}). "
+                "Mulai sesi baru."
+            )
+            return None
+        preset = str(state.get("preset", ""))
+        if preset != (self.preset_name if self.preset_enabled else ""):
+            # Preset yang dipilih lewat prompt di sesi asli dipakai lagi tanpa bertanya.
+            self.preset_enabled = bool(preset)
+            self.preset_name = preset
+            self.simple_system = preset
+            self._activate_strategy()
+        if state.get("fingerprint") != self._strategy_fingerprint():
+            raise ConfigError(
+                "--resume: currency/base amount/config strategi berubah sejak checkpoint dibuat. "
+                "Kembalikan config atau jalankan tanpa --resume."
+            )
+        return state
 
-        if self.preset_name == "pro_recovery":
-            if self.pro_recovery_cooldown_remaining > 0:
-                if outcome == "win":
-                    self.pro_recovery_step = max(
-                        0, self.pro_recovery_step - self.preset_pro_recovery_recovery_steps_on_win
-                    )
-                elif outcome == "loss":
-                    self.pro_recovery_step = min(self.preset_pro_recovery_max_steps, self.pro_recovery_step + 1)
-                self.current_amount = self.base_amount
-                self.pro_recovery_cooldown_remaining -= 1
-                return
-
-            if outcome == "loss":
-                self.pro_recovery_step = min(self.preset_pro_recovery_max_steps, self.pro_recovery_step + 1)
-                if (
-                    self.preset_pro_recovery_cooldown_trigger_losses > 0
-                    and self.consecutive_losses >= self.preset_pro_recovery_cooldown_trigger_losses
-                    and self.preset_pro_recovery_cooldown_rounds > 0
-                ):
-                    self.pro_recovery_cooldown_remaining = self.preset_pro_recovery_cooldown_rounds
-                    self.current_amount = self.base_amount
-                    return
+    def _restore_checkpoint(self, state: Dict[str, Any]) -> None:
+        try:
+            self.session_id = str(state["session"])
+            self.current_amount = int(state["amount"])
+            self.strategy_state.amount = self.current_amount
+            self.strategy_state.step = int(state["step"])
+            self.strategy_state.cooldown = int(state["cooldown"])
+            self.rule = str(state["rule"])
+            self.bet_value = to_decimal(state["bet_value"], "checkpoint.bet_value")
+            self.multiplier = to_decimal(state["multiplier"], "checkpoint.multiplier")
+            self.total_profit = int(state["total_profit"])
+            self.bet_count = int(state["bets"])
+            self.win_count = int(state["wins"])
+            self.loss_count = int(state["losses"])
+            self.consecutive_wins = int(state["consecutive_wins"])
+            self.consecutive_losses = int(state["consecutive_losses"])
+            self.start_balance = int(state["start_balance"])
+            self.premium_target_profit_abs = int(state["premium_target_profit_abs"])
+            self.premium_stop_loss_abs = int(state["premium_stop_loss_abs"])
+            self.simple_replay_done = int(state["replay_done"])
+            if "risk" in state:
+                self.risk.restore(state["risk"], self.total_profit)
             else:
-                self.pro_recovery_step = max(
-                    0, self.pro_recovery_step - self.preset_pro_recovery_recovery_steps_on_win
-                )
-
-            scale = self.preset_pro_recovery_loss_multiplier ** self.pro_recovery_step
-            if scale > self.preset_pro_recovery_max_scale:
-                scale = self.preset_pro_recovery_max_scale
-            self.current_amount = self.base_amount * scale
-            return
+                # Checkpoint lama tanpa metrik risiko: puncak dimulai dari profit saat ini.
+                self.risk.peak_profit = max(0, self.total_profit)
+                self.risk.drawdown = self.risk.peak_profit - self.total_profit
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ConfigError(f"--resume: isi checkpoint tidak lengkap/invalid: {exc}") from exc
+        self.info(
+            f"Resume sesi {self.session_id}: bet #{self.bet_count} | amount "
+            f"{format_units(self.current_amount, self.coin_decimal_places)} | step {self.strategy_state.step} "
+            f"| cooldown {self.strategy_state.cooldown} | profit {format_signed_units(self.total_profit, self.coin_decimal_places)}"
+        )
 
-        if self.preset_name == "pro_scalper":
-            if outcome == "win":
-                self.pro_scalper_streak += 1
-                if self.pro_scalper_streak >= self.preset_pro_scalper_max_win_streak:
-                    self.pro_scalper_streak = 0
-                    self.current_amount = self.base_amount
-                else:
-                    self.current_amount = self.current_amount * self.preset_pro_scalper_win_multiplier
-            else:
-                self.pro_scalper_streak = 0
-                self.current_amount = self.base_amount
-            return
+    def _init_premium_targets(self) -> None:
+        if self.preset_enabled and self.preset_name == "premium":
+            start_balance = units_to_decimal(self.start_balance)
+            self.premium_target_profit_abs = coin_units_ceil(
+                start_balance * self.preset_premium_daily_target_percent / Decimal("100")
+            )
+            self.premium_stop_loss_abs = coin_units_ceil(
+                start_balance * self.preset_premium_stop_loss_percent / Decimal("100")
+            )
 
-        if self.preset_name == "premium_guard":
-            if self.current_balance <= Decimal("0"):
-                self.current_amount = self.base_amount
-                return
-
-            if self.premium_guard_cooldown_remaining > 0:
-                if outcome == "loss":
-                    self.premium_guard_step = min(self.preset_premium_guard_max_steps, self.premium_guard_step + 1)
-                elif outcome == "win":
-                    self.premium_guard_step = max(0, self.premium_guard_step - 1)
-                self.current_amount = self.base_amount
-                self.premium_guard_cooldown_remaining -= 1
-                return
-
-            if outcome == "loss":
-                self.premium_guard_step = min(self.preset_premium_guard_max_steps, self.premium_guard_step + 1)
-                if (
-                    self.preset_premium_guard_cooldown_trigger_losses > 0
-                    and self.consecutive_losses >= self.preset_premium_guard_cooldown_trigger_losses
-                    and self.preset_premium_guard_cooldown_rounds > 0
-                ):
-                    self.premium_guard_cooldown_remaining = self.preset_premium_guard_cooldown_rounds
-                    self.current_amount = self.base_amount
-                    return
-            else:
-                self.premium_guard_step = max(0, self.premium_guard_step - 1)
-
-            scale = self.preset_premium_guard_loss_multiplier ** self.premium_guard_step
-            if scale > self.preset_premium_guard_max_scale:
-                scale = self.preset_premium_guard_max_scale
-            scaled_amount = self.base_amount * scale
-            risk_cap_amount = self.current_balance * self.preset_premium_guard_risk_percent / Decimal("100")
-            if risk_cap_amount > Decimal("0"):
-                scaled_amount = min(scaled_amount, risk_cap_amount)
-            self.current_amount = max(self.base_amount, scaled_amount)
+    def replay_roll(self, roll: int) -> bool:
+        # Satu bet tanpa API pada roll yang sudah diketahui (0-9999), untuk backtest.py dan strategi shadow.
+        # Pemanggil lalu menjalankan apply_strategy dan stop_reason seperti loop live.
+        if self.simple_mode_enabled:
+            self._apply_simple_runtime_controls_before_bet()
+        self.sync_bet_pair()
+        threshold = self.bet_value * 100
+        won = roll < threshold if self.rule == "under" else roll > threshold
+        profit = payout_profit(self.current_amount, self.multiplier) if won else -self.current_amount
+        self.total_profit += profit
+        self.current_balance += profit
+        self.risk.update(won, profit, self.total_profit)
+        self.bet_count += 1
+        if won:
+            self.win_count += 1
+            self.consecutive_wins += 1
+            self.consecutive_losses = 0
+        else:
+            self.loss_count += 1
+            self.consecutive_losses += 1
+            self.consecutive_wins = 0
+        return won
+
+    def _observe_shadows(self, result_value: str) -> None:
+        roll = parse_roll_value(result_value)
+        if roll is None:
             return
-
-        if self.preset_name == "premium_compound":
-            if outcome == "loss":
-                self.premium_compound_step = min(
-                    self.preset_premium_compound_max_steps, self.premium_compound_step + 1
-                )
-            else:
-                self.premium_compound_step = max(
-                    0, self.premium_compound_step - self.preset_premium_compound_recovery_steps_on_win
-                )
-
-            scale = self.preset_premium_compound_loss_multiplier ** self.premium_compound_step
-            boost_scale = Decimal("1")
-            if (
-                self.start_balance > Decimal("0")
-                and self.total_profit > Decimal("0")
-                and self.preset_premium_compound_profit_boost_percent > Decimal("0")
-            ):
-                boost_scale += (
-                    (self.total_profit / self.start_balance)
-                    * self.preset_premium_compound_profit_boost_percent
-                    / Decimal("100")
+        started = time.perf_counter()
+        for shadow in self.shadows:
+            reason = shadow.observe(roll)
+            if reason:
+                self.info(
+                    f"Shadow {shadow.label}: stop ({reason}) | balance "
+                    f"{format_units(shadow.balance, self.balance_display_precision)} {self.currency_display}"
                 )
-            scale = scale * boost_scale
-            if scale > self.preset_premium_compound_max_scale:
-                scale = self.preset_premium_compound_max_scale
-            self.current_amount = self.base_amount * scale
-            return
-
-        if self.preset_name == "premium":
-            if self.current_balance <= Decimal("0"):
-                self.current_amount = self.base_amount
-                return
-
-            if self.premium_cooldown_remaining > 0:
-                if outcome == "loss":
-                    self.premium_step = min(self.preset_premium_max_steps, self.premium_step + 1)
-                elif outcome == "win":
-                    self.premium_step = max(0, self.premium_step - self.preset_premium_recovery_steps_on_win)
-                self.current_amount = self.base_amount
-                self.premium_cooldown_remaining -= 1
-                return
-
-            if outcome == "loss":
-                self.premium_step = min(self.preset_premium_max_steps, self.premium_step + 1)
-                if (
-                    self.preset_premium_cooldown_trigger_losses > 0
-                    and self.consecutive_losses >= self.preset_premium_cooldown_trigger_losses
-                    and self.preset_premium_cooldown_rounds > 0
-                ):
-                    self.premium_cooldown_remaining = self.preset_premium_cooldown_rounds
-                    self.current_amount = self.base_amount
-                    return
-            else:
-                self.premium_step = max(0, self.premium_step - self.preset_premium_recovery_steps_on_win)
-
-            scale = self.preset_premium_loss_multiplier ** self.premium_step
-            if scale > self.preset_premium_max_scale:
-                scale = self.preset_premium_max_scale
-
-            scaled_amount = self.base_amount * scale
-
-            risk_percent = self.preset_premium_risk_percent * scale
-            if risk_percent > self.preset_premium_max_risk_percent:
-                risk_percent = self.preset_premium_max_risk_percent
-            risk_cap_amount = self.current_balance * risk_percent / Decimal("100")
-
-            target_cap_amount = scaled_amount
-            if self.premium_target_profit_abs > Decimal("0"):
-                remaining_target = self.premium_target_profit_abs - self.total_profit
-                if remaining_target > Decimal("0") and self.multiplier > Decimal("1"):
-                    amount_to_target = remaining_target / (self.multiplier - Decimal("1"))
-                    if amount_to_target > Decimal("0"):
-                        target_cap_amount = min(target_cap_amount, amount_to_target)
-
-            capped_amount = scaled_amount
-            if risk_cap_amount > Decimal("0"):
-                capped_amount = min(capped_amount, risk_cap_amount)
-            capped_amount = min(capped_amount, target_cap_amount)
-            self.current_amount = max(self.base_amount, capped_amount)
-            return
-
-        raise ConfigError(f"Preset strategy '{self.preset_name}' belum didukung.")
+        self.profiler.record("shadow", time.perf_counter() - started)
+        self._footer_dirty = True
+
+    def _shadow_line(self) -> str:
+        parts = []
+        for shadow in self.shadows:
+            status = "HALT" if shadow.halted else f"S{sum(shadow.stops.values())}"
+            parts.append(
+                f"{shadow.label} {format_units(shadow.balance, self.balance_display_precision)} "
+                f"({format_signed_units(shadow.balance - (shadow.start_balance or 0), self.profit_display_precision)}) "
+                f"DD {format_units(shadow.max_drawdown, self.profit_display_precision)} {status}"
+            )
+        return "SHADOW | " + " | ".join(parts)
 
     def apply_strategy(self, outcome: str) -> None:
         self._apply_rule_switch(outcome)
-        if self.preset_enabled:
-            self._apply_preset_strategy(outcome)
-        else:
-            self._apply_custom_strategy(outcome)
-
-        self.current_amount = self._normalize_amount(self.current_amount)
+        self.strategy_state.amount = self.current_amount
+        self.current_amount = self.strategy.advance(self.strategy_state, outcome == "win", self)
 
-        if self.current_amount <= Decimal("0"):
+        if self.current_amount <= 0:
             raise ConfigError("Nilai current_amount <= 0 setelah strategi. Cek strategy.on_win/on_loss.")
 
         self.sync_bet_pair()
@@ -2418,25 +4692,44 @@ class DiceBot:
                 return "Target harian premium tercapai"
             if self.premium_stop_loss_abs > 0 and self.total_profit <= -self.premium_stop_loss_abs:
                 return "Batas rugi premium tercapai"
-        if self.target_profit > 0 and self.total_profit >= self.target_profit:
+        if self.target_profit_units is not None and self.total_profit >= self.target_profit_units:
             return "Mencapai target_profit"
-        if self.stop_loss > 0 and self.total_profit <= -self.stop_loss:
+        if self.stop_loss_units is not None and self.total_profit <= self.stop_loss_units:
             return "Mencapai stop_loss"
-        if self.stop_on_balance_below > 0 and self.current_balance <= self.stop_on_balance_below:
+        if self.trailing_drawdown_units is not None and self.risk.drawdown >= self.trailing_drawdown_units:
+            return "Trailing drawdown tercapai"
+        if self.trailing_drawdown_ratio is not None and self.risk.drawdown > 0:
+            numerator, denominator = self.trailing_drawdown_ratio
+            if self.risk.drawdown * 100 * denominator >= numerator * (self.start_balance + self.risk.peak_profit):
+                return "Trailing drawdown tercapai"
+        if self.stop_on_balance_below_units is not None and self.current_balance <= self.stop_on_balance_below_units:
             return "Balance menyentuh stop_on_balance_below"
         if self.max_consecutive_losses > 0 and self.consecutive_losses >= self.max_consecutive_losses:
             return "Mencapai max_consecutive_losses"
         if self.max_consecutive_wins > 0 and self.consecutive_wins >= self.max_consecutive_wins:
             return "Mencapai max_consecutive_wins"
-        if self.max_amount > 0 and self.current_amount > self.max_amount:
+        if self.max_amount_units is not None and self.current_amount > self.max_amount_units:
             return "Current amount melebihi max_amount"
         return ""
 
     def print_run_config(self) -> None:
-        self.info("Koneksi API berhasil.")
+        if isinstance(self.client, PaperClient):
+            self.info("Mode PAPER   : bet disimulasikan di memori, tidak ada request ke API Wolfbet.")
+            self.info(f"Transport    : paper | realtime {to_on_off(not self.paper_fast)}")
+        else:
+            self.info("Koneksi API berhasil.")
+            self.info(f"Transport    : {self.client.transport.name} | warm {self.connection_warmup_seconds * 1000:.1f}ms")
+        if self.journal is not None:
+            self.info(
+                f"Journal      : {self.journal.path} | fsync {self.journal.fsync_policy} "
+                f"| compress {self.journal.compression}"
+            )
+        else:
+            self.info("Journal      : OFF")
+        self.info(f"Checkpoint   : {self.checkpoint.path if self.checkpoint is not None else 'OFF'}")
         self.info(f"Currency     : {self.currency}")
         self.info(f"Rule         : {self.rule}")
-        self.info(f"Base amount  : {format_decimal(self.base_amount, self.coin_decimal_places)}")
+        self.info(f"Base amount  : {format_units(self.base_amount, self.coin_decimal_places)}")
         self.info(f"Bet value    : {format_decimal(self.bet_value)}")
         self.info(f"Multiplier   : {format_decimal(self.multiplier)}")
         self.info(f"Sync mode    : {self.sync_mode} -> {self._effective_sync_mode()}")
@@ -2456,6 +4749,15 @@ class DiceBot:
         else:
             self.info("IDR value    : OFF")
         self.info(f"Sticky stats : {'ON' if self.sticky_footer_enabled else 'OFF'}")
+        if self.shadows:
+            self.info(f"Shadow       : {', '.join(shadow.label for shadow in self.shadows)}")
+        if self.trailing_drawdown_units is not None or self.trailing_drawdown_ratio is not None:
+            drawdown_limits = []
+            if self.trailing_drawdown_units is not None:
+                drawdown_limits.append(f"{format_units(self.trailing_drawdown_units, self.coin_decimal_places)} {self.currency_display}")
+            if self.trailing_drawdown_ratio is not None:
+                drawdown_limits.append(f"{format_decimal(self.trailing_drawdown_percent, 2)}% dari puncak")
+            self.info(f"Trailing DD  : {' | '.join(drawdown_limits)}")
         self.info(f"Config mode  : {'simple' if self.simple_mode_enabled else 'advanced'}")
         if self.simple_mode_enabled:
             win_inc_pct = (self.custom_on_win_multiplier - Decimal("1")) * Decimal("100")
@@ -2477,7 +4779,8 @@ class DiceBot:
                     "Chance rnd  : "
                     f"{format_decimal(self.simple_chance_random_min, 2)}%-"
                     f"{format_decimal(self.simple_chance_random_max, 2)}% "
-                    f"prec={self.simple_chance_random_precision}"
+                    f"prec={self.simple_chance_random_precision} "
+                    f"grid={len(self.chance_grid['under']) if self.chance_grid else 'OFF'}"
                 )
             self.info(
                 "Replay cfg  : "
@@ -2568,31 +4871,30 @@ class DiceBot:
                     f"{self.preset_premium_cooldown_rounds}"
                 )
                 self.info(
-                    f"Premium tgt : +{format_decimal(self.premium_target_profit_abs, self.coin_decimal_places)} "
+                    f"Premium tgt : +{format_units(self.premium_target_profit_abs, self.coin_decimal_places)} "
                     f"{self.currency_display} / "
-                    f"-{format_decimal(self.premium_stop_loss_abs, self.coin_decimal_places)} {self.currency_display}"
+                    f"-{format_units(self.premium_stop_loss_abs, self.coin_decimal_places)} {self.currency_display}"
                 )
                 self.warn("Premium note: target harian adalah batas sesi, bukan jaminan profit tanpa loss.")
-        if self.base_amount_before_normalize != self.base_amount:
+        self._print_strategy_ladder()
+        if self.base_amount_before_normalize != units_to_decimal(self.base_amount):
             self.warn(
-                f"Base amount dinormalisasi ke {format_decimal(self.base_amount, self.coin_decimal_places)} "
+                f"Base amount dinormalisasi ke {format_units(self.base_amount, self.coin_decimal_places)} "
                 f"{self.currency_display} sesuai batas desimal coin."
             )
         self.info(f"Delay        : {self.delay_seconds}s")
-        self.info(f"Start balance: {format_decimal(self.start_balance, self.coin_decimal_places)} {self.currency_display}")
+        self.info(f"Start balance: {format_units(self.start_balance, self.coin_decimal_places)} {self.currency_display}")
         self._emit_runtime_line(THEME_TEXT_DIM + "-" * 95)
 
     def summary(self) -> None:
+        self._flush_frame()
         if self._sticky_region_active:
             sys.stdout.write("\x1b[r")  # Reset scroll region
-            try:
-                # Pindah cursor ke area footer dan hapus sisa footer agar summary bersih
-                size = shutil.get_terminal_size(fallback=(120, 30))
-                start_line = max(1, size.lines - self.sticky_footer_lines + 1)
-                sys.stdout.write(f"\x1b[{start_line};1H")
-                sys.stdout.write("\x1b[J")  # Clear to end of screen
-            except Exception:
-                pass
+            # Pindah cursor ke area footer dan hapus sisa footer agar summary bersih
+            self._ensure_layout()
+            start_line = max(1, self._layout_lines - self.sticky_footer_lines + 1)
+            sys.stdout.write(f"\x1b[{start_line};1H")
+            sys.stdout.write("\x1b[J")  # Clear to end of screen
             sys.stdout.flush()
             self._sticky_region_active = False
         else:
@@ -2606,77 +4908,177 @@ class DiceBot:
         print(THEME_PRIMARY + f"Total bet             : {self.bet_count}")
         print(THEME_PRIMARY + f"Win                   : {self.win_count}")
         print(THEME_SECONDARY + f"Loss                  : {self.loss_count}")
-        print(THEME_PRIMARY + f"Start balance         : {format_decimal(self.start_balance, self.coin_decimal_places)} {self.currency_display}")
+        if self.history.size > 0:
+            rolling_label = f"Rolling {self.history.size} bet"
+            print(
+                THEME_PRIMARY
+                + f"{rolling_label:<22}: WR {format_decimal(self.history.rolling_winrate(), 2)}% "
+                f"| profit {format_signed_units(self.history.window_profit, self.profit_display_precision)}"
+            )
+        print(THEME_PRIMARY + f"Start balance         : {format_units(self.start_balance, self.coin_decimal_places)} {self.currency_display}")
         print(
             THEME_PRIMARY
-            + f"Final balance         : {format_decimal(self.current_balance, self.coin_decimal_places)} "
+            + f"Final balance         : {format_units(self.current_balance, self.coin_decimal_places)} "
             f"{self.currency_display} ({self.balance_source})"
         )
-        print(THEME_PRIMARY + f"API balance last      : {format_decimal(self.api_balance, self.coin_decimal_places)} {self.currency_display}")
-        print(THEME_PRIMARY + f"Estimated balance     : {format_decimal(self.estimated_balance, self.coin_decimal_places)} {self.currency_display}")
+        print(THEME_PRIMARY + f"API balance last      : {format_units(self.api_balance, self.coin_decimal_places)} {self.currency_display}")
+        print(THEME_PRIMARY + f"Estimated balance     : {format_units(self.estimated_balance, self.coin_decimal_places)} {self.currency_display}")
         if self.show_idr_value and self.idr_price > 0:
             print(THEME_PRIMARY + f"IDR price             : {self._format_rupiah(self.idr_price)} / {self.currency_display}")
             print(
                 THEME_PRIMARY
-                + f"Final balance (IDR)   : {self._format_rupiah(self.current_balance * self.idr_price)}"
+                + f"Final balance (IDR)   : {self._format_rupiah(units_to_decimal(self.current_balance) * self.idr_price)}"
             )
         color = THEME_PRIMARY_BRIGHT if self.total_profit >= 0 else THEME_SECONDARY_BRIGHT
-        print(color + f"Total profit/loss     : {sign}{format_decimal(self.total_profit, self.coin_decimal_places)} {self.currency_display}")
+        print(color + f"Total profit/loss     : {sign}{format_units(self.total_profit, self.coin_decimal_places)} {self.currency_display}")
         if self.show_idr_value and self.idr_price > 0:
             idr_color = THEME_PRIMARY_BRIGHT if self.total_profit >= 0 else THEME_SECONDARY_BRIGHT
-            print(idr_color + f"Total profit/loss IDR : {self._format_rupiah(self.total_profit * self.idr_price, signed=True)}")
+            print(idr_color + f"Total profit/loss IDR : {self._format_rupiah(units_to_decimal(self.total_profit) * self.idr_price, signed=True)}")
+        if self.risk.count > 0:
+            places = self.coin_decimal_places
+            print(
+                THEME_PRIMARY
+                + f"Peak balance          : {format_units(self.start_balance + self.risk.peak_profit, places)} "
+                f"{self.currency_display} (profit puncak {format_signed_units(self.risk.peak_profit, places)})"
+            )
+            print(
+                THEME_SECONDARY
+                + f"Drawdown              : sekarang {format_units(self.risk.drawdown, places)} "
+                f"({format_decimal(self._drawdown_percent(), 2)}%) | max {format_units(self.risk.max_drawdown, places)}"
+            )
+            print(
+                THEME_PRIMARY
+                + f"Profit per bet        : rata-rata {format_signed_units(round(self.risk.mean), places)} "
+                f"| stdev {format_units(round(self.risk.stddev()), places)}"
+            )
+            print(
+                THEME_PRIMARY
+                + f"Streak terpanjang     : win {self.risk.longest_win_streak} | loss {self.risk.longest_loss_streak}"
+            )
+            print(THEME_PRIMARY + f"Streak win            : {self._streak_summary(True)}")
+            print(THEME_SECONDARY + f"Streak loss           : {self._streak_summary(False)}")
+        if self.scheduler.interval > 0:
+            target_rate = 1 / self.scheduler.interval
+            print(
+                THEME_PRIMARY
+                + f"Bet cadence           : {self.scheduler.actual_rate():.2f}/{target_rate:.2f} bet/s "
+                f"| drift avg {self.scheduler.average_drift() * 1000:.1f}ms max {self.scheduler.max_drift * 1000:.1f}ms "
+                f"| missed slot {self.scheduler.missed_slots}"
+            )
+        else:
+            print(THEME_PRIMARY + f"Bet cadence           : {self.scheduler.actual_rate():.2f} bet/s (tanpa jeda)")
+        pair_cache = synced_bet_pair.cache_info()
+        print(THEME_PRIMARY + f"Koneksi API           : {self.client.connection_summary()}")
+        if self.journal is not None:
+            print(
+                THEME_PRIMARY
+                + f"Jurnal bet            : {self.journal.record_count} record -> {self.journal.path} "
+                f"| rotasi {self.journal.rotated_count} segmen"
+            )
+        if self.shadows:
+            self._print_shadow_summary()
+        print(THEME_PRIMARY + f"Pair sync cache       : hit {pair_cache.hits} | miss {pair_cache.misses} | size {pair_cache.currsize}")
+        if self.profiler.histograms["rtt"].count > 0:
+            print(THEME_TEXT_BRIGHT + "Latency per fase (ms) :      p50      p95      p99      max")
+            for phase in PhaseProfiler.PHASES:
+                histogram = self.profiler.histograms[phase]
+                if histogram.count <= 0:
+                    continue
+                p50, p95, p99 = self.profiler.percentiles_ms(phase)
+                print(
+                    THEME_PRIMARY
+                    + f"  {phase:<20}: {p50:>8.2f} {p95:>8.2f} {p99:>8.2f} {histogram.max_value * 1000:>8.2f}"
+                )
         print(THEME_TEXT_DIM + "-" * 95)
 
+    def _print_shadow_summary(self) -> None:
+        places = self.coin_decimal_places
+        print(THEME_TEXT_BRIGHT + "Shadow (kumulatif, roll live yang sama, tanpa bet):")
+        for shadow in self.shadows:
+            start_balance = shadow.start_balance or 0
+            color = THEME_PRIMARY if shadow.balance >= start_balance else THEME_SECONDARY
+            print(
+                color
+                + f"  {shadow.label:<20}: balance {format_units(start_balance, places)} -> "
+                f"{format_units(shadow.balance, places)} ({format_signed_units(shadow.balance - start_balance, places)}) "
+                f"| bet {shadow.bets} | wagered {format_units(shadow.wagered, places)} "
+                f"| max DD {format_units(shadow.max_drawdown, places)}{' | HALT' if shadow.halted else ''}"
+            )
+            if shadow.stops:
+                stops = ", ".join(f"{reason} {count}x" for reason, count in shadow.stops.items())
+                print(THEME_TEXT_DIM + f"  {'':<20}  stop: {stops} | terakhir di bet shadow #{shadow.last_stop_bet}")
+
     def run(self) -> None:
         abort_all = False
-        self.prompt_preset_choice()
+        resume_state = self._load_resume_state() if self.resume_requested else None
+        if resume_state is None:
+            self.prompt_preset_choice()
+        if self.checkpoint is not None:
+            self._checkpoint_fingerprint = self._strategy_fingerprint()
+            if not self.resume_requested and self.checkpoint.path.exists():
+                try:
+                    previous = self.checkpoint.load()
+                except ConfigError:
+                    previous = {}
+                if previous and not previous.get("finished"):
+                    self.warn(
+                        f"Checkpoint sesi {previous.get('session', '-')} belum selesai dan akan ditimpa sesi baru. "
+                        "Jalankan dengan --resume untuk melanjutkan progresinya."
+                    )
+        if self.journal is not None:
+            self.journal.open()
 
         while True:
             self._reset_session_runtime()
             session_stop_reason = ""
+            session_finished = False
 
             try:
+                self.connection_warmup_seconds = self.client.warmup()
                 self.start_balance = self.get_currency_balance()
                 self.api_balance = self.start_balance
                 self.estimated_balance = self.start_balance
                 self.current_balance = self.start_balance
-                if self.preset_enabled and self.preset_name == "premium":
-                    self.premium_target_profit_abs = (
-                        self.start_balance * self.preset_premium_daily_target_percent / Decimal("100")
-                    )
-                    self.premium_stop_loss_abs = (
-                        self.start_balance * self.preset_premium_stop_loss_percent / Decimal("100")
-                    )
-                self._update_last_bet_snapshot(
-                    state="wait",
-                    amount=self.current_amount,
-                    result_value="-",
-                    profit=Decimal("0"),
-                )
+                self._init_premium_targets()
+                if resume_state is not None:
+                    self._restore_checkpoint(resume_state)
+                    resume_state = None
+                for shadow in self.shadows:
+                    shadow.begin(self.current_balance)
+                self._footer_dirty = True
                 self._refresh_idr_price(force=True)
                 self.print_run_config()
                 if self.history_style == "classic":
                     self._print_history_header()
 
+                self.scheduler.start()
                 while True:
                     self.current_amount = self._normalize_amount(self.current_amount)
                     reason = self.stop_reason()
                     if reason:
                         session_stop_reason = reason
+                        session_finished = True
                         self.warn(f"Stop: {reason}")
                         break
 
                     if self.current_amount > self.current_balance:
                         session_stop_reason = "Current amount melebihi current balance"
+                        session_finished = True
                         self.warn(
-                            f"Stop: amount {format_decimal(self.current_amount, self.coin_decimal_places)} lebih besar dari balance "
-                            f"{format_decimal(self.current_balance, self.coin_decimal_places)}."
+                            f"Stop: amount {format_units(self.current_amount, self.coin_decimal_places)} lebih besar dari balance "
+                            f"{format_units(self.current_balance, self.coin_decimal_places)}."
                         )
                         break
 
                     try:
+                        phase_started_at = time.perf_counter()
                         self._apply_simple_runtime_controls_before_bet()
+                        phase_ended_at = time.perf_counter()
+                        self.profiler.record("controls", phase_ended_at - phase_started_at)
                         self.sync_bet_pair()
+                        phase_started_at = time.perf_counter()
+                        self.profiler.record("sync", phase_started_at - phase_ended_at)
+                        sent_at = time.time()
                         response = self.client.place_dice_bet(
                             currency=self.currency,
                             amount=self.current_amount,
@@ -2684,6 +5086,9 @@ class DiceBot:
                             multiplier=self.multiplier,
                             bet_value=self.bet_value,
                         )
+                        self.profiler.record("pace", self.client.last_pace_seconds)
+                        self.profiler.record("rtt", self.client.last_rtt_seconds)
+                        self.profiler.record("parse", self.client.last_parse_seconds)
                         self.api_error_count = 0
                     except APIError as exc:
                         self.api_error_count += 1
@@ -2693,8 +5098,8 @@ class DiceBot:
                             old_amount = self.current_amount
                             self.current_amount = self._normalize_amount(self.current_amount)
                             self.warn(
-                                f"Amount dinormalisasi dari {format_decimal(old_amount, 16)} ke "
-                                f"{format_decimal(self.current_amount, self.coin_decimal_places)} {self.currency_display}."
+                                f"Amount dinormalisasi dari {format_units(old_amount, COIN_UNIT_PLACES)} ke "
+                                f"{format_units(self.current_amount, self.coin_decimal_places)} {self.currency_display}."
                             )
                             self.api_error_count = 0
                         if "incorrect win chance given" in str(exc).lower():
@@ -2718,14 +5123,15 @@ class DiceBot:
                             self.warn("Stop: batas API error tercapai.")
                             break
                         self.warn(f"Retry loop berikutnya setelah {self.delay_seconds}s ...")
-                        time.sleep(self.delay_seconds)
+                        self.client.maintain_connection(self.scheduler.seconds_until_next())
+                        self.scheduler.wait()
                         continue
 
                     bet = response.get("bet", {})
                     user_balance = response.get("user_balance", {})
 
                     state = str(bet.get("state", "")).lower()
-                    profit = to_decimal(bet.get("profit", "0"), "bet.profit")
+                    profit = coin_units(to_decimal(bet.get("profit", "0"), "bet.profit"))
                     result_value = str(bet.get("result_value", "-"))
                     self.total_profit += profit
                     self.bet_count += 1
@@ -2748,16 +5154,19 @@ class DiceBot:
                         state = "loss"
                         state_color = THEME_SECONDARY
 
+                    phase_started_at = time.perf_counter()
                     self._update_balances(user_balance, profit)
                     self._refresh_balance_periodically()
                     self._refresh_idr_price()
+                    phase_ended_at = time.perf_counter()
+                    self.profiler.record("balance", phase_ended_at - phase_started_at)
+                    if self.journal is not None:
+                        self._journal_bet(bet, state, result_value, profit, sent_at)
+                        phase_started_at = phase_ended_at
+                        phase_ended_at = time.perf_counter()
+                        self.profiler.record("journal", phase_ended_at - phase_started_at)
 
-                    self._update_last_bet_snapshot(
-                        state=state,
-                        amount=self.current_amount,
-                        result_value=result_value,
-                        profit=profit,
-                    )
+                    self._record_history(state, self.current_amount, result_value, profit)
 
                     if self.history_style == "classic":
                         log_line = self._history_line(
@@ -2777,15 +5186,36 @@ class DiceBot:
                             profit=profit,
                         )
 
+                    phase_started_at = time.perf_counter()
+                    render_seconds = phase_started_at - phase_ended_at
                     try:
                         self.apply_strategy(state)
                     except ConfigError as exc:
                         session_stop_reason = f"Strategi error: {exc}"
                         self.error(f"Strategi error: {exc}")
                         break
+                    self.profiler.record("strategy", time.perf_counter() - phase_started_at)
 
                     self.maybe_refresh_seeds()
-                    time.sleep(self.delay_seconds)
+                    if self.shadows:
+                        # Strategi shadow dihitung setelah respons bet diproses, sebelum jeda ke bet berikutnya.
+                        self._observe_shadows(result_value)
+                    phase_started_at = time.perf_counter()
+                    if self.scheduler.seconds_until_next() >= self.footer_frame_interval:
+                        self._flush_frame()
+                    # Repaint footer masuk sampel render bet ini, bukan sleep.
+                    phase_ended_at = time.perf_counter()
+                    self.profiler.record("render", render_seconds + phase_ended_at - phase_started_at)
+                    # Checkpoint, cek/refresh koneksi keep-alive, dan tulis jurnal di jendela sleep, bukan di jalur kirim bet.
+                    if self.checkpoint is not None:
+                        self._save_checkpoint()
+                    self.client.maintain_connection(self.scheduler.seconds_until_next())
+                    if self.journal is not None:
+                        self.journal.maintain()
+                    phase_started_at = time.perf_counter()
+                    self.profiler.record("io", phase_started_at - phase_ended_at)
+                    self.scheduler.wait()
+                    self.profiler.record("sleep", time.perf_counter() - phase_started_at)
             except KeyboardInterrupt:
                 abort_all = True
                 session_stop_reason = "Stop: dihentikan oleh user (Ctrl+C)."
@@ -2794,6 +5224,11 @@ class DiceBot:
                 session_stop_reason = f"Gagal start sesi: {exc}"
                 self.error(session_stop_reason)
             finally:
+                if self.journal is not None:
+                    self.journal.flush(sync=True)
+                if self.checkpoint is not None and self.bet_count > 0:
+                    # Sesi yang berhenti karena aturan stop ditandai selesai; Ctrl+C/error API tetap bisa di-resume.
+                    self._save_checkpoint(session_finished, session_stop_reason)
                 self.summary()
 
             if abort_all:
@@ -2804,13 +5239,19 @@ class DiceBot:
                 replay_label = self._replay_reason_label(session_stop_reason)
                 self.warn(
                     f"Replay {replay_label} {self.simple_replay_done}/{self.simple_replay_count} "
-                    f"dalam {self.simple_replay_after_sec}s ..."
+                    f"dalam {0 if self.paper_fast else self.simple_replay_after_sec}s ..."
                 )
-                time.sleep(self.simple_replay_after_sec)
+                if not self.paper_fast:
+                    time.sleep(self.simple_replay_after_sec)
                 continue
 
             break
 
+        if self.idr_feed is not None:
+            self.idr_feed.stop()
+        if self.journal is not None:
+            self.journal.close()
+
 
 def validate_config(cfg: Dict[str, Any]) -> None:
     if not isinstance(cfg, dict):
@@ -2821,9 +5262,18 @@ def validate_config(cfg: Dict[str, Any]) -> None:
         if key not in cfg:
             raise ConfigError(f"Key '{key}' tidak ada di config.")
 
+    api_mode = str(cfg["api"].get("mode", "live")).lower()
+    if api_mode not in API_MODES:
+        raise ConfigError(f"api.mode harus salah satu: {', '.join(API_MODES)}.")
     token = str(cfg["api"].get("token", "")).strip()
-    if not token or "PASTE_WOLFBET_API_TOKEN" in token:
+    if api_mode == "live" and (not token or "PASTE_WOLFBET_API_TOKEN" in token):
         raise ConfigError("Isi api.token di config.json dengan API token dari Wolfbet.")
+    paper_cfg = cfg.get("paper", {}) or {}
+    if not isinstance(paper_cfg, dict):
+        raise ConfigError("paper harus object JSON.")
+    if to_decimal(paper_cfg.get("balance", 100), "paper.balance") <= 0:
+        raise ConfigError("paper.balance harus > 0.")
+    parse_toggle(paper_cfg.get("realtime", "OFF"), "paper.realtime")
 
     base_amount = to_decimal(cfg["bot"].get("base_amount"), "bot.base_amount")
     if base_amount <= 0:
@@ -3021,9 +5471,27 @@ def validate_config(cfg: Dict[str, Any]) -> None:
     if int(cfg["api"].get("retry_count", 0)) < 0:
         raise ConfigError("api.retry_count tidak boleh negatif.")
 
+    if to_decimal(cfg["bot"].get("trailing_drawdown_stop", 0), "bot.trailing_drawdown_stop") < 0:
+        raise ConfigError("bot.trailing_drawdown_stop tidak boleh negatif.")
+    trailing_percent = to_decimal(cfg["bot"].get("trailing_drawdown_percent", 0), "bot.trailing_drawdown_percent")
+    if trailing_percent < 0 or trailing_percent > 100:
+        raise ConfigError("bot.trailing_drawdown_percent harus 0-100.")
+
+    if str(cfg["api"].get("transport", "requests")).lower() not in SUPPORTED_TRANSPORTS:
+        raise ConfigError(f"api.transport harus salah satu: {', '.join(SUPPORTED_TRANSPORTS)}.")
+
+    if to_decimal(cfg["api"].get("keepalive_idle_seconds", 45), "api.keepalive_idle_seconds") < 0:
+        raise ConfigError("api.keepalive_idle_seconds tidak boleh negatif (0 = nonaktif).")
+
     if int(cfg["api"].get("rate_limit_wait_seconds", 0)) < 0:
         raise ConfigError("api.rate_limit_wait_seconds tidak boleh negatif.")
 
+    if int(cfg["api"].get("rate_limit_window_seconds", 60)) < 0:
+        raise ConfigError("api.rate_limit_window_seconds tidak boleh negatif.")
+
+    if int(cfg["api"].get("rate_limit_burst", 3)) < 1:
+        raise ConfigError("api.rate_limit_burst minimal 1.")
+
     history_style = str(cfg["display"].get("history_style", "mining")).lower()
     if history_style not in {"mining", "classic"}:
         raise ConfigError("display.history_style harus 'mining' atau 'classic'.")
@@ -3038,6 +5506,11 @@ def validate_config(cfg: Dict[str, Any]) -> None:
         raise ConfigError("display.history_width tidak boleh negatif.")
 
     parse_toggle(cfg["display"].get("sticky_stats_footer", "ON"), "display.sticky_stats_footer")
+    parse_toggle(cfg["display"].get("latency_footer", "OFF"), "display.latency_footer")
+    parse_toggle(cfg["display"].get("risk_of_ruin", "ON"), "display.risk_of_ruin")
+
+    if int(cfg["display"].get("footer_fps", 10)) < 0:
+        raise ConfigError("display.footer_fps tidak boleh negatif.")
 
     coin_decimal_places = int(cfg["display"].get("coin_decimal_places", 8))
     if coin_decimal_places < 0 or coin_decimal_places > 8:
@@ -3068,12 +5541,51 @@ def validate_config(cfg: Dict[str, Any]) -> None:
     if int(cfg["display"].get("balance_refresh_every", 20)) < 0:
         raise ConfigError("display.balance_refresh_every tidak boleh negatif.")
 
+    if int(cfg["display"].get("rolling_window", 500)) < 1:
+        raise ConfigError("display.rolling_window minimal 1.")
+
     parse_toggle(cfg["display"].get("show_idr_value", "OFF"), "display.show_idr_value")
     if int(cfg["display"].get("idr_refresh_seconds", 30)) < 0:
         raise ConfigError("display.idr_refresh_seconds tidak boleh negatif.")
 
+    journal_cfg = cfg.get("journal", {}) or {}
+    parse_toggle(journal_cfg.get("enabled", "ON"), "journal.enabled")
+    if not str(journal_cfg.get("path", "journal/bets.jsonl")).strip():
+        raise ConfigError("journal.path tidak boleh kosong.")
+    if to_decimal(journal_cfg.get("rotate_mb", 16), "journal.rotate_mb") < 0:
+        raise ConfigError("journal.rotate_mb tidak boleh negatif (0 = tanpa rotasi).")
+    if str(journal_cfg.get("fsync", "interval")).lower() not in JOURNAL_FSYNC_POLICIES:
+        raise ConfigError(f"journal.fsync harus salah satu: {', '.join(JOURNAL_FSYNC_POLICIES)}.")
+    if to_decimal(journal_cfg.get("flush_interval_seconds", 1.0), "journal.flush_interval_seconds") < 0:
+        raise ConfigError("journal.flush_interval_seconds tidak boleh negatif.")
+    journal_compress = str(journal_cfg.get("compress", "zlib")).lower()
+    if journal_compress not in JOURNAL_COMPRESSIONS:
+        raise ConfigError(f"journal.compress harus salah satu: {', '.join(JOURNAL_COMPRESSIONS)}.")
+    if journal_compress == "lzma" and lzma is None:
+        raise ConfigError("journal.compress=lzma tidak tersedia (modul lzma tidak ada di Python ini). Pakai zlib.")
+
+    checkpoint_cfg = cfg.get("checkpoint", {}) or {}
+    parse_toggle(checkpoint_cfg.get("enabled", "ON"), "checkpoint.enabled")
+    parse_toggle(checkpoint_cfg.get("fsync", "OFF"), "checkpoint.fsync")
+    if not str(checkpoint_cfg.get("path", "journal/checkpoint.json")).strip():
+        raise ConfigError("checkpoint.path tidak boleh kosong.")
+
+    shadow_cfg = cfg.get("shadow", {}) or {}
+    if not isinstance(shadow_cfg, dict):
+        raise ConfigError("shadow harus object JSON.")
+    shadow_entries = shadow_cfg.get("strategies", []) or []
+    if not isinstance(shadow_entries, list):
+        raise ConfigError("shadow.strategies harus list (nama preset atau object).")
+    if len(shadow_entries) > SHADOW_MAX_STRATEGIES:
+        raise ConfigError(f"shadow.strategies maksimal {SHADOW_MAX_STRATEGIES} strategi.")
+    for index, entry in enumerate(shadow_entries):
+        try:
+            validate_config(shadow_config(cfg, entry)[2])
+        except ConfigError as exc:
+            raise ConfigError(f"shadow.strategies[{index}]: {exc}") from exc
+
 
-def load_config(path: str) -> Dict[str, Any]:
+def load_config(path: str, paper: bool = False) -> Dict[str, Any]:
     config_path = Path(path)
     defaults = default_config()
     user_template = default_user_config_template()
@@ -3090,18 +5602,33 @@ def load_config(path: str) -> Dict[str, Any]:
         raise ConfigError(f"Format JSON invalid di {path}: {exc}") from exc
 
     merged = deep_merge(defaults, user_cfg)
+    if paper:
+        merged["api"]["mode"] = "paper"
     apply_simple_settings(merged)
     validate_config(merged)
     return merged
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="NUSANTARA BOT - dice bot Wolfbet.")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Lanjutkan progresi strategi + total sesi dari checkpoint terakhir (checkpoint.path).",
+    )
+    parser.add_argument(
+        "--paper",
+        action="store_true",
+        help="Paper trading: bet disimulasikan di memori tanpa request ke API (sama dengan api.mode=paper).",
+    )
+    args = parser.parse_args()
+
     init(autoreset=True)
     print_banner()
     try:
-        cfg = load_config("config.json")
-        client = WolfbetClient(cfg)
-        bot = DiceBot(cfg, client)
+        cfg = load_config("config.json", paper=args.paper)
+        client = build_client(cfg)
+        bot = DiceBot(cfg, client, resume=args.resume)
         bot.persist_synced_pair("config.json")
         bot.run()
     except ConfigError as exc:
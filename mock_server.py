@@ -0,0 +1,352 @@
+import argparse
+import hashlib
+import hmac
+import json
+import random
+import secrets
+import threading
+import time
+import uuid
+from decimal import Decimal, InvalidOperation, ROUND_DOWN, ROUND_HALF_UP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Tuple
+from urllib.parse import urlsplit
+
+# Server lokal pengganti Wolfbet untuk benchmark offline DiceBot.run.
+# Jalankan: python mock_server.py --port 8085
+# Lalu set api.base_url di config.json ke http://127.0.0.1:8085/api/v1
+
+API_PREFIX = "/api/v1"
+SUPPORTED_CURRENCIES = (
+    "btc", "eth", "ltc", "doge", "trx", "bch", "xrp", "usdt", "uni",
+    "sushi", "xlm", "etc", "bnb", "dot", "ada", "shib", "matic", "optim",
+)
+AMOUNT_PLACES = 8
+BALANCE_PLACES = 10
+MULTIPLIER_TOLERANCE = Decimal("0.0001")
+
+
+def plain(value: Decimal, places: int) -> str:
+    return format(value.quantize(Decimal("1").scaleb(-places), rounding=ROUND_DOWN), "f")
+
+
+def roll_dice(server_seed: str, client_seed: str, nonce: int) -> Decimal:
+    # Skema provably fair umum: HMAC-SHA256(server_seed, "client_seed:nonce"),
+    # ambil potongan 5 hex sampai dapat angka < 1_000_000, lalu mod 10000.
+    digest = hmac.new(server_seed.encode(), f"{client_seed}:{nonce}".encode(), hashlib.sha256).hexdigest()
+    for idx in range(0, len(digest) - 4, 5):
+        number = int(digest[idx:idx + 5], 16)
+        if number < 1_000_000:
+            return Decimal(number % 10000).scaleb(-2)
+    return Decimal("99.99")
+
+
+class StandInError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class StandInAccount:
+    def __init__(self, start_balance: Decimal) -> None:
+        self.balances = {currency: start_balance for currency in SUPPORTED_CURRENCIES}
+        self.server_seed = secrets.token_hex(32)
+        self.client_seed = secrets.token_hex(12)
+        self.nonce = 0
+        self.stats: Dict[str, Dict[str, Decimal]] = {}
+        self.window_started = 0.0
+        self.window_used = 0
+
+
+class StandInState:
+    def __init__(
+        self,
+        start_balance: Decimal,
+        rate_limit: int,
+        rate_window: float,
+        latency_ms: float,
+        jitter_ms: float,
+    ) -> None:
+        self.start_balance = start_balance
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.accounts: Dict[str, StandInAccount] = {}
+        self.lock = threading.Lock()
+
+    def account(self, token: str) -> StandInAccount:
+        account = self.accounts.get(token)
+        if account is None:
+            account = StandInAccount(self.start_balance)
+            self.accounts[token] = account
+        return account
+
+    def consume_rate(self, account: StandInAccount) -> Tuple[bool, int]:
+        if self.rate_limit <= 0:
+            return True, 0
+        now = time.monotonic()
+        if now - account.window_started >= self.rate_window:
+            account.window_started = now
+            account.window_used = 0
+        if account.window_used >= self.rate_limit:
+            return False, 0
+        account.window_used += 1
+        return True, self.rate_limit - account.window_used
+
+    def inject_latency(self) -> None:
+        delay_ms = self.latency_ms
+        if self.jitter_ms > 0:
+            delay_ms += random.uniform(0, self.jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+    def balances(self, account: StandInAccount) -> Dict[str, Any]:
+        return {
+            "balances": [
+                {
+                    "amount": plain(amount, BALANCE_PLACES),
+                    "currency": currency,
+                    "withdraw_fee": "0.0000000000",
+                    "withdraw_minimum_amount": "0.0000000000",
+                    "payment_id_required": 0,
+                }
+                for currency, amount in account.balances.items()
+            ]
+        }
+
+    def place_bet(self, account: StandInAccount, payload: Dict[str, Any]) -> Dict[str, Any]:
+        currency = str(payload.get("currency", "")).lower()
+        if currency not in account.balances:
+            raise StandInError(422, "The selected currency is invalid.")
+        if str(payload.get("game", "")).lower() != "dice":
+            raise StandInError(422, "The selected game is invalid.")
+        rule = str(payload.get("rule", "")).lower()
+        if rule not in {"under", "over"}:
+            raise StandInError(422, "The selected rule is invalid.")
+
+        try:
+            amount = Decimal(str(payload.get("amount")))
+            multiplier = Decimal(str(payload.get("multiplier")))
+            bet_value = Decimal(str(payload.get("bet_value")))
+        except (InvalidOperation, TypeError):
+            raise StandInError(422, "The given data was invalid.")
+
+        if amount <= 0:
+            raise StandInError(422, "The amount must be greater than 0.")
+        if -amount.as_tuple().exponent > AMOUNT_PLACES:
+            raise StandInError(400, "Amount scale is too high.")
+        if bet_value <= 0 or bet_value >= Decimal("99.99"):
+            raise StandInError(422, "The bet value is out of range.")
+
+        chance = bet_value if rule == "under" else Decimal("99.99") - bet_value
+        expected = (Decimal("99") / chance).quantize(Decimal("0.0001"), rounding=ROUND_HALF_UP)
+        if abs(expected - multiplier) > MULTIPLIER_TOLERANCE:
+            raise StandInError(400, "Incorrect win chance given.")
+
+        balance = account.balances[currency]
+        if amount > balance:
+            raise StandInError(400, "Insufficient balance.")
+
+        account.nonce += 1
+        result_value = roll_dice(account.server_seed, account.client_seed, account.nonce)
+        won = result_value < bet_value if rule == "under" else result_value > bet_value
+        if won:
+            profit = (amount * (multiplier - Decimal("1"))).quantize(
+                Decimal("1").scaleb(-AMOUNT_PLACES), rounding=ROUND_DOWN
+            )
+        else:
+            profit = -amount
+        balance += profit
+        account.balances[currency] = balance
+
+        stats = account.stats.setdefault(
+            currency,
+            {"total_bets": Decimal("0"), "win": Decimal("0"), "lose": Decimal("0"),
+             "waggered": Decimal("0"), "profit": Decimal("0")},
+        )
+        stats["total_bets"] += 1
+        stats["win" if won else "lose"] += 1
+        stats["waggered"] += amount
+        stats["profit"] += profit
+
+        return {
+            "bet": {
+                "hash": str(uuid.uuid4()),
+                "nonce": account.nonce,
+                "currency": currency,
+                "amount": plain(amount, AMOUNT_PLACES),
+                "profit": plain(profit, AMOUNT_PLACES),
+                "multiplier": format(multiplier, "f"),
+                "bet_value": format(bet_value, "f"),
+                "result_value": format(result_value, "f"),
+                "state": "win" if won else "loss",
+                "published_at": int(time.time()),
+                "game": {"id": 1, "name": "dice", "margin": "1", "min_roll": "0", "max_roll": "99.99"},
+            },
+            "user_balance": {"amount": plain(balance, BALANCE_PLACES), "currency": currency},
+        }
+
+    def refresh_client_seed(self, account: StandInAccount, payload: Dict[str, Any]) -> Dict[str, Any]:
+        seed = str(payload.get("client_seed", ""))
+        if len(seed) < 10 or len(seed) > 64:
+            raise StandInError(422, "The client seed must be between 10 and 64 characters.")
+        account.client_seed = seed
+        account.nonce = 0
+        return {"seed": seed}
+
+    def refresh_server_seed(self, account: StandInAccount) -> Dict[str, Any]:
+        account.server_seed = secrets.token_hex(32)
+        account.nonce = 0
+        return {"server_seed_hashed": hashlib.sha256(account.server_seed.encode()).hexdigest()}
+
+    def stats_bets(self, account: StandInAccount) -> Dict[str, Any]:
+        dice: Dict[str, Any] = {}
+        for currency, stats in account.stats.items():
+            dice[currency] = {
+                "total_bets": str(stats["total_bets"]),
+                "win": str(stats["win"]),
+                "lose": str(stats["lose"]),
+                "waggered": plain(stats["waggered"], AMOUNT_PLACES),
+                "waggered_usd": "0",
+                "currency": currency,
+                "profit": plain(stats["profit"], AMOUNT_PLACES),
+            }
+        return {"dice": dice}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "WolfbetStandIn/1.0"
+    # Header dan body dikirim terpisah; tanpa TCP_NODELAY tiap response tertahan delayed ACK (~40ms),
+    # padahal server asli mengirimnya sekaligus.
+    disable_nagle_algorithm = True
+    state: StandInState
+
+    def log_message(self, format: str, *args: Any) -> None:
+        return
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def _read_payload(self) -> Dict[str, Any]:
+        length = int(self.headers.get("Content-Length") or 0)
+        if length <= 0:
+            return {}
+        raw = self.rfile.read(length)
+        try:
+            payload = json.loads(raw.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            raise StandInError(400, "Malformed JSON body.")
+        if not isinstance(payload, dict):
+            raise StandInError(400, "Malformed JSON body.")
+        return payload
+
+    def _send(self, status: int, body: Dict[str, Any], remaining: int | None = None) -> None:
+        raw = json.dumps(body, separators=(",", ":")).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(raw)))
+        if self.state.rate_limit > 0:
+            self.send_header("x-ratelimit-limit", str(self.state.rate_limit))
+            self.send_header("x-ratelimit-remaining", str(max(0, remaining or 0)))
+        if status == 429:
+            self.send_header("Retry-After", str(int(self.state.rate_window)))
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def _dispatch(self, method: str) -> None:
+        path = urlsplit(self.path).path.rstrip("/")
+        if path.startswith(API_PREFIX):
+            path = path[len(API_PREFIX):]
+
+        try:
+            payload = self._read_payload() if method == "POST" else {}
+        except StandInError as exc:
+            self._send(exc.status, {"error": exc.message})
+            return
+
+        auth = str(self.headers.get("Authorization", "")).strip()
+        if not auth.lower().startswith("bearer ") or not auth[7:].strip():
+            self._send(401, {"error": "Unauthenticated."})
+            return
+        token = auth[7:].strip()
+
+        self.state.inject_latency()
+        with self.state.lock:
+            account = self.state.account(token)
+            allowed, remaining = self.state.consume_rate(account)
+            if not allowed:
+                status, body = 429, {"error": "Too Many Attempts."}
+            else:
+                try:
+                    status, body = 200, self._route(method, path, account, payload)
+                except StandInError as exc:
+                    status, body = exc.status, {"error": exc.message}
+        self._send(status, body, remaining)
+
+    def _route(self, method: str, path: str, account: StandInAccount, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if method == "GET" and path == "/user/balances":
+            return self.state.balances(account)
+        if method == "POST" and path == "/bet/place":
+            return self.state.place_bet(account, payload)
+        if method == "POST" and path == "/user/seed/refresh":
+            return self.state.refresh_client_seed(account, payload)
+        if method == "GET" and path == "/game/seed/refresh":
+            return self.state.refresh_server_seed(account)
+        if method == "GET" and path == "/user/stats/bets":
+            return self.state.stats_bets(account)
+        raise StandInError(404, f"Route {method} {path} tidak ada.")
+
+
+def build_server(
+    host: str = "127.0.0.1",
+    port: int = 8085,
+    start_balance: Decimal = Decimal("100"),
+    rate_limit: int = 0,
+    rate_window: float = 60.0,
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+) -> ThreadingHTTPServer:
+    state = StandInState(start_balance, rate_limit, rate_window, latency_ms, jitter_ms)
+    handler = type("BoundStandInHandler", (StandInHandler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Server lokal pengganti Wolfbet API untuk benchmark offline.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8085)
+    parser.add_argument("--balance", default="100", help="Saldo awal tiap currency per token.")
+    parser.add_argument("--rate-limit", type=int, default=0, help="Maks request per window per token (0 = tanpa limit).")
+    parser.add_argument("--rate-window", type=float, default=60.0, help="Panjang window rate limit (detik).")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latency tetap tiap request (ms).")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Tambahan latency acak 0..N ms.")
+    args = parser.parse_args()
+
+    server = build_server(
+        host=args.host,
+        port=args.port,
+        start_balance=Decimal(args.balance),
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+    )
+    print(f"Wolfbet stand-in jalan di http://{args.host}:{args.port}{API_PREFIX}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,672 @@
+import argparse
+import json
+import math
+import sys
+import time
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError as exc:
+    print(f"Dependency belum terpasang: {exc}")
+    print("Install dulu: pip install numpy")
+    sys.exit(1)
+
+from main import (
+    SUPPORTED_PRESETS,
+    ConfigError,
+    DiceBot,
+    RuinSolver,
+    StepLadderStrategy,
+    WolfbetClient,
+    apply_simple_settings,
+    deep_merge,
+    default_config,
+    coin_units,
+    format_decimal,
+    normalize_coin_units,
+    payout_profit,
+    to_decimal,
+    units_to_decimal,
+    validate_config,
+)
+
+# Monte Carlo vectorized untuk semua preset DiceBot. Semua nilai coin disimpan
+# sebagai integer satuan 1e-8 (skala amount/profit API, sama seperti DiceBot),
+# jadi hasilnya identik bit-per-bit dengan strategi DiceBot (BetStrategy.advance).
+# Cek kesetaraan: python simulator.py --verify
+
+UNIT_PLACES = 8
+UNIT = 10 ** UNIT_PLACES
+AMOUNT_CAP = 10 ** 17
+ROLL_OUTCOMES = 10000
+
+STOP_RUNNING = 0
+STOP_REASONS = (
+    "",
+    "Mencapai max_bets",
+    "Mencapai target_profit",
+    "Mencapai stop_loss",
+    "Balance menyentuh stop_on_balance_below",
+    "Mencapai max_consecutive_losses",
+    "Mencapai max_consecutive_wins",
+    "Current amount melebihi max_amount",
+    "Current amount melebihi current balance",
+    "Strategi error",
+    "Horizon simulasi habis",
+    "Trailing drawdown tercapai",
+)
+STOP_MAX_BETS = 1
+STOP_TARGET = 2
+STOP_LOSS = 3
+STOP_BALANCE = 4
+STOP_CONS_LOSSES = 5
+STOP_CONS_WINS = 6
+STOP_MAX_AMOUNT = 7
+STOP_INSUFFICIENT = 8
+STOP_STRATEGY = 9
+STOP_HORIZON = 10
+STOP_DRAWDOWN = 11
+BUST_CODES = (STOP_BALANCE, STOP_INSUFFICIENT)
+
+STEP_PRESETS = ("mining", "mining_v2", "pro_safe", "pro_recovery")
+
+
+def units_floor(value: Decimal) -> int:
+    return math.floor(value * UNIT)
+
+
+def units_ceil(value: Decimal) -> int:
+    return math.ceil(value * UNIT)
+
+
+def mul_floor(amount: "np.ndarray", ratio: Tuple[int, int]) -> "np.ndarray":
+    # floor(amount * p / q) tanpa overflow int64 untuk amount <= AMOUNT_CAP.
+    p, q = ratio
+    return (amount // q) * p + ((amount % q) * p) // q
+
+
+def load_sim_config(path: str) -> Dict[str, Any]:
+    config_path = Path(path)
+    user_cfg: Dict[str, Any] = {}
+    if config_path.exists() and config_path.stat().st_size > 0:
+        try:
+            user_cfg = json.loads(config_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError as exc:
+            raise ConfigError(f"Format JSON invalid di {path}: {exc}") from exc
+    merged = deep_merge(default_config(), user_cfg)
+    apply_simple_settings(merged)
+    token = str(merged["api"].get("token", "")).strip()
+    if not token or "PASTE_WOLFBET_API_TOKEN" in token:
+        # Simulasi tidak butuh token asli, hanya lolos validasi.
+        merged["api"]["token"] = "simulator"
+    validate_config(merged)
+    return merged
+
+
+def build_bot(cfg: Dict[str, Any], preset: str | None = None) -> DiceBot:
+    bot = DiceBot(cfg, WolfbetClient(cfg))
+    if preset is not None:
+        bot.current_amount = bot.base_amount
+        bot.preset_enabled = bool(preset) and preset != "custom"
+        bot.preset_name = preset if bot.preset_enabled else ""
+        bot._activate_strategy()
+    # hilo_random tidak mengubah peluang pada mode lock_multiplier, jadi simulasi pakai rule tetap.
+    bot.simple_hilo_random = False
+    return bot
+
+
+def resolve_rule_pairs(bot: DiceBot) -> Dict[str, Tuple[Decimal, Decimal]]:
+    if bot.simple_mode_enabled:
+        bot._apply_simple_runtime_controls_before_bet()
+    bot.sync_bet_pair()
+    first_rule = bot.rule
+    pairs = {first_rule: (bot.bet_value, bot.multiplier)}
+    if not (bot.switch_rule_on_win or bot.switch_rule_on_loss):
+        return pairs
+
+    other_rule = "over" if first_rule == "under" else "under"
+    bot.rule = other_rule
+    bot.sync_bet_pair()
+    pairs[other_rule] = (bot.bet_value, bot.multiplier)
+    bot.rule = first_rule
+    bot.sync_bet_pair()
+    if (bot.bet_value, bot.multiplier) != pairs[first_rule]:
+        raise ConfigError("Simulasi: pair bet_value/multiplier tidak stabil saat switch rule.")
+    return pairs
+
+
+class SimulationResult:
+    def __init__(self, sessions: int) -> None:
+        self.sessions = sessions
+        self.bets = np.zeros(sessions, dtype=np.int64)
+        self.total_profit = np.zeros(sessions, dtype=np.int64)
+        self.wagered = np.zeros(sessions, dtype=np.int64)
+        self.max_drawdown = np.zeros(sessions, dtype=np.int64)
+        self.final_amount = np.zeros(sessions, dtype=np.int64)
+        self.stop_code = np.zeros(sessions, dtype=np.int8)
+        self.amount_trace: "np.ndarray | None" = None
+        self.elapsed = 0.0
+
+    def total_bets(self) -> int:
+        return int(self.bets.sum())
+
+    def bust_probability(self) -> float:
+        return float(np.isin(self.stop_code, BUST_CODES).mean()) if self.sessions else 0.0
+
+    def stop_distribution(self) -> Dict[str, float]:
+        counts = np.bincount(self.stop_code, minlength=len(STOP_REASONS))
+        return {
+            STOP_REASONS[code]: counts[code] / self.sessions
+            for code in range(1, len(STOP_REASONS))
+            if counts[code] > 0
+        }
+
+    def drawdown_percentiles(self, points: Tuple[int, ...] = (50, 90, 99)) -> Dict[int, Decimal]:
+        values = np.percentile(self.max_drawdown, points, method="lower")
+        return {point: units_to_decimal(int(value)) for point, value in zip(points, values)}
+
+    def time_to_target(self, points: Tuple[int, ...] = (50, 90, 99)) -> Dict[int, int]:
+        hits = self.bets[self.stop_code == STOP_TARGET]
+        if hits.size == 0:
+            return {}
+        values = np.percentile(hits, points, method="lower")
+        return {point: int(value) for point, value in zip(points, values)}
+
+
+class VectorSimulator:
+    def __init__(self, bot: DiceBot, start_balance: Decimal, horizon: int) -> None:
+        if bot.simple_mode_enabled and bot.simple_chance_random_enabled:
+            raise ConfigError("Simulasi belum mendukung simple.chance_random=ON (pair harus tetap).")
+        if not start_balance.is_finite() or start_balance <= 0:
+            raise ConfigError("Saldo awal simulasi harus > 0.")
+
+        self.preset = bot.preset_name if bot.preset_enabled else "custom"
+        if self.preset not in SUPPORTED_PRESETS and self.preset != "custom":
+            raise ConfigError(f"Simulasi belum mendukung preset '{self.preset}'.")
+
+        self.start_balance = coin_units(start_balance)
+        if self.start_balance * 10 > AMOUNT_CAP:
+            raise ConfigError("Saldo awal simulasi terlalu besar.")
+        limits = [limit for limit in (horizon, bot.max_bets) if limit > 0]
+        self.horizon = min(limits) if limits else 0
+        if self.horizon <= 0:
+            raise ConfigError("Horizon simulasi harus > 0 (isi --bets atau bot.max_bets).")
+        self.horizon_code = STOP_MAX_BETS if bot.max_bets > 0 and self.horizon >= bot.max_bets else STOP_HORIZON
+
+        self.grid = 10 ** (UNIT_PLACES - bot.coin_decimal_places)
+        self.base = bot.base_amount
+
+        pairs = resolve_rule_pairs(bot)
+        self.rules = tuple(pairs.keys())
+        self.under_threshold = np.zeros(2, dtype=np.int64)
+        self.is_under = np.zeros(2, dtype=bool)
+        self.win_ratio: List[Tuple[int, int]] = []
+        for idx, rule in enumerate(self.rules):
+            bet_value, multiplier = pairs[rule]
+            scaled = bet_value * 100
+            self.is_under[idx] = rule == "under"
+            self.under_threshold[idx] = math.ceil(scaled) if rule == "under" else math.floor(scaled)
+            self.win_ratio.append((multiplier - Decimal("1")).as_integer_ratio())
+        self.pairs = pairs
+        self.switch_on_win = bot.switch_rule_on_win and len(self.rules) > 1
+        self.switch_on_loss = bot.switch_rule_on_loss and len(self.rules) > 1
+
+        self.max_bets = bot.max_bets
+        self.target = units_ceil(bot.target_profit) if bot.target_profit > 0 else 0
+        self.stop_loss = units_floor(-bot.stop_loss) if bot.stop_loss > 0 else 0
+        self.drawdown_stop = bot.trailing_drawdown_units or 0
+        self.drawdown_ratio = bot.trailing_drawdown_ratio
+        self.balance_stop = units_floor(bot.stop_on_balance_below) if bot.stop_on_balance_below > 0 else 0
+        self.max_amount = units_floor(bot.max_amount) if bot.max_amount > 0 else 0
+        self.max_cons_losses = bot.max_consecutive_losses
+        self.max_cons_wins = bot.max_consecutive_wins
+
+        self._compile_preset(bot)
+
+    def _normalized_units(self, bot: DiceBot, numerator: int, denominator: int = 1) -> int:
+        return min(normalize_coin_units(numerator, bot.coin_decimal_places, denominator), AMOUNT_CAP)
+
+    def _compile_preset(self, bot: DiceBot) -> None:
+        preset = self.preset
+        self.table = np.zeros(1, dtype=np.int64)
+        if preset == "custom":
+            self.reset_on_win = bot.custom_on_win_reset
+            self.reset_on_loss = bot.custom_on_loss_reset
+            self.win_mult = bot.custom_on_win_multiplier.as_integer_ratio()
+            self.loss_mult = bot.custom_on_loss_multiplier.as_integer_ratio()
+            self.win_add = self._addition_units(bot.custom_on_win_addition)
+            self.loss_add = self._addition_units(bot.custom_on_loss_addition)
+            return
+        if preset == "martingale":
+            self.loss_mult = bot.preset_martingale_multiplier.as_integer_ratio()
+            return
+        if preset in {"paroli", "anti_martingale"}:
+            self.win_mult = bot.preset_paroli_multiplier.as_integer_ratio()
+            self.max_win_streak = bot.preset_paroli_max_win_streak
+            return
+        if preset == "fibonacci":
+            values = []
+            fib_value, fib_next = 1, 1
+            unit_num, unit_den = bot.preset_fibonacci_unit.as_integer_ratio()
+            while True:
+                units = self._normalized_units(bot, self.base * unit_num * fib_value, unit_den)
+                values.append(units)
+                if units >= AMOUNT_CAP or len(values) > self.horizon:
+                    break
+                fib_value, fib_next = fib_next, fib_value + fib_next
+            self.table = np.array(values, dtype=np.int64)
+            self.step_back = bot.preset_fibonacci_step_back_on_win
+            return
+        if preset == "dalembert":
+            values = []
+            step_num, step_den = bot.preset_dalembert_step.as_integer_ratio()
+            for level in range(self.horizon + 1):
+                units = self._normalized_units(bot, self.base * (step_den + step_num * level), step_den)
+                values.append(units)
+                if units >= AMOUNT_CAP:
+                    break
+            self.table = np.array(values, dtype=np.int64)
+            return
+        if preset in STEP_PRESETS:
+            ladder = bot.strategy
+            self.recover = ladder.recovery_steps_on_win
+            self.cooldown_trigger = ladder.cooldown_trigger_losses
+            self.cooldown_rounds = ladder.cooldown_rounds
+            self.table = np.array([min(amount, AMOUNT_CAP) for amount in ladder.ladder], dtype=np.int64)
+            self.max_steps = ladder.max_steps
+            self.cooldown_enabled = ladder.cooldown_enabled
+            # Shield mining memakai 1 ronde saat trigger, cooldown v2/pro_recovery tidak.
+            self.cooldown_after_trigger = ladder.cooldown_after_trigger
+            return
+        if preset == "flat":
+            return
+        raise ConfigError(f"Simulasi belum mendukung preset '{preset}'.")
+
+    def _addition_units(self, addition: Decimal) -> int:
+        scaled = addition * UNIT
+        if scaled != scaled.to_integral_value():
+            raise ConfigError("Simulasi: amount_addition harus kelipatan 0.00000001.")
+        return int(scaled)
+
+    def _normalize(self, raw: "np.ndarray", positive: "np.ndarray") -> "np.ndarray":
+        normalized = (raw // self.grid) * self.grid
+        normalized = np.where(positive & (normalized <= 0), self.grid, normalized)
+        return np.minimum(normalized, AMOUNT_CAP)
+
+    def _grow(self, amount: "np.ndarray", ratio: Tuple[int, int], addition: int) -> "np.ndarray":
+        # normalize(amount * ratio + addition); positif dicek dari nilai eksak, bukan hasil floor.
+        p, q = ratio
+        raw = mul_floor(amount, ratio) + addition
+        has_fraction = ((amount % q) * p) % q != 0
+        return self._normalize(raw, (raw > 0) | ((raw == 0) & has_fraction))
+
+    def _next_amount(
+        self,
+        win: "np.ndarray",
+        amount: "np.ndarray",
+        step: "np.ndarray",
+        cooldown: "np.ndarray",
+        cons_losses: "np.ndarray",
+    ) -> "np.ndarray":
+        preset = self.preset
+        base = self.base
+        loss = ~win
+
+        if preset == "flat":
+            return np.full_like(amount, base)
+
+        if preset == "martingale":
+            return np.where(win, base, self._grow(amount, self.loss_mult, 0))
+
+        if preset == "custom":
+            on_win = base if self.reset_on_win else self._grow(amount, self.win_mult, self.win_add)
+            on_loss = base if self.reset_on_loss else self._grow(amount, self.loss_mult, self.loss_add)
+            return np.where(win, on_win, on_loss)
+
+        if preset in {"paroli", "anti_martingale"}:
+            step += win
+            step[loss] = 0
+            capped = win & (step >= self.max_win_streak)
+            step[capped] = 0
+            return np.where(win & ~capped, self._grow(amount, self.win_mult, 0), base)
+
+        if preset == "fibonacci":
+            np.copyto(step, np.where(loss, step + 1, np.maximum(0, step - self.step_back)))
+            return self.table[np.minimum(step, self.table.size - 1)]
+
+        if preset == "dalembert":
+            np.copyto(step, np.where(loss, step + 1, np.maximum(0, step - 1)))
+            return self.table[np.minimum(step, self.table.size - 1)]
+
+        # Preset berbasis step + cooldown/shield.
+        stepped = np.where(loss, np.minimum(self.max_steps, step + 1), np.maximum(0, step - self.recover))
+        np.copyto(step, stepped)
+        in_cooldown = cooldown > 0
+        amount_next = self.table[step]
+        amount_next = np.where(in_cooldown, base, amount_next)
+        cooldown[in_cooldown] -= 1
+        if self.cooldown_enabled:
+            triggered = ~in_cooldown & loss & (cons_losses >= self.cooldown_trigger)
+            amount_next = np.where(triggered, base, amount_next)
+            cooldown[triggered] = max(0, self.cooldown_after_trigger)
+        return amount_next
+
+    def _stop_codes(
+        self,
+        bets: int,
+        profit: "np.ndarray",
+        balance: "np.ndarray",
+        peak: "np.ndarray",
+        amount: "np.ndarray",
+        cons_losses: "np.ndarray",
+        cons_wins: "np.ndarray",
+    ) -> "np.ndarray":
+        codes = np.zeros(profit.shape, dtype=np.int8)
+        checks: List[Tuple[int, "np.ndarray"]] = []
+        if self.max_bets > 0:
+            checks.append((STOP_MAX_BETS, bets >= self.max_bets))
+        if self.target > 0:
+            checks.append((STOP_TARGET, profit >= self.target))
+        if self.stop_loss < 0:
+            checks.append((STOP_LOSS, profit <= self.stop_loss))
+        if self.drawdown_stop > 0:
+            checks.append((STOP_DRAWDOWN, peak - balance >= self.drawdown_stop))
+        if self.drawdown_ratio is not None:
+            # Sama dengan DiceBot.stop_reason: drawdown * 100 >= persen * saldo puncak, tanpa pembagian.
+            numerator, denominator = self.drawdown_ratio
+            drop = peak - balance
+            checks.append((STOP_DRAWDOWN, (drop > 0) & (drop * (100 * denominator) >= peak * numerator)))
+        if self.balance_stop > 0:
+            checks.append((STOP_BALANCE, balance <= self.balance_stop))
+        if self.max_cons_losses > 0:
+            checks.append((STOP_CONS_LOSSES, cons_losses >= self.max_cons_losses))
+        if self.max_cons_wins > 0:
+            checks.append((STOP_CONS_WINS, cons_wins >= self.max_cons_wins))
+        if self.max_amount > 0:
+            checks.append((STOP_MAX_AMOUNT, amount > self.max_amount))
+        checks.append((STOP_INSUFFICIENT, amount > balance))
+        checks.append((self.horizon_code, bets >= self.horizon))
+        for code, hit in reversed(checks):
+            codes[hit] = code
+        return codes
+
+    def run(
+        self,
+        sessions: int,
+        seed: int | None = None,
+        rolls: "np.ndarray | None" = None,
+        record: bool = False,
+    ) -> SimulationResult:
+        result = SimulationResult(sessions)
+        rng = np.random.default_rng(seed)
+        if record:
+            result.amount_trace = np.full((self.horizon, sessions), -1, dtype=np.int64)
+
+        ids = np.arange(sessions)
+        amount = np.full(sessions, self.base, dtype=np.int64)
+        profit = np.zeros(sessions, dtype=np.int64)
+        wagered = np.zeros(sessions, dtype=np.int64)
+        peak = np.full(sessions, self.start_balance, dtype=np.int64)
+        drawdown = np.zeros(sessions, dtype=np.int64)
+        step = np.zeros(sessions, dtype=np.int64)
+        cooldown = np.zeros(sessions, dtype=np.int64)
+        cons_losses = np.zeros(sessions, dtype=np.int64)
+        cons_wins = np.zeros(sessions, dtype=np.int64)
+        rule = np.zeros(sessions, dtype=np.int64)
+        win_ratios = self.win_ratio
+
+        started = time.perf_counter()
+        for bet_index in range(self.horizon + 1):
+            balance = self.start_balance + profit
+            codes = self._stop_codes(bet_index, profit, balance, peak, amount, cons_losses, cons_wins)
+            stopped = codes != STOP_RUNNING
+            if stopped.any():
+                done = ids[stopped]
+                result.stop_code[done] = codes[stopped]
+                result.bets[done] = bet_index
+                result.total_profit[done] = profit[stopped]
+                result.wagered[done] = wagered[stopped]
+                result.max_drawdown[done] = drawdown[stopped]
+                result.final_amount[done] = amount[stopped]
+                keep = ~stopped
+                ids = ids[keep]
+                amount, profit, wagered = amount[keep], profit[keep], wagered[keep]
+                peak, drawdown, step, cooldown = peak[keep], drawdown[keep], step[keep], cooldown[keep]
+                cons_losses, cons_wins, rule = cons_losses[keep], cons_wins[keep], rule[keep]
+            if ids.size == 0:
+                break
+
+            if record:
+                result.amount_trace[bet_index, ids] = amount
+            roll = rolls[ids, bet_index] if rolls is not None else rng.integers(0, ROLL_OUTCOMES, ids.size)
+            threshold = self.under_threshold[rule]
+            win = np.where(self.is_under[rule], roll < threshold, roll > threshold)
+
+            if len(win_ratios) == 1:
+                win_profit = mul_floor(amount, win_ratios[0])
+            else:
+                win_profit = np.where(rule == 0, mul_floor(amount, win_ratios[0]), mul_floor(amount, win_ratios[1]))
+            profit += np.where(win, win_profit, -amount)
+            wagered += amount
+            balance = self.start_balance + profit
+            np.maximum(peak, balance, out=peak)
+            np.maximum(drawdown, peak - balance, out=drawdown)
+
+            cons_wins = np.where(win, cons_wins + 1, 0)
+            cons_losses = np.where(win, 0, cons_losses + 1)
+            if self.switch_on_win or self.switch_on_loss:
+                flip = (win & self.switch_on_win) | (~win & self.switch_on_loss)
+                rule = rule ^ flip
+
+            amount = self._next_amount(win, amount, step, cooldown, cons_losses)
+            broken = amount <= 0
+            if broken.any():
+                done = ids[broken]
+                result.stop_code[done] = STOP_STRATEGY
+                result.bets[done] = bet_index + 1
+                result.total_profit[done] = profit[broken]
+                result.wagered[done] = wagered[broken]
+                result.max_drawdown[done] = drawdown[broken]
+                result.final_amount[done] = amount[broken]
+                keep = ~broken
+                ids = ids[keep]
+                amount, profit, wagered = amount[keep], profit[keep], wagered[keep]
+                peak, drawdown, step, cooldown = peak[keep], drawdown[keep], step[keep], cooldown[keep]
+                cons_losses, cons_wins, rule = cons_losses[keep], cons_wins[keep], rule[keep]
+
+        result.elapsed = time.perf_counter() - started
+        return result
+
+
+def scalar_reference(
+    bot: DiceBot, start_balance: Decimal, rolls: "np.ndarray", horizon: int, rule: str
+) -> Tuple[List[int], int, str]:
+    # Jalur skalar memakai DiceBot asli (stop_reason + apply_strategy) pada roll yang sama.
+    bot._reset_session_runtime()
+    bot.rule = rule
+    bot.sync_bet_pair()
+    bot.start_balance = coin_units(start_balance)
+    bot.current_balance = bot.start_balance
+    bot.api_balance = bot.start_balance
+    bot.estimated_balance = bot.start_balance
+    amounts: List[int] = []
+    for bet_index in range(horizon + 1):
+        bot.current_amount = bot._normalize_amount(bot.current_amount)
+        reason = bot.stop_reason()
+        if reason:
+            return amounts, bot.total_profit, reason
+        if bot.current_amount > bot.current_balance:
+            return amounts, bot.total_profit, STOP_REASONS[STOP_INSUFFICIENT]
+        if bet_index >= horizon:
+            return amounts, bot.total_profit, STOP_REASONS[STOP_HORIZON]
+
+        if bot.simple_mode_enabled:
+            bot._apply_simple_runtime_controls_before_bet()
+        bot.sync_bet_pair()
+        amounts.append(bot.current_amount)
+        result_value = Decimal(int(rolls[bet_index])).scaleb(-2)
+        if bot.rule == "under":
+            won = result_value < bot.bet_value
+        else:
+            won = result_value > bot.bet_value
+        profit = payout_profit(bot.current_amount, bot.multiplier) if won else -bot.current_amount
+        bot.total_profit += profit
+        bot.current_balance += profit
+        bot.risk.update(won, profit, bot.total_profit)
+        bot.bet_count += 1
+        if won:
+            bot.win_count += 1
+            bot.consecutive_wins += 1
+            bot.consecutive_losses = 0
+        else:
+            bot.loss_count += 1
+            bot.consecutive_losses += 1
+            bot.consecutive_wins = 0
+        try:
+            bot.apply_strategy("win" if won else "loss")
+        except ConfigError:
+            return amounts, bot.total_profit, STOP_REASONS[STOP_STRATEGY]
+    return amounts, bot.total_profit, STOP_REASONS[STOP_HORIZON]
+
+
+def verify_scenarios() -> List[Tuple[str, str, Dict[str, Any], Decimal]]:
+    scenarios: List[Tuple[str, str, Dict[str, Any], Decimal]] = []
+    variants = (
+        ("x1.98/8dp", {"bot": {"base_amount": 0.001, "multiplier": 1.98}}, Decimal("0.2")),
+        ("x3.3/4dp", {"bot": {"base_amount": 0.0013, "multiplier": 3.3}, "display": {"coin_decimal_places": 4, "amount_display_precision": 4,
+                                  "profit_display_precision": 4, "balance_display_precision": 4}},
+         Decimal("0.5")),
+        ("x1.5/stops", {"bot": {"base_amount": 0.00000037, "multiplier": 1.5, "target_profit": 0.000004,
+                                "stop_loss": 0.00002, "max_consecutive_losses": 9}}, Decimal("0.0001")),
+        ("switch-rule", {"bot": {"base_amount": 0.0007, "bet_value": 32.1, "sync_mode": "none", "multiplier": 3.0841},
+                         "strategy": {"switch_rule_on_win": "ON", "switch_rule_on_loss": "ON"}}, Decimal("0.3")),
+        ("x2/trailing", {"bot": {"base_amount": 0.00000051, "multiplier": 2, "trailing_drawdown_stop": 0.00003,
+                                 "trailing_drawdown_percent": 4.5}}, Decimal("0.0004")),
+    )
+    for label, override, balance in variants:
+        for preset in SUPPORTED_PRESETS + ("custom",):
+            cfg = deep_merge(default_config(), override)
+            cfg["api"]["token"] = "simulator"
+            cfg["strategy"]["preset"]["mining_v2_cooldown_trigger_losses"] = 3
+            cfg["strategy"]["preset"]["long_run_shield_after_losses"] = 3
+            validate_config(cfg)
+            scenarios.append((f"{preset:<15} {label}", preset, cfg, balance))
+    return scenarios
+
+
+def verify_scenario(cfg: Dict[str, Any], preset: str, balance: Decimal, rolls: "np.ndarray") -> Tuple[int, int]:
+    # Satu skenario verifikasi: (total bet vectorized, jumlah sesi yang beda dari jalur skalar DiceBot).
+    sessions, horizon = rolls.shape
+    sim = VectorSimulator(build_bot(cfg, preset), balance, horizon)
+    result = sim.run(sessions, rolls=rolls, record=True)
+    reference_bot = build_bot(cfg, preset)
+    mismatches = 0
+    for session in range(sessions):
+        amounts, total_profit, reason = scalar_reference(
+            reference_bot, balance, rolls[session], horizon, sim.rules[0]
+        )
+        trace = result.amount_trace[: len(amounts), session].tolist()
+        same = (
+            trace == amounts
+            and int(result.bets[session]) == len(amounts)
+            and int(result.total_profit[session]) == total_profit
+            and STOP_REASONS[result.stop_code[session]] == reason
+        )
+        if not same:
+            mismatches += 1
+    return result.total_bets(), mismatches
+
+
+def run_verify(sessions: int, horizon: int, seed: int) -> bool:
+    # Skenario yang sama juga dijalankan pytest: tests/test_simulator_equivalence.py.
+    rng = np.random.default_rng(seed)
+    all_ok = True
+    for label, preset, cfg, balance in verify_scenarios():
+        rolls = rng.integers(0, ROLL_OUTCOMES, size=(sessions, horizon))
+        total_bets, mismatches = verify_scenario(cfg, preset, balance, rolls)
+        status = "OK  " if mismatches == 0 else "FAIL"
+        print(f"[{status}] {label} sessions={sessions} bets={total_bets} mismatch={mismatches}")
+        all_ok = all_ok and mismatches == 0
+    return all_ok
+
+
+def print_report(result: SimulationResult, sim: VectorSimulator, label: str) -> None:
+    total_bets = result.total_bets()
+    speed = total_bets / result.elapsed if result.elapsed > 0 else 0.0
+    mean_profit = units_to_decimal(int(result.total_profit.mean()))
+    print("-" * 95)
+    print(f"PRESET {label} | sessions={result.sessions} horizon={sim.horizon} bets={total_bets} "
+          f"({speed:,.0f} bet/s)")
+    print(f"Bust probability      : {result.bust_probability() * 100:.3f}%")
+    print(f"Rata-rata profit      : {format_decimal(mean_profit, UNIT_PLACES)}")
+    for reason, share in result.stop_distribution().items():
+        print(f"  stop {share * 100:7.3f}% : {reason}")
+    drawdown = result.drawdown_percentiles()
+    print("Drawdown p50/p90/p99  : " + " / ".join(format_decimal(value, UNIT_PLACES) for value in drawdown.values()))
+    target = result.time_to_target()
+    if target:
+        print("Bet ke target p50/p90/p99: " + " / ".join(str(value) for value in target.values()))
+    else:
+        print("Bet ke target         : n/a")
+
+
+def print_exact(bot: DiceBot, sim: VectorSimulator) -> None:
+    # Pembanding eksak (rantai Markov) untuk preset step ladder; horizon sama dengan Monte Carlo di atas.
+    if type(bot.strategy) is not StepLadderStrategy:
+        return
+    try:
+        estimate = RuinSolver(bot, sim.start_balance, horizon=sim.horizon).solve(time_budget=60)
+    except ConfigError as exc:
+        print(f"Eksak (Markov)        : dilewati ({exc})")
+        return
+    if estimate.truncated:
+        print(f"Eksak (Markov)        : dilewati (lattice terlalu besar, eksak hanya {estimate.steps} bet)")
+        return
+    shares = " | ".join(f"{reason} {share * 100:.3f}%" for reason, share in estimate.probabilities.items())
+    print(f"Eksak (Markov)        : {shares} | jalan {estimate.running * 100:.3f}%")
+    print(
+        f"  E[bet] {estimate.expected_bets:,.1f} | {estimate.steps}/{estimate.horizon} bet | "
+        f"{estimate.nodes} node, {estimate.cells:,} sel | {estimate.elapsed:.2f}s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Monte Carlo vectorized untuk preset DiceBot.")
+    parser.add_argument("--config", default="config.json")
+    parser.add_argument("--preset", default="config", help="config | all | custom | nama preset")
+    parser.add_argument("--sessions", type=int, default=10000)
+    parser.add_argument("--bets", type=int, default=10000, help="Horizon bet per sesi (dibatasi bot.max_bets).")
+    parser.add_argument("--balance", default="1", help="Saldo awal tiap sesi.")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--verify", action="store_true", help="Cek kesetaraan dengan jalur skalar DiceBot.")
+    args = parser.parse_args()
+
+    try:
+        if args.verify:
+            ok = run_verify(sessions=min(args.sessions, 200), horizon=min(args.bets, 300), seed=args.seed or 7)
+            sys.exit(0 if ok else 1)
+
+        cfg = load_sim_config(args.config)
+        balance = to_decimal(args.balance, "--balance")
+        if args.preset == "all":
+            presets: Tuple[str | None, ...] = SUPPORTED_PRESETS + ("custom",)
+        elif args.preset == "config":
+            presets = (None,)
+        else:
+            presets = (args.preset,)
+        for preset in presets:
+            bot = build_bot(cfg, preset)
+            sim = VectorSimulator(bot, balance, args.bets)
+            result = sim.run(args.sessions, seed=args.seed)
+            print_report(result, sim, sim.preset)
+            print_exact(bot, sim)
+    except ConfigError as exc:
+        print(f"[CONFIG] {exc}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from main import (
+    ConfigError,
+    SUPPORTED_PRESETS,
+    default_config,
+    format_decimal,
+    to_decimal,
+    units_to_decimal,
+    validate_config,
+)
+from simulator import VectorSimulator, build_bot, load_sim_config
+
+# Sweep parameter preset (strategy.preset.*) lewat simulator.py, disebar ke semua core dengan ProcessPoolExecutor.
+# Hasil tiap titik di-cache di disk berdasarkan hash config + setting simulasi, jadi sweep ulang cukup hitung titik baru.
+# Jalankan: python sweep.py --preset mining_v2 --param mining_v2_loss_multiplier=1.02:1.06:0.01 \
+#           --param mining_v2_max_steps=4:8 --sessions 2000 --bets 5000 --balance 1
+
+# Naikkan kalau logika simulator/strategi berubah supaya cache lama tidak terpakai.
+CACHE_VERSION = 1
+SWEEP_KEYS = tuple(
+    key for key, value in default_config()["strategy"]["preset"].items()
+    if key not in {"name", "enabled"} and isinstance(value, (int, float))
+)
+
+
+def parse_number(text: str, key: str) -> int | float:
+    try:
+        value = Decimal(text.strip())
+    except ArithmeticError:
+        raise ConfigError(f"Nilai '{text}' untuk {key} bukan angka.")
+    if value == value.to_integral_value() and "." not in text:
+        return int(value)
+    return float(value)
+
+
+def parse_param(spec: str) -> Tuple[str, Dict[str, Any]]:
+    # key=a,b,c (daftar) | key=lo:hi (int, inklusif / rentang float untuk --random) | key=lo:hi:step
+    if "=" not in spec:
+        raise ConfigError(f"--param '{spec}' harus format key=nilai.")
+    key, values = (part.strip() for part in spec.split("=", 1))
+    if key not in SWEEP_KEYS:
+        raise ConfigError(f"Key '{key}' bukan parameter numerik strategy.preset.")
+    if ":" not in values:
+        return key, {"choices": [parse_number(value, key) for value in values.split(",") if value.strip()]}
+    bounds = [parse_number(value, key) for value in values.split(":")]
+    if len(bounds) not in {2, 3} or bounds[1] < bounds[0]:
+        raise ConfigError(f"Rentang {key} harus lo:hi atau lo:hi:step dengan lo <= hi.")
+    return key, {"low": bounds[0], "high": bounds[1], "step": bounds[2] if len(bounds) == 3 else None}
+
+
+def grid_values(key: str, space: Dict[str, Any]) -> List[int | float]:
+    if "choices" in space:
+        return space["choices"]
+    low, high, step = space["low"], space["high"], space["step"]
+    if step is None:
+        if not (isinstance(low, int) and isinstance(high, int)):
+            raise ConfigError(f"Rentang float {key} butuh step untuk mode grid (lo:hi:step).")
+        step = 1
+    if step <= 0:
+        raise ConfigError(f"Step {key} harus > 0.")
+    # Hitung pakai Decimal supaya 1.02 + 0.01 tidak jadi 1.0300000000000002.
+    low_d, high_d, step_d = Decimal(str(low)), Decimal(str(high)), Decimal(str(step))
+    values: List[int | float] = []
+    current = low_d
+    while current <= high_d:
+        values.append(int(current) if isinstance(low, int) and isinstance(step, int) else float(current))
+        current += step_d
+    return values
+
+
+def random_value(rng: random.Random, space: Dict[str, Any]) -> int | float:
+    if "choices" in space:
+        return rng.choice(space["choices"])
+    low, high = space["low"], space["high"]
+    if isinstance(low, int) and isinstance(high, int):
+        return rng.randint(low, high)
+    return round(rng.uniform(low, high), 4)
+
+
+def build_points(spaces: Dict[str, Dict[str, Any]], random_count: int, seed: int) -> List[Dict[str, Any]]:
+    keys = list(spaces)
+    if random_count > 0:
+        rng = random.Random(seed)
+        points: List[Dict[str, Any]] = []
+        seen = set()
+        # Titik duplikat tidak dihitung dua kali; batas percobaan mencegah loop kalau ruang parameternya kecil.
+        for _ in range(random_count * 20):
+            point = {key: random_value(rng, spaces[key]) for key in keys}
+            marker = tuple(point.values())
+            if marker not in seen:
+                seen.add(marker)
+                points.append(point)
+            if len(points) >= random_count:
+                break
+        return points
+    grids = [grid_values(key, spaces[key]) for key in keys]
+    return [dict(zip(keys, combo)) for combo in itertools.product(*grids)]
+
+
+def point_config(cfg: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
+    point_cfg = json.loads(json.dumps(cfg))
+    point_cfg["strategy"]["preset"].update(overrides)
+    return point_cfg
+
+
+def cache_key(cfg: Dict[str, Any], preset: str, settings: Dict[str, Any]) -> str:
+    # Hanya bagian config yang memengaruhi hasil simulasi yang ikut di-hash (bukan token, jurnal, dll).
+    payload = {
+        "version": CACHE_VERSION,
+        "preset": preset,
+        "bot": cfg["bot"],
+        "strategy": cfg["strategy"],
+        "simple": cfg.get("simple", {}),
+        "coin_decimal_places": cfg["display"].get("coin_decimal_places", 8),
+        "settings": settings,
+    }
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def evaluate_point(cfg: Dict[str, Any], preset: str, settings: Dict[str, Any]) -> Dict[str, Any]:
+    # Dijalankan di worker process. Seed sama untuk semua titik (common random numbers), jadi beda hasil
+    # antar titik datang dari parameter, bukan dari noise sampel.
+    try:
+        validate_config(cfg)
+        sim = VectorSimulator(build_bot(cfg, preset), Decimal(settings["balance"]), settings["bets"])
+        result = sim.run(settings["sessions"], seed=settings["seed"])
+    except ConfigError as exc:
+        return {"error": str(exc)}
+    drawdown = result.drawdown_percentiles((90,))[90]
+    return {
+        "bust": result.bust_probability(),
+        "wagered": int(result.wagered.mean()),
+        "profit": int(result.total_profit.mean()),
+        "bets": float(result.bets.mean()),
+        "drawdown_p90": str(drawdown),
+        "elapsed": result.elapsed,
+    }
+
+
+def pareto_ranks(rows: List[Dict[str, Any]]) -> None:
+    # Non-dominated sorting: rank 1 = frontier (tidak ada titik lain dengan bust <= dan wagered >=, salah satunya lebih baik).
+    remaining = list(rows)
+    rank = 0
+    while remaining:
+        rank += 1
+        front = [
+            row for row in remaining
+            if not any(
+                other["bust"] <= row["bust"] and other["wagered"] >= row["wagered"]
+                and (other["bust"] < row["bust"] or other["wagered"] > row["wagered"])
+                for other in remaining
+            )
+        ]
+        for row in front:
+            row["rank"] = rank
+        remaining = [row for row in remaining if "rank" not in row]
+
+
+def print_table(rows: List[Dict[str, Any]], keys: List[str], top: int, places: int) -> None:
+    header = " | ".join(f"{key:>{max(len(key), 8)}}" for key in keys)
+    print(f"{'RANK':>4} | {'BUST %':>8} | {'WAGERED/SESI':>16} | {'PROFIT/SESI':>14} | {'DD p90':>12} | {'BET':>8} | {header}")
+    for row in rows[:top]:
+        values = " | ".join(f"{row['params'][key]!s:>{max(len(key), 8)}}" for key in keys)
+        print(
+            f"{row['rank']:>4} | {row['bust'] * 100:>8.3f} | "
+            f"{format_decimal(units_to_decimal(row['wagered']), places):>16} | "
+            f"{format_decimal(units_to_decimal(row['profit']), places):>14} | "
+            f"{format_decimal(Decimal(row['drawdown_p90']), places):>12} | {row['bets']:>8.0f} | {values}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Sweep parameter preset DiceBot: bust risk vs volume wagered.")
+    parser.add_argument("--config", default="config.json")
+    parser.add_argument("--preset", required=True, help=f"Salah satu: {', '.join(SUPPORTED_PRESETS)}.")
+    parser.add_argument(
+        "--param", action="append", default=[],
+        help="key=a,b,c | key=lo:hi | key=lo:hi:step (boleh diulang, key dari strategy.preset).",
+    )
+    parser.add_argument("--random", type=int, default=0, help="Random search N titik (0 = grid penuh).")
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--bets", type=int, default=5000, help="Horizon bet per sesi (dibatasi bot.max_bets).")
+    parser.add_argument("--balance", default="1", help="Saldo awal tiap sesi.")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--cache-dir", default=".sweep_cache")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    try:
+        if args.preset not in SUPPORTED_PRESETS:
+            raise ConfigError(f"Preset '{args.preset}' tidak dikenal.")
+        if not args.param:
+            raise ConfigError("Isi minimal satu --param.")
+        spaces = dict(parse_param(spec) for spec in args.param)
+        points = build_points(spaces, args.random, args.seed)
+        cfg = load_sim_config(args.config)
+        balance = to_decimal(args.balance, "--balance")
+        if not balance.is_finite() or balance <= 0:
+            raise ConfigError("Saldo awal sweep harus > 0.")
+    except ConfigError as exc:
+        print(f"[CONFIG] {exc}")
+        sys.exit(1)
+
+    settings = {"sessions": args.sessions, "bets": args.bets, "balance": args.balance, "seed": args.seed}
+    cache_dir = Path(args.cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    rows: List[Dict[str, Any]] = []
+    pending: List[Tuple[Dict[str, Any], Dict[str, Any], Path]] = []
+    for overrides in points:
+        point_cfg = point_config(cfg, overrides)
+        cache_file = cache_dir / f"{cache_key(point_cfg, args.preset, settings)}.json"
+        if cache_file.exists():
+            try:
+                rows.append({**json.loads(cache_file.read_text(encoding="utf-8")), "params": overrides})
+                continue
+            except (OSError, ValueError):
+                pass
+        pending.append((overrides, point_cfg, cache_file))
+
+    print(
+        f"Preset {args.preset} | {len(points)} titik ({len(points) - len(pending)} dari cache) | "
+        f"sessions={args.sessions} bets={args.bets} balance={args.balance} | workers={args.workers}"
+    )
+    started = time.perf_counter()
+    if pending:
+        with ProcessPoolExecutor(max_workers=max(1, args.workers)) as executor:
+            futures = {
+                executor.submit(evaluate_point, point_cfg, args.preset, settings): (overrides, cache_file)
+                for overrides, point_cfg, cache_file in pending
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                overrides, cache_file = futures[future]
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    # Crash worker (bug, MemoryError, proses mati) hanya menggugurkan titik ini dan tidak di-cache.
+                    rows.append({"error": f"{type(exc).__name__}: {exc}", "params": overrides})
+                else:
+                    # Titik invalid (mis. max_steps negatif) juga di-cache supaya tidak dicoba ulang.
+                    tmp_file = cache_file.with_suffix(".tmp")
+                    tmp_file.write_text(json.dumps(result), encoding="utf-8")
+                    os.replace(tmp_file, cache_file)
+                    rows.append({**result, "params": overrides})
+                print(f"\r  {done}/{len(pending)} titik dihitung", end="", flush=True)
+        print(f"\r  {len(pending)} titik dihitung dalam {time.perf_counter() - started:.1f}s")
+
+    invalid = [row for row in rows if "error" in row]
+    rows = [row for row in rows if "error" not in row]
+    for row in invalid[:5]:
+        print(f"[SKIP] {row['params']}: {row['error']}")
+    if len(invalid) > 5:
+        print(f"[SKIP] ... {len(invalid) - 5} titik invalid lain")
+    if not rows:
+        print("Tidak ada titik valid.")
+        sys.exit(1)
+    pareto_ranks(rows)
+    rows.sort(key=lambda row: (row["rank"], row["bust"], -row["wagered"]))
+    frontier = sum(1 for row in rows if row["rank"] == 1)
+    print(f"Pareto frontier (bust rendah vs wagered tinggi): {frontier} titik | tampil {min(args.top, len(rows))}")
+    print_table(rows, list(spaces), args.top, int(cfg["display"].get("coin_decimal_places", 8)))
+
+
+if __name__ == "__main__":
+    main()
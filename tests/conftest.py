@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Script bot ada di root repo (bukan package), jadi root ditambahkan ke sys.path untuk import main/simulator.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
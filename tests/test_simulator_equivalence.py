@@ -0,0 +1,29 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from main import SUPPORTED_PRESETS  # noqa: E402
+from simulator import ROLL_OUTCOMES, verify_scenario, verify_scenarios  # noqa: E402
+
+SESSIONS = 200
+HORIZON = 300
+SCENARIOS = verify_scenarios()
+
+
+@pytest.mark.parametrize(
+    "index,preset,cfg,balance",
+    [(index, preset, cfg, balance) for index, (_, preset, cfg, balance) in enumerate(SCENARIOS)],
+    ids=[" ".join(label.split()) for label, _, _, _ in SCENARIOS],
+)
+def test_vector_simulator_matches_dicebot(index, preset, cfg, balance):
+    # VectorSimulator harus identik dengan jalur skalar DiceBot: amount tiap bet, profit, dan alasan stop.
+    rolls = np.random.default_rng(7 + index).integers(0, ROLL_OUTCOMES, size=(SESSIONS, HORIZON))
+    total_bets, mismatches = verify_scenario(cfg, preset, balance, rolls)
+    assert total_bets > 0
+    assert mismatches == 0
+
+
+def test_scenarios_cover_every_preset_and_trailing_drawdown():
+    presets = {preset for _, preset, _, _ in SCENARIOS}
+    assert presets == set(SUPPORTED_PRESETS) | {"custom"}
+    assert any(cfg["bot"]["trailing_drawdown_stop"] for _, _, cfg, _ in SCENARIOS)